@@ -3,6 +3,7 @@ import pytest
 import numpy as np
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt, QTimer
+import time
 from unittest.mock import MagicMock, patch
 from datetime import datetime
 
@@ -10,6 +11,7 @@ from ui.panels.batch_processing_panel import BatchProcessingPanel
 from ui.visualization.batch_comparison_view import BatchComparisonView
 from ui.data_manager import DataManager
 from ui.error_handling import ErrorHandler, ErrorInfo, ErrorSeverity, ErrorCategory
+from ui.workers.base_worker import BaseWorker
 
 @pytest.fixture
 def app():
@@ -244,5 +246,142 @@ def test_real_time_updates_integration(batch_panel, data_manager):
         avg_interval = sum(intervals) / len(intervals)
         assert abs(avg_interval - (1.0 / update_rate)) < 0.1
 
+def test_cached_batch_results_integration(batch_panel, data_manager):
+    """Test that a cached batch completes through the regular completion path."""
+    config = {
+        "dataset_paths": ["/test/data.h5"],
+        "batch_size": 32,
+        "epochs": 10,
+        "learning_rate": 0.001
+    }
+    cached = {"accuracy": 0.9, "loss": 0.1, "data": generate_test_data(100).tolist()}
+    data_manager.cache_batch_results(config, cached)
+    
+    completed_signal = MagicMock()
+    batch_panel.batch_completed.connect(completed_signal)
+    batch_panel.comparison_view.set_data = MagicMock()
+    batch_panel.monitor_panel = MagicMock()
+    batch_panel.results_panel = MagicMock()
+    
+    with patch.object(batch_panel.config_panel, "get_configuration", return_value=config):
+        batch_panel._start_batch()
+        
+    # Buttons change as for a real run until the cached task is flushed
+    assert not batch_panel.start_button.isEnabled()
+    assert batch_panel.stop_button.isEnabled()
+    assert not completed_signal.called
+    task_id = batch_panel.monitor_panel.add_task.call_args[0][0]
+    batch_panel.monitor_panel.update_task_progress.assert_called_once_with(
+        task_id, 100, "Cached", {"accuracy": 0.9, "loss": 0.1}
+    )
+    
+    batch_panel._flush_completions()
+    
+    # Verify completion
+    assert completed_signal.call_count == 1
+    assert batch_panel.start_button.isEnabled()
+    assert not batch_panel.stop_button.isEnabled()
+    batch_panel.monitor_panel.remove_tasks.assert_called_once_with([task_id])
+    batch_panel.comparison_view.set_data.assert_called_once()
+    results = data_manager.get_batch_results(batch_panel.current_batch['id'])
+    assert results["accuracy"] == 0.9
+    batch_panel.results_panel.update_results.assert_called_with(results)
+
+def test_batch_results_cached_on_completion(batch_panel, data_manager):
+    """Test that batch results are cached once the last worker has finished."""
+    config = {
+        "dataset_paths": ["/test/data.h5"],
+        "batch_size": 32,
+        "epochs": 10,
+        "learning_rate": 0.001
+    }
+    with patch.object(batch_panel.config_panel, "get_configuration", return_value=config):
+        batch_panel._start_batch()
+    batch_panel.monitor_panel = MagicMock()
+    batch_panel.results_panel = MagicMock()
+    worker = MagicMock()
+    worker.is_active.return_value = True
+    batch_panel.workers.append(worker)
+    
+    # Results flushed while a worker is still running are not cached
+    batch_panel._on_task_completed("train", {"loss": 0.1})
+    batch_panel._flush_completions()
+    assert data_manager.get_cached_batch_results(config) is None
+    
+    worker.is_active.return_value = False
+    batch_panel._on_task_completed("eval", {"accuracy": 0.95})
+    batch_panel._flush_completions()
+    assert data_manager.get_cached_batch_results(config) == {"loss": 0.1, "accuracy": 0.95}
+
+def test_batch_finishes_before_pooled_thread_returns(app, batch_panel, data_manager):
+    """Test that a batch finishes when its last completion is flushed before the pooled run returns."""
+    config = {
+        "dataset_paths": ["/test/data.h5"],
+        "batch_size": 32,
+        "epochs": 10,
+        "learning_rate": 0.001
+    }
+    with patch.object(batch_panel.config_panel, "get_configuration", return_value=config):
+        batch_panel._start_batch()
+    batch_panel.monitor_panel = MagicMock()
+    batch_panel.results_panel = MagicMock()
+    
+    class EvalWorker(BaseWorker):
+        def _execute(self):
+            return {"accuracy": 0.95}
+            
+    worker = EvalWorker("evaluation")
+    worker.completed.connect(batch_panel._on_task_completed)
+    # Keeps the pooled thread inside run() well after completed was emitted
+    worker.completed.connect(lambda *_: time.sleep(0.5), Qt.ConnectionType.DirectConnection)
+    batch_panel.workers.append(worker)
+    worker.start_in_pool(batch_panel._pool)
+    
+    deadline = time.monotonic() + 5
+    while not batch_panel._completion_queue and time.monotonic() < deadline:
+        app.processEvents()
+    batch_panel._flush_completions()
+    
+    assert data_manager.get_cached_batch_results(config) == {"accuracy": 0.95}
+    batch_panel._pool.waitForDone()
+
+def test_batch_workers_polled_and_completed(app, batch_panel, data_manager):
+    """Test that workers created for a batch report progress by polling and complete it."""
+    config = {
+        "dataset_paths": ["/test/data.h5"],
+        "batch_size": 32,
+        "epochs": 10,
+        "learning_rate": 0.001
+    }
+    
+    class StepWorker(BaseWorker):
+        def _execute(self):
+            self.report_progress(40, "Training")
+            time.sleep(0.2)
+            return {f"{self.operation_type}_score": 1.0}
+            
+    progress = []
+    batch_panel.progress_updated.connect(lambda name, value: progress.append((name, value)))
+    batch_panel.monitor_panel = MagicMock()
+    batch_panel.results_panel = MagicMock()
+    with patch.object(batch_panel.config_panel, "get_configuration", return_value=config), \
+         patch.object(batch_panel, "_setup_data_worker", create=True, side_effect=lambda _: StepWorker("data")), \
+         patch.object(batch_panel, "_setup_training_worker", create=True, side_effect=lambda _: StepWorker("training")), \
+         patch.object(batch_panel, "_setup_evaluation_worker", create=True, side_effect=lambda _: StepWorker("evaluation")):
+        batch_panel._start_batch()
+        
+    assert len(batch_panel.workers) == 3
+    assert batch_panel._worker_poll_timer.isActive()
+    
+    deadline = time.monotonic() + 5
+    while data_manager.get_cached_batch_results(config) is None and time.monotonic() < deadline:
+        app.processEvents()
+        
+    assert ("Training", 40) in progress
+    assert data_manager.get_cached_batch_results(config) == {
+        "data_score": 1.0, "training_score": 1.0, "evaluation_score": 1.0
+    }
+    batch_panel._pool.waitForDone()
+
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
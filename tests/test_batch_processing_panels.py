@@ -7,9 +7,10 @@ import numpy as np
 
 from ui.panels.batch_processing_panel import BatchProcessingPanel
 from ui.panels.batch_configuration_panel import BatchConfigurationPanel
-from ui.panels.batch_monitor_panel import BatchMonitorPanel, TaskProgressWidget
+from ui.panels.batch_monitor_panel import BatchMonitorPanel, TaskModel, MetricsModel
 from ui.panels.result_comparison_panel import ResultComparisonPanel
 from ui.error_handling import ErrorHandler, ErrorInfo, ErrorSeverity, ErrorCategory
+from ui.workers.base_worker import BaseWorker
 
 @pytest.fixture
 def app():
@@ -72,7 +73,7 @@ def test_monitor_panel_task_tracking(monitor_panel):
     # Add task
     task_id = "task1"
     monitor_panel.add_task(task_id, "Test Task")
-    assert task_id in monitor_panel.task_widgets
+    assert monitor_panel.task_model.has_task(task_id)
     
     # Update progress
     monitor_panel.update_task_progress(
@@ -81,9 +82,11 @@ def test_monitor_panel_task_tracking(monitor_panel):
         "Processing", 
         {"memory_usage": 1024 * 1024}  # 1MB
     )
-    widget = monitor_panel.task_widgets[task_id]
-    assert widget.progress_bar.value() == 50
-    assert widget.status_label.text() == "Processing"
+    monitor_panel._flush_ui()
+    task = monitor_panel.task_model.task(task_id)
+    assert task.percent == 50
+    assert task.status == "Processing"
+    assert task.memory_mb == 1.0
     
     # Test error handling
     error_info = ErrorInfo(
@@ -92,11 +95,105 @@ def test_monitor_panel_task_tracking(monitor_panel):
         category=ErrorCategory.PROCESSING
     )
     monitor_panel.set_task_error(task_id, error_info)
-    assert widget.status_label.text() == "Error"
+    assert task.status == "Error"
     
     # Remove task
     monitor_panel.remove_task(task_id)
-    assert task_id not in monitor_panel.task_widgets
+    assert not monitor_panel.task_model.has_task(task_id)
+
+def test_metrics_model_average(app):
+    """Test metric averages cover every sample."""
+    model = MetricsModel()
+    for value in (0.2, 0.4, 0.9):
+        model.update_metrics({"loss": value})
+        model.update_text_metrics({"stage": "train"})
+    model.flush()
+    
+    assert model.rowCount() == 2
+    assert model.data(model.index(0, 1)) == "0.9000"
+    assert model.data(model.index(0, 2)) == "0.5000"
+    assert model.data(model.index(1, 1)) == "train"
+    assert model.data(model.index(1, 2)) is None
+
+def test_metrics_model_mixed_metrics(app):
+    """Test non-numeric producer metrics are shown as text, not averaged."""
+    model = MetricsModel()
+    numeric, text = MetricsModel.split_metrics(
+        {"loss": 0.5, "epoch": 3, "stage": "train", "done": False, "lr": None}
+    )
+    assert numeric == {"loss": 0.5, "epoch": 3.0}
+    assert text == {"stage": "train", "done": "False"}
+    
+    model.update_metrics(numeric)
+    model.update_text_metrics(text)
+    model.flush()
+    
+    assert model.rowCount() == 4
+    assert model.data(model.index(0, 2)) == "0.5000"
+    assert model.data(model.index(2, 1)) == "train"
+    assert model.data(model.index(2, 2)) is None
+
+def test_worker_formatted_metrics(app):
+    """Test workers send metrics formatted with running averages."""
+    class MetricsWorker(BaseWorker):
+        def _execute(self):
+            self.report_metrics({"loss": 0.2, "acc": 0.5})
+            self.report_metrics({"loss": 0.4})
+            return {}
+            
+    sent = []
+    worker = MetricsWorker("training")
+    worker.metrics_ready.connect(lambda *args: sent.append(args))
+    worker.run()
+    assert sent == [
+        (["loss", "acc"], ["0.2000", "0.5000"], ["0.2000", "0.5000"]),
+        (["loss"], ["0.4000"], ["0.3000"])
+    ]
+    
+    model = MetricsModel()
+    for names, cur_text, avg_text in sent:
+        model.set_formatted_metrics(names, cur_text, avg_text)
+    model.flush()
+    assert model.data(model.index(0, 1)) == "0.4000"
+    assert model.data(model.index(0, 2)) == "0.3000"
+    assert model.data(model.index(1, 2)) == "0.5000"
+
+def test_metrics_model_array_update(app):
+    """Test array updates share averages with dict updates."""
+    model = MetricsModel()
+    model.update_metrics({"loss": 0.2})
+    model.update_metrics_array(["acc", "loss"], np.array([0.5, 0.4]))
+    model.flush()
+    
+    assert model.rowCount() == 2
+    assert model.data(model.index(0, 1)) == "0.4000"
+    assert model.data(model.index(0, 2)) == "0.3000"
+    assert model.data(model.index(1, 2)) == "0.5000"
+
+def test_task_model_remove_keeps_rows(app):
+    """Test removing a task keeps the remaining rows addressable."""
+    model = TaskModel()
+    assert model.add_tasks([("a", "A"), ("b", "B"), ("a", "A")]) == 2
+    assert model.add_task("c", "C")
+    assert not model.add_task("b", "B")
+    model.remove_task("a")
+    
+    model.update_task("c", 30, "Processing", {})
+    assert model.rowCount() == 2
+    assert model.data(model.index(1)) == "C — Processing"
+    assert model.task("b").percent == 0
+
+def test_task_model_remove_tasks(app):
+    """Test bulk removal keeps the remaining rows addressable."""
+    model = TaskModel()
+    model.add_tasks([(task_id, task_id.upper()) for task_id in "abcdef"])
+    assert model.remove_tasks(["b", "c", "e", "x"]) == 3
+    
+    assert model.rowCount() == 3
+    assert [model.task(task_id).name for task_id in "adf"] == ["A", "D", "F"]
+    model.update_task("f", 40, "Processing", {})
+    assert model.data(model.index(2)) == "F — Processing"
+    assert not model.has_task("c")
 
 def test_results_panel_updates(results_panel):
     """Test results visualization and metrics updates."""
@@ -160,7 +257,8 @@ def test_batch_processing_workflow(batch_panel, error_handler):
         "loss": 0.15
     }
     batch_panel._on_task_completed(task_id, metrics)
-    assert task_id not in batch_panel.monitor_panel.task_widgets
+    batch_panel._flush_completions()
+    assert not batch_panel.monitor_panel.task_model.has_task(task_id)
     
     # Stop batch processing
     batch_panel._stop_batch()
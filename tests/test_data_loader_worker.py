@@ -0,0 +1,151 @@
+import pytest
+import numpy as np
+import h5py
+
+from ui.workers.data_loader_worker import (
+    LoadCache, split_hdf5_file, augment_signal, load_signal_file,
+    SPLIT_NAMES, MAX_SHIFT_FRACTION, NOISE_STD_FRACTION
+)
+
+@pytest.fixture
+def labelled_file(tmp_path):
+    """HDF5 file whose first data column equals each row's label."""
+    path = tmp_path / "signals.h5"
+    n_samples = 100
+    labels = np.arange(n_samples)
+    data = np.column_stack([labels, labels * 2.0, labels * 3.0]).astype(np.float64)
+    with h5py.File(path, 'w') as f:
+        f.create_dataset('data', data=data)
+        f.create_dataset('labels', data=labels)
+    return path, n_samples
+
+def test_split_keeps_labels_aligned(labelled_file, tmp_path):
+    path, n_samples = labelled_file
+    output_path = tmp_path / "signals_split.h5"
+
+    # Small chunks so the permutation crosses chunk boundaries
+    counts = split_hdf5_file(str(path), str(output_path), (0.6, 0.25), seed=0, chunk_size=7)
+    assert counts == (60, 25, 15)
+
+    seen = []
+    with h5py.File(output_path, 'r') as f:
+        for name, count in zip(SPLIT_NAMES, counts):
+            data = f[name]['data'][()]
+            labels = f[name]['labels'][()]
+            assert data.shape == (count, 3)
+            assert labels.shape == (count,)
+            np.testing.assert_array_equal(data[:, 0], labels)
+            np.testing.assert_array_equal(data[:, 2], labels * 3.0)
+            seen.append(labels)
+
+    # Every sample ends up in exactly one split
+    np.testing.assert_array_equal(np.sort(np.concatenate(seen)), np.arange(n_samples))
+
+def test_split_with_empty_sets(labelled_file, tmp_path):
+    path, n_samples = labelled_file
+    output_path = tmp_path / "signals_split.h5"
+
+    counts = split_hdf5_file(str(path), str(output_path), (1.0, 0.0), seed=1)
+    assert counts == (n_samples, 0, 0)
+
+    with h5py.File(output_path, 'r') as f:
+        assert f['train']['data'].shape == (n_samples, 3)
+        assert f['test']['data'].shape == (0, 3)
+        assert f['val']['labels'].shape == (0,)
+
+def test_split_is_reproducible_with_seed(labelled_file, tmp_path):
+    path, _ = labelled_file
+    first = tmp_path / "first.h5"
+    second = tmp_path / "second.h5"
+    split_hdf5_file(str(path), str(first), (0.5, 0.3), seed=42)
+    split_hdf5_file(str(path), str(second), (0.5, 0.3), seed=42)
+
+    with h5py.File(first, 'r') as a, h5py.File(second, 'r') as b:
+        for name in SPLIT_NAMES:
+            np.testing.assert_array_equal(a[name]['labels'][()], b[name]['labels'][()])
+
+def test_load_cache_evicts_on_entry_limit():
+    cache = LoadCache(max_entries=2, max_bytes=1024)
+    for i in range(3):
+        cache.put((f"file{i}", 0.0), np.zeros(4), False, {})
+
+    assert cache.get(("file0", 0.0)) is None
+    assert cache.get(("file1", 0.0)) is not None
+    assert cache.get(("file2", 0.0)) is not None
+
+    # A get makes file1 the most recently used, so file2 goes next
+    cache.get(("file1", 0.0))
+    cache.put(("file3", 0.0), np.zeros(4), False, {})
+    assert cache.get(("file2", 0.0)) is None
+    assert cache.get(("file1", 0.0)) is not None
+
+def test_load_cache_evicts_on_byte_budget():
+    cache = LoadCache(max_entries=10, max_bytes=100)
+    cache.put(("a", 0.0), np.zeros(6), False, {})  # 48 bytes
+    cache.put(("b", 0.0), np.zeros(6), False, {})  # 96 bytes in total
+    assert cache.nbytes == 96
+
+    cache.put(("c", 0.0), np.zeros(6), False, {})
+    assert cache.get(("a", 0.0)) is None
+    assert cache.nbytes == 96
+
+    # Arrays larger than the whole budget are not cached
+    cache.put(("big", 0.0), np.zeros(20), False, {})
+    assert cache.get(("big", 0.0)) is None
+    assert cache.nbytes == 96
+
+def test_load_cache_replaces_entry_and_shares_read_only_arrays():
+    cache = LoadCache(max_entries=2, max_bytes=1024)
+    data = np.zeros(4)
+    cache.put(("a", 0.0), data, True, {"data": "Dataset"})
+    cache.put(("a", 0.0), np.zeros(8), False, {})
+    assert cache.nbytes == 64
+
+    assert not data.flags.writeable
+    cached, used_cache, tree = cache.get(("a", 0.0))
+    assert cached.shape == (8,)
+    assert not used_cache
+
+    cache.clear()
+    assert cache.get(("a", 0.0)) is None
+    assert cache.nbytes == 0
+
+def test_csv_files_are_transcoded_once(tmp_path):
+    csv_path = tmp_path / "signal.csv"
+    csv_path.write_text("a,b\n1,2\n3,4\n5,6\n")
+
+    data, used_cache = load_signal_file(str(csv_path))
+    assert not used_cache
+    assert (tmp_path / "signal.csv.h5").exists()
+
+    cached, used_cache = load_signal_file(str(csv_path))
+    assert used_cache
+    np.testing.assert_array_equal(cached, data)
+
+def test_augment_shift_matches_roll():
+    data = np.arange(200, dtype=np.float64).reshape(100, 2)
+    out = augment_signal(data, add_noise=False, time_shift=True, rng=np.random.default_rng(3))
+
+    # Draw the same shift as augment_signal
+    max_shift = int(len(data) * MAX_SHIFT_FRACTION)
+    shift = int(np.random.default_rng(3).integers(-max_shift, max_shift + 1)) % len(data)
+    assert shift
+
+    assert out.dtype == np.float32
+    np.testing.assert_array_equal(out, np.roll(data, shift, axis=0).astype(np.float32))
+
+def test_augment_without_changes_is_float32_copy():
+    data = np.random.default_rng(0).standard_normal((50, 3))
+    out = augment_signal(data, add_noise=False, time_shift=False)
+
+    assert out.dtype == np.float32
+    assert not np.shares_memory(out, data)
+    np.testing.assert_array_equal(out, data.astype(np.float32))
+
+def test_augment_noise_scales_with_channel_std():
+    data = np.random.default_rng(0).standard_normal((10000, 2)) * np.array([1.0, 10.0])
+    out = augment_signal(data, add_noise=True, time_shift=False, rng=np.random.default_rng(1))
+
+    assert out.dtype == np.float32
+    noise_std = (out - data.astype(np.float32)).std(axis=0)
+    np.testing.assert_allclose(noise_std, data.std(axis=0) * NOISE_STD_FRACTION, rtol=0.1)
@@ -74,6 +74,35 @@ class TestErrorHandler(unittest.TestCase):
         ml_errors = self.error_handler.get_error_state(ErrorCategory.ML_TRAINING)
         self.assertEqual(len(ml_errors), 0)
 
+    def test_error_state_bounded(self):
+        """Test per-category error history keeps only the newest entries"""
+        handler = ErrorHandler(max_errors_per_category=3)
+        for i in range(5):
+            handler.handle_error(DataLoadingError(f"Error {i}"), ErrorSeverity.INFO,
+                                 ErrorCategory.DATA_LOADING)
+            
+        errors = handler.get_error_state(ErrorCategory.DATA_LOADING)
+        self.assertEqual([e.message for e in errors], ["Error 2", "Error 3", "Error 4"])
+        self.assertEqual(len(handler.get_error_state()), 3)
+
+    def test_error_state_view(self):
+        """Test errors of all categories are read through a view of the history"""
+        handler = ErrorHandler()
+        handler.handle_error(MLTrainingError("Error 1"), ErrorSeverity.ERROR, ErrorCategory.ML_TRAINING)
+        handler.handle_error(DataLoadingError("Error 2"), ErrorSeverity.ERROR, ErrorCategory.DATA_LOADING)
+        
+        all_errors = handler.get_error_state()
+        self.assertEqual([e.message for e in all_errors], ["Error 1", "Error 2"])
+        self.assertEqual(all_errors[1].message, "Error 2")
+        self.assertEqual(all_errors[-2].message, "Error 1")
+        with self.assertRaises(IndexError):
+            all_errors[2]
+            
+        # The view follows errors handled after it was returned
+        handler.handle_error(MLTrainingError("Error 3"), ErrorSeverity.ERROR, ErrorCategory.ML_TRAINING)
+        self.assertEqual(len(all_errors), 3)
+        self.assertEqual(all_errors[1].message, "Error 3")
+
     def test_progress_tracking(self):
         """Test progress update functionality"""
         progress_callback = Mock()
@@ -112,6 +141,15 @@ class TestErrorHandler(unittest.TestCase):
         self.assertIn("Evaluation Error:", formatted_msg)
         self.assertIn("accuracy", formatted_msg)
 
+    def test_lazy_log_formatting(self):
+        """Test ML error messages are not formatted for disabled log levels"""
+        error = MLTrainingError("Training failed", model_state={'epoch': 1})
+        with patch.object(self.error_handler, 'format_ml_error') as format_mock:
+            self.error_handler.logger.setLevel(logging.ERROR)
+            self.error_handler.handle_error(error, ErrorSeverity.WARNING, ErrorCategory.ML_TRAINING)
+            format_mock.assert_not_called()
+        self.error_handler.logger.setLevel(logging.INFO)
+
     def test_error_suggestions(self):
         """Test error-specific suggestions"""
         # Test ML training suggestions
@@ -126,6 +164,21 @@ class TestErrorHandler(unittest.TestCase):
         self.assertTrue(len(suggestions) > 0)
         self.assertTrue(any("file format" in s for s in suggestions))
 
+    def test_detailed_text_cached(self):
+        """Test dialog detail text is assembled once per ErrorInfo"""
+        error_info = ErrorInfo(
+            message="Test error",
+            severity=ErrorSeverity.ERROR,
+            category=ErrorCategory.PROCESSING,
+            details="Test details",
+            suggestions=["Try this"]
+        )
+        
+        text = self.error_handler._build_detailed_text(error_info)
+        self.assertIn("Details: Test details", text)
+        self.assertIn("• Try this", text)
+        self.assertIs(self.error_handler._build_detailed_text(error_info), text)
+
     @patch('PyQt6.QtWidgets.QMessageBox')
     def test_error_dialog(self, mock_dialog):
         """Test error dialog display"""
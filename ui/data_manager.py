@@ -1,5 +1,7 @@
 import os
 import json
+import time
+import hashlib
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional, Callable
@@ -49,6 +51,8 @@ class DataManager(QObject):
     operation_completed = pyqtSignal(str, str)  # operation_id, status
     operation_failed = pyqtSignal(str, str)  # operation_id, error_message
     
+    BATCH_CACHE_TTL = 7 * 24 * 3600  # Seconds a cached batch result stays valid
+    
     def __init__(self, cache_dir: str = "cache"):
         super().__init__()
         self.cache_dir = cache_dir
@@ -223,6 +227,54 @@ class DataManager(QObject):
             
         return "_".join(key_parts)
         
+    def get_cached_batch_results(self, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Retrieve results of an earlier batch run with the same configuration.
+        
+        Args:
+            config: Batch processing configuration
+            
+        Returns:
+            Cached results if available and younger than BATCH_CACHE_TTL, None otherwise
+        """
+        cache_file = self._batch_cache_file(config)
+        try:
+            if time.time() - os.path.getmtime(cache_file) > self.BATCH_CACHE_TTL:
+                return None
+            with open(cache_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._notify_callbacks('error', f"Cache read error: {str(e)}")
+            return None
+            
+    def cache_batch_results(self, config: Dict[str, Any], results: Dict[str, Any]):
+        """Persist batch results for reuse by runs with the same configuration.
+        
+        Args:
+            config: Batch processing configuration
+            results: Final batch results
+        """
+        try:
+            with open(self._batch_cache_file(config), 'w') as f:
+                json.dump(self._make_serializable(results), f)
+        except Exception as e:
+            self._notify_callbacks('error', f"Cache write error: {str(e)}")
+            
+    def _batch_cache_file(self, config: Dict[str, Any]) -> str:
+        """Get the cache file for a batch configuration.
+        
+        The key also covers the modification times of the dataset files, so
+        results are not reused after the data changes.
+        """
+        data_mtimes = [
+            os.path.getmtime(path) if os.path.exists(path) else None
+            for path in config.get('dataset_paths', ())
+        ]
+        key_source = json.dumps([config, data_mtimes], sort_keys=True, default=str)
+        key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"batchresults_{key}.json")
+        
     def _make_serializable(self, obj: Any) -> Any:
         """Convert object to JSON serializable format."""
         if isinstance(obj, np.ndarray):
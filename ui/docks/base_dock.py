@@ -21,6 +21,34 @@ class BaseDock(QDockWidget):
         self.main_layout.setSpacing(4)
         
         self.setWidget(self.main_widget)
+        self._content_built = False
+        
+    def _init_content(self, lazy: bool = False):
+        """Build the dock's content now, or the first time the dock is shown if lazy."""
+        if lazy:
+            self.visibilityChanged.connect(self._on_first_show)
+        else:
+            self.build_content()
+            
+    def _on_first_show(self, visible: bool):
+        """Build the content of a lazy dock when it first becomes visible."""
+        if visible:
+            self.visibilityChanged.disconnect(self._on_first_show)
+            self.build_content()
+            
+    def build_content(self):
+        """Build the dock's content if it has not been built yet.
+        
+        Public methods that touch the content call this first, so a lazy
+        dock can be used before it is shown.
+        """
+        if self._content_built:
+            return
+        self._content_built = True
+        self._build_content()
+        
+    def _build_content(self):
+        """Build the dock's widgets; overridden by subclasses."""
         
     def add_widget(self, widget: QWidget):
         """Add a widget to the dock's layout."""
@@ -15,11 +15,15 @@ class BatchProcessingDock(BaseDock):
     
     state_changed = pyqtSignal(str)  # Emits current state (config/monitor/process)
     
-    def __init__(self, title="Batch Processing", parent=None):
+    def __init__(self, title="Batch Processing", parent=None, lazy=False):
         super().__init__(title, parent)
         self.error_handler = ErrorHandler()
         self.data_manager = DataManager()
         self._current_state = "config"  # Default state
+        self._init_content(lazy)
+        
+    def _build_content(self):
+        """Build the panels and connect their signals."""
         self._init_ui()
         self._connect_signals()
         
@@ -82,24 +86,28 @@ class BatchProcessingDock(BaseDock):
         
     def show_config(self):
         """Show batch configuration panel."""
+        self.build_content()
         self.stack.setCurrentWidget(self.config_panel)
         self._current_state = "config"
         self.state_changed.emit(self._current_state)
         
     def show_monitor(self):
         """Show batch monitoring panel."""
+        self.build_content()
         self.stack.setCurrentWidget(self.monitor_panel)
         self._current_state = "monitor"
         self.state_changed.emit(self._current_state)
         
     def show_processing(self):
         """Show batch processing panel."""
+        self.build_content()
         self.stack.setCurrentWidget(self.process_panel)
         self._current_state = "process"
         self.state_changed.emit(self._current_state)
         
     def save_state(self):
         """Save current dock state."""
+        self.build_content()
         state = {
             "current_panel": self.stack.currentIndex(),
             "current_state": self._current_state,
@@ -148,6 +156,7 @@ class BatchProcessingDock(BaseDock):
         if not state:
             return
             
+        self.build_content()
         self.stack.setCurrentIndex(state.get("current_panel", 0))
         self._current_state = state.get("current_state", "config")
         self.config_panel.restore_state(state.get("config_state"))
@@ -109,8 +109,12 @@ class ConsoleWidget(QPlainTextEdit):
 class ConsoleDock(BaseDock):
     """Dockable panel for displaying error console."""
     
-    def __init__(self, title="Error Console", parent=None):
+    def __init__(self, title="Error Console", parent=None, lazy=False):
         super().__init__(title, parent)
+        self._init_content(lazy)
+        
+    def _build_content(self):
+        """Build the dock's widgets."""
         self._init_ui()
         
     def _init_ui(self):
@@ -148,11 +152,13 @@ class ConsoleDock(BaseDock):
         
     def write_message(self, message: str):
         """Write a regular message to the console."""
+        self.build_content()
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.console.append_message(f"[{timestamp}] {message}")
         
     def write_error(self, error: Exception):
         """Write an error with stack trace to the console."""
+        self.build_content()
         timestamp = datetime.now().strftime("%H:%M:%S")
         
         # Write error message
@@ -169,11 +175,13 @@ class ConsoleDock(BaseDock):
             
     def write_warning(self, message: str):
         """Write a warning message to the console."""
+        self.build_content()
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.console.append_message(f"[{timestamp}] Warning: {message}")
         
     def clear_console(self):
         """Clear the console."""
+        self.build_content()
         self.console.clear()
         self.write_message("Console cleared")
         
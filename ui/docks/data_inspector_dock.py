@@ -112,8 +112,12 @@ class DataTreeWidget(QTreeWidget):
 class DataInspectorDock(BaseDock):
     """Dockable panel for inspecting data properties."""
     
-    def __init__(self, title="Data Inspector", parent=None):
+    def __init__(self, title="Data Inspector", parent=None, lazy=False):
         super().__init__(title, parent)
+        self._init_content(lazy)
+        
+    def _build_content(self):
+        """Build the dock's widgets."""
         self._init_ui()
         
     def _init_ui(self):
@@ -149,6 +153,7 @@ class DataInspectorDock(BaseDock):
         
     def update_signal_data(self, signal: np.ndarray, sampling_rate: float):
         """Update inspector with signal data."""
+        self.build_content()
         if signal is not None:
             self.data_tree.update_signal_info(signal, sampling_rate)
             self.status_label.setText(f"Inspecting signal data")
@@ -157,6 +162,7 @@ class DataInspectorDock(BaseDock):
             
     def update_processing_info(self, info: dict):
         """Update inspector with processing information."""
+        self.build_content()
         if info:
             self.data_tree.update_processing_info(info)
             self.status_label.setText(f"Inspecting processing results")
@@ -165,6 +171,7 @@ class DataInspectorDock(BaseDock):
             
     def clear(self):
         """Clear all displayed data."""
+        self.build_content()
         self.data_tree.clear()
         self.status_label.setText("No data selected")
         
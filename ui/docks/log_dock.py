@@ -98,8 +98,12 @@ class LogWidget(QTextEdit):
 class LogDock(BaseDock):
     """Dockable panel for displaying log messages."""
     
-    def __init__(self, title="Processing Log", parent=None):
+    def __init__(self, title="Processing Log", parent=None, lazy=False):
         super().__init__(title, parent)
+        self._init_content(lazy)
+        
+    def _build_content(self):
+        """Build the dock's widgets."""
         self._init_ui()
         
     def _init_ui(self):
@@ -157,12 +161,14 @@ class LogDock(BaseDock):
         
     def _log_message(self, message: str, level: LogLevel):
         """Log a message if its level is sufficient."""
+        self.build_content()
         current_level = LogLevel[self.level_combo.currentText()]
         if level.value >= current_level.value:
             self.log_widget.append_message(message, level)
             
     def clear_logs(self):
         """Clear all log messages."""
+        self.build_content()
         self.log_widget.clear()
         self.log_info("Log cleared")
         
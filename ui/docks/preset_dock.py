@@ -88,8 +88,12 @@ class PresetDock(BaseDock):
     
     preset_selected = pyqtSignal(dict)  # Forward preset selection
     
-    def __init__(self, title="Preset Library", parent=None):
+    def __init__(self, title="Preset Library", parent=None, lazy=False):
         super().__init__(title, parent)
+        self._init_content(lazy)
+        
+    def _build_content(self):
+        """Build the dock's widgets and default presets."""
         self._init_ui()
         self._populate_default_presets()
         
@@ -97,10 +97,14 @@ class ProgressDock(BaseDock):
     
     operation_cancelled = pyqtSignal(str)  # operation_id
     
-    def __init__(self, title="Progress Tracker", parent=None):
+    def __init__(self, title="Progress Tracker", parent=None, lazy=False):
         super().__init__(title, parent)
-        self._init_ui()
         self.operations = {}  # operation_id -> ProgressItem
+        self._init_content(lazy)
+        
+    def _build_content(self):
+        """Build the dock's widgets."""
+        self._init_ui()
         
     def _init_ui(self):
         """Initialize the UI components."""
@@ -138,6 +142,7 @@ class ProgressDock(BaseDock):
         
     def add_operation(self, operation_id: str, description: str) -> None:
         """Add a new operation to track."""
+        self.build_content()
         # Create progress item
         item = ProgressItem(operation_id, description)
         
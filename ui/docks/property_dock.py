@@ -82,8 +82,12 @@ class PropertyDock(BaseDock):
     
     property_changed = pyqtSignal(str, str, object)  # (context, property_name, new_value)
     
-    def __init__(self, title="Properties", parent=None):
+    def __init__(self, title="Properties", parent=None, lazy=False):
         super().__init__(title, parent)
+        self._init_content(lazy)
+        
+    def _build_content(self):
+        """Build the dock's widgets."""
         self._init_ui()
         
     def _init_ui(self):
@@ -132,28 +136,33 @@ class PropertyDock(BaseDock):
         
     def show_signal_properties(self, signal_type: str = None):
         """Show signal generation properties."""
+        self.build_content()
         if signal_type:
             self.signal_properties.update_for_signal_type(signal_type)
         self.stack.setCurrentWidget(self.signal_properties)
         
     def show_filter_properties(self, filter_type: str = None):
         """Show filter properties."""
+        self.build_content()
         if filter_type:
             self.filter_properties.update_for_filter_type(filter_type)
         self.stack.setCurrentWidget(self.filter_properties)
         
     def show_feature_properties(self, feature_type: str = None):
         """Show feature extraction properties."""
+        self.build_content()
         if feature_type:
             self.feature_properties.update_for_feature_type(feature_type)
         self.stack.setCurrentWidget(self.feature_properties)
         
     def show_placeholder(self):
         """Show placeholder when no properties are available."""
+        self.build_content()
         self.stack.setCurrentWidget(self.placeholder)
         
     def clear_properties(self):
         """Clear all property widgets."""
+        self.build_content()
         self.signal_properties.clear_properties()
         self.filter_properties.clear_properties()
         self.feature_properties.clear_properties()
\ No newline at end of file
@@ -58,8 +58,12 @@ class QuickActionsDock(BaseDock):
     export_clicked = pyqtSignal()
     clear_clicked = pyqtSignal()
     
-    def __init__(self, title="Quick Actions", parent=None):
+    def __init__(self, title="Quick Actions", parent=None, lazy=False):
         super().__init__(title, parent)
+        self._init_content(lazy)
+        
+    def _build_content(self):
+        """Build the dock's widgets."""
         self._init_ui()
         
     def _init_ui(self):
@@ -150,14 +154,17 @@ class QuickActionsDock(BaseDock):
         
     def set_progress(self, value: int):
         """Update progress bar value."""
+        self.build_content()
         self.progress_bar.setValue(value)
         
     def reset_progress(self):
         """Reset progress bar."""
+        self.build_content()
         self.progress_bar.setValue(0)
         
     def enable_actions(self, enabled: bool):
         """Enable or disable all actions."""
+        self.build_content()
         self.run_btn.setEnabled(enabled)
         self.save_btn.setEnabled(enabled)
         self.export_btn.setEnabled(enabled)
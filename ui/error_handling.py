@@ -1,6 +1,9 @@
 from enum import Enum
-from typing import Dict, Any, Optional, List, Tuple, Callable
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple, Callable, Deque, Sequence
+from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Sequence as SequenceABC
+from itertools import chain
 import logging
 import traceback
 from PyQt6.QtWidgets import QMessageBox
@@ -57,6 +60,7 @@ class ErrorInfo:
     details: Optional[str] = None
     traceback: Optional[str] = None
     suggestions: List[str] = None
+    _detailed_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.suggestions is None:
@@ -92,6 +96,16 @@ class ConfigurationError(BiosignalException):
 
 class MLTrainingError(BiosignalException):
     """Exception raised for ML training failures."""
+    _context_key = "model_state"
+    _ml_format_prefix = "Training Error"
+    _ml_format_label = "Model State"
+    _suggestions = (
+        "Check if the training data is properly preprocessed",
+        "Verify model hyperparameters",
+        "Ensure sufficient training data is available",
+        "Check for data imbalance issues"
+    )
+
     def __init__(self, message: str, details: Optional[str] = None, model_state: Optional[Dict] = None):
         self.message = message
         self.details = details
@@ -100,6 +114,10 @@ class MLTrainingError(BiosignalException):
 
 class MLEvaluationError(BiosignalException):
     """Exception raised for ML evaluation failures."""
+    _context_key = "metrics"
+    _ml_format_prefix = "Evaluation Error"
+    _ml_format_label = "Metrics at failure"
+
     def __init__(self, message: str, details: Optional[str] = None, metrics: Optional[Dict] = None):
         self.message = message
         self.details = details
@@ -108,6 +126,16 @@ class MLEvaluationError(BiosignalException):
 
 class DataLoadingError(BiosignalException):
     """Exception raised for data loading/preprocessing failures."""
+    _context_key = "file_path"
+    _ml_format_prefix = "Data Loading Error"
+    _ml_format_label = "File"
+    _suggestions = (
+        "Verify file format and encoding",
+        "Check file permissions",
+        "Ensure data follows expected schema",
+        "Validate data integrity"
+    )
+
     def __init__(self, message: str, details: Optional[str] = None, file_path: Optional[str] = None):
         self.message = message
         self.details = details
@@ -116,12 +144,62 @@ class DataLoadingError(BiosignalException):
 
 class FeatureExtractionError(BiosignalException):
     """Exception raised for feature extraction failures."""
+    _context_key = "feature_name"
+    _ml_format_prefix = "Feature Extraction Error"
+    _ml_format_label = "Feature"
+    _suggestions = (
+        "Check input signal quality",
+        "Verify feature parameters",
+        "Ensure sufficient data length",
+        "Check for missing or invalid values"
+    )
+
     def __init__(self, message: str, details: Optional[str] = None, feature_name: Optional[str] = None):
         self.message = message
         self.details = details
         self.feature_name = feature_name
         super().__init__(self.message)
 
+class LazyFormat:
+    """Defer building a log message until a handler actually emits it."""
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func: Callable[..., str], *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.func(*self.args)
+
+class ErrorStateView(SequenceABC):
+    """Read-only view of the error history of every category, without copying it.
+    
+    The view follows later changes to the history; errors are ordered by
+    category, oldest first within a category.
+    """
+    __slots__ = ('_states',)
+
+    def __init__(self, states: Dict[ErrorCategory, Deque[ErrorInfo]]):
+        self._states = states
+
+    def __len__(self) -> int:
+        return sum(map(len, self._states.values()))
+
+    def __iter__(self):
+        return chain.from_iterable(self._states.values())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if index >= 0:
+            for errors in self._states.values():
+                if index < len(errors):
+                    return errors[index]
+                index -= len(errors)
+        raise IndexError("error state index out of range")
+
 class ErrorHandler(QObject):
     """Centralized error handling system."""
     
@@ -129,13 +207,15 @@ class ErrorHandler(QObject):
     progress_updated = pyqtSignal(str, int)  # Emitted for progress updates (operation, percentage)
     status_changed = pyqtSignal(str)  # Emitted when status message changes
     
-    def __init__(self):
+    def __init__(self, max_errors_per_category: int = 128):
         super().__init__()
         self.logger = logging.getLogger(__name__)
         self._setup_logging()
         self.validation_rules: Dict[str, List[ValidationRule]] = {}
         self.current_operation: Optional[str] = None
-        self.error_states: Dict[str, List[ErrorInfo]] = {}
+        self.max_errors_per_category = max_errors_per_category
+        # Bounded history per category; oldest entries are dropped first
+        self.error_states: Dict[ErrorCategory, Deque[ErrorInfo]] = {}
         
     def _setup_logging(self):
         """Configure enhanced logging with ML-specific context."""
@@ -175,16 +255,23 @@ class ErrorHandler(QObject):
         
     def _log_with_context(self, level: int, msg: str, category: ErrorCategory,
                          operation: Optional[str] = None, details: Optional[str] = None,
-                         context: Optional[Dict] = None):
-        """Log message with additional context."""
+                         context: Optional[Dict] = None, args: Tuple = ()):
+        """Log message with additional context.
+        
+        ``msg`` is a %-style format string resolved against ``args`` by the
+        logging framework, so nothing is formatted when ``level`` is disabled.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+            
         extra = {
             'operation': operation or self.current_operation or 'unknown',
             'category': category.value,
             'details': details or 'No additional details',
-            'context': str(context) if context else 'No context provided'
+            'context': context if context else 'No context provided'
         }
         
-        self.logger.log(level, msg, extra=extra)
+        self.logger.log(level, msg, *args, extra=extra)
         
     def add_validation_rule(self, key: str, rule: ValidationRule):
         """Add a validation rule."""
@@ -220,51 +307,57 @@ class ErrorHandler(QObject):
         
         # Extract context based on error type
         context = {}
-        if isinstance(error, MLTrainingError) and error.model_state:
-            context['model_state'] = error.model_state
-        elif isinstance(error, MLEvaluationError) and error.metrics:
-            context['metrics'] = error.metrics
-        elif isinstance(error, DataLoadingError):
-            context['file_path'] = error.file_path
-        elif isinstance(error, FeatureExtractionError):
-            context['feature_name'] = error.feature_name
+        key = getattr(type(error), '_context_key', None)
+        if key:
+            value = getattr(error, key, None)
+            if value:
+                context[key] = value
             
-        # Log the error with context
-        log_message = self.format_ml_error(error)
+        # Log the error with context; formatting is deferred to the handlers
+        log_args = (LazyFormat(self.format_ml_error, error),)
         
         if severity == ErrorSeverity.CRITICAL:
-            self._log_with_context(logging.CRITICAL, log_message, category,
-                                details=error_info.details, context=context)
+            self._log_with_context(logging.CRITICAL, "%s", category,
+                                details=error_info.details, context=context,
+                                args=log_args)
         elif severity == ErrorSeverity.ERROR:
-            self._log_with_context(logging.ERROR, log_message, category,
-                                details=error_info.details, context=context)
+            self._log_with_context(logging.ERROR, "%s", category,
+                                details=error_info.details, context=context,
+                                args=log_args)
         elif severity == ErrorSeverity.WARNING:
-            self._log_with_context(logging.WARNING, log_message, category,
-                                details=error_info.details, context=context)
+            self._log_with_context(logging.WARNING, "%s", category,
+                                details=error_info.details, context=context,
+                                args=log_args)
         else:
-            self._log_with_context(logging.INFO, log_message, category,
-                                details=error_info.details, context=context)
+            self._log_with_context(logging.INFO, "%s", category,
+                                details=error_info.details, context=context,
+                                args=log_args)
             
         # Emit error signal
         self.error_occurred.emit(error_info)
         
         # Store error state
-        if error_info.category.value not in self.error_states:
-            self.error_states[error_info.category.value] = []
-        self.error_states[error_info.category.value].append(error_info)
+        errors = self.error_states.get(category)
+        if errors is None:
+            errors = self.error_states[category] = deque(maxlen=self.max_errors_per_category)
+        errors.append(error_info)
         
         return error_info
 
-    def get_error_state(self, category: Optional[ErrorCategory] = None) -> List[ErrorInfo]:
-        """Get current error state for a category or all categories."""
+    def get_error_state(self, category: Optional[ErrorCategory] = None) -> Sequence[ErrorInfo]:
+        """Get current error state for a category or all categories.
+        
+        Errors of all categories are returned as an ErrorStateView over the
+        per-category histories rather than a merged copy.
+        """
         if category:
-            return self.error_states.get(category.value, [])
-        return [error for errors in self.error_states.values() for error in errors]
+            return self.error_states.get(category, ())
+        return ErrorStateView(self.error_states)
 
     def clear_error_state(self, category: Optional[ErrorCategory] = None):
         """Clear error state for a category or all categories."""
         if category:
-            self.error_states.pop(category.value, None)
+            self.error_states.pop(category, None)
         else:
             self.error_states.clear()
 
@@ -272,12 +365,12 @@ class ErrorHandler(QObject):
         """Update progress for long-running operations."""
         self.current_operation = operation
         self.progress_updated.emit(operation, percentage)
-        self.logger.info(f"Progress update - {operation}: {percentage}%")
+        self.logger.info("Progress update - %s: %d%%", operation, percentage)
 
     def set_status(self, message: str):
         """Update status message."""
         self.status_changed.emit(message)
-        self.logger.info(f"Status update: {message}")
+        self.logger.info("Status update: %s", message)
 
     def show_error_dialog(self, error_info: ErrorInfo):
         """Show error dialog to user."""
@@ -298,6 +391,17 @@ class ErrorHandler(QObject):
         dialog.setText(error_info.message)
         
         # Add details if available
+        detailed_text = self._build_detailed_text(error_info)
+        if detailed_text:
+            dialog.setDetailedText(detailed_text)
+            
+        dialog.exec()
+
+    def _build_detailed_text(self, error_info: ErrorInfo) -> str:
+        """Assemble the dialog detail text once and cache it on the ErrorInfo."""
+        if error_info._detailed_text is not None:
+            return error_info._detailed_text
+            
         detailed_text = []
         if error_info.details:
             detailed_text.append(f"Details: {error_info.details}")
@@ -307,67 +411,31 @@ class ErrorHandler(QObject):
             for suggestion in error_info.suggestions:
                 detailed_text.append(f"• {suggestion}")
                 
-        if detailed_text:
-            dialog.setDetailedText("\n".join(detailed_text))
-            
-        dialog.exec()
+        error_info._detailed_text = "\n".join(detailed_text)
+        return error_info._detailed_text
 
     def format_ml_error(self, error: Exception) -> str:
         """Format ML-specific error messages with additional context."""
-        if isinstance(error, MLTrainingError):
-            msg = f"Training Error: {error.message}"
-            if error.model_state:
-                msg += "\nModel State:"
-                for key, value in error.model_state.items():
-                    msg += f"\n- {key}: {value}"
-            return msg
-            
-        elif isinstance(error, MLEvaluationError):
-            msg = f"Evaluation Error: {error.message}"
-            if error.metrics:
-                msg += "\nMetrics at failure:"
-                for metric, value in error.metrics.items():
-                    msg += f"\n- {metric}: {value}"
-            return msg
-            
-        elif isinstance(error, DataLoadingError):
-            msg = f"Data Loading Error: {error.message}"
-            if error.file_path:
-                msg += f"\nFile: {error.file_path}"
-            return msg
-            
-        elif isinstance(error, FeatureExtractionError):
-            msg = f"Feature Extraction Error: {error.message}"
-            if error.feature_name:
-                msg += f"\nFeature: {error.feature_name}"
-            return msg
+        error_type = type(error)
+        prefix = getattr(error_type, '_ml_format_prefix', None)
+        if prefix is None:
+            return str(error)
             
-        return str(error)
+        msg = f"{prefix}: {error.message}"
+        value = getattr(error, error_type._context_key, None)
+        if value:
+            label = error_type._ml_format_label
+            if isinstance(value, dict):
+                msg += f"\n{label}:"
+                for key, item in value.items():
+                    msg += f"\n- {key}: {item}"
+            else:
+                msg += f"\n{label}: {value}"
+        return msg
 
     def get_suggestions_for_error(self, error: Exception) -> List[str]:
         """Get context-specific suggestions for different error types."""
-        if isinstance(error, MLTrainingError):
-            return [
-                "Check if the training data is properly preprocessed",
-                "Verify model hyperparameters",
-                "Ensure sufficient training data is available",
-                "Check for data imbalance issues"
-            ]
-        elif isinstance(error, DataLoadingError):
-            return [
-                "Verify file format and encoding",
-                "Check file permissions",
-                "Ensure data follows expected schema",
-                "Validate data integrity"
-            ]
-        elif isinstance(error, FeatureExtractionError):
-            return [
-                "Check input signal quality",
-                "Verify feature parameters",
-                "Ensure sufficient data length",
-                "Check for missing or invalid values"
-            ]
-        return []
+        return list(getattr(type(error), '_suggestions', ()))
 
 class Validator:
     """Utility class for common validation rules."""
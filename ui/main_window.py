@@ -2,13 +2,18 @@ from PyQt6.QtWidgets import (
     QMainWindow, QTabWidget, QDockWidget, QMenuBar, QStatusBar,
     QWidget, QVBoxLayout, QProgressBar, QMessageBox
 )
-from PyQt6.QtCore import Qt, QSettings, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QCoreApplication, QMetaObject, QSignalBlocker, QThread, QTimer, pyqtSignal
+)
 from PyQt6.QtGui import QKeySequence, QAction
+from functools import partial
 
 from .error_handling import ErrorHandler, ErrorSeverity, BiosignalException
 from .feedback_manager import FeedbackManager
 from .state_manager import StateManager
 from .data_manager import DataManager
+from .settings import get_settings, SETTINGS_ORGANIZATION, SETTINGS_APPLICATION
+from .workers.settings_writer import SettingsWriter
 
 # Import tab widgets
 from .tabs.ml_workflow import MLWorkflowTab
@@ -23,14 +28,40 @@ from .docks.console_dock import ConsoleDock
 from .docks.progress_dock import ProgressDock
 from .docks.batch_processing_dock import BatchProcessingDock
 
+# Standard shortcuts used by the menus, resolved once per process on first use
+# (resolution needs a QGuiApplication, so it cannot happen at import time)
+_SHORTCUT_NAMES = frozenset({"New", "Open", "Save", "Quit", "Undo", "Redo"})
+_SHORTCUTS = {}
+
+def _resolve_shortcuts():
+    """Populate _SHORTCUTS with a QKeySequence for each standard key name."""
+    if not _SHORTCUTS:
+        _SHORTCUTS.update({
+            name: QKeySequence(getattr(QKeySequence.StandardKey, name))
+            for name in _SHORTCUT_NAMES
+        })
+    return _SHORTCUTS
+
+def _stop_writer_thread(thread: QThread, writer: SettingsWriter):
+    """Flush the writes queued for writer and wait for its thread to finish."""
+    if thread.isRunning():
+        # Queued behind any pending writes, which are applied first
+        QMetaObject.invokeMethod(writer, "flush", Qt.ConnectionType.QueuedConnection)
+        thread.wait()
+
 class MainWindow(QMainWindow):
     """Main application window with tab-based interface and dockable panels."""
     
+    settings_write_requested = pyqtSignal(str, object)  # key, value
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Biosignal Framework")
         self.resize(1200, 800)
         
+        # Set while _apply_state runs so UI signals don't write state back
+        self._applying_state = False
+        
         # Initialize managers
         self.error_handler = ErrorHandler()
         self.error_handler.error_occurred.connect(self._on_error)
@@ -41,83 +72,105 @@ class MainWindow(QMainWindow):
         
         self.data_manager = DataManager()
         
-        # Initialize UI
+        # Initialize UI; the status bar also owns the feedback manager
         self._create_menu_bar()
         self._create_status_bar()
-        
-        # Initialize feedback manager with status bar
-        self.feedback_manager = FeedbackManager(self.statusBar())
-        
         self._create_central_widget()
         self._create_docks()
         
         # Set up window state
         self.setDockNestingEnabled(True)
-        self.settings = QSettings('BiosignalFramework', 'App')
+        self.settings = get_settings()
+        self._settings_cache = {}
+        self._start_settings_writer()
         self._load_window_state()
         
-        # Load saved application state
-        self.state_manager.load_state()
+        # Load saved application state once the event loop has painted the window
+        self.feedback_manager.show_status_message("Restoring previous session...", 0)
+        QTimer.singleShot(0, self._restore_application_state)
+
+    def _restore_application_state(self):
+        """Load the saved application state and clear the restoring message."""
+        if self.state_manager.load_state() is None:
+            self.feedback_manager.show_status_message("Ready", 0)
 
     def _create_central_widget(self):
-        """Create the central tab widget and initialize all tabs."""
+        """Create the central tab widget with placeholders for each tab.
+        
+        Tab contents are built by ``_materialize_tab`` the first time a tab
+        becomes current, so unseen tabs cost nothing at startup.
+        """
         self.tab_widget = QTabWidget()
         self.setCentralWidget(self.tab_widget)
         
-        # Create and add tabs
-        self.tabs = {
-            # 'generate': SignalGenerationTab(), # Removed as it no longer exists
-            'ml': MLWorkflowTab(data_manager=self.data_manager,
-                                error_handler=self.error_handler,
-                                feedback_manager=self.feedback_manager)
+        # Tab factories, in display order
+        self._tab_factories = {
+            # 'generate': SignalGenerationTab, # Removed as it no longer exists
+            'ml': lambda: MLWorkflowTab(data_manager=self.data_manager,
+                                        error_handler=self.error_handler,
+                                        feedback_manager=self.feedback_manager)
         }
+        self._tab_ids = ['ml']
+        self.tabs = {}
         
-        # Add tabs in specific order
-        # self.tab_widget.addTab(self.tabs['generate'], "Generate") # Removed as it no longer exists
-        self.tab_widget.addTab(self.tabs['ml'], "ML")
+        # Add placeholder tabs in specific order
+        self.tab_widget.addTab(QWidget(), "ML")
         
         # Connect tab signals
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
+    def _materialize_tab(self, index: int):
+        """Replace the placeholder at ``index`` with the real tab widget."""
+        if index < 0:
+            return
+        tab_id = self._tab_ids[index]
+        if tab_id in self.tabs:
+            return
+            
+        tab = self._tab_factories.pop(tab_id)()
+        self.tabs[tab_id] = tab
+        
+        placeholder = self.tab_widget.widget(index)
+        label = self.tab_widget.tabText(index)
+        with QSignalBlocker(self.tab_widget):
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, label)
+            self.tab_widget.setCurrentIndex(index)
+        placeholder.deleteLater()
+
     def _create_menu_bar(self):
         """Create the main menu bar."""
         menu_bar = QMenuBar()
         self.setMenuBar(menu_bar)
         
-        # File menu
-        file_menu = menu_bar.addMenu("&File")
-        
-        new_action = QAction("&New", self)
-        new_action.setShortcut(QKeySequence.StandardKey.New)
-        file_menu.addAction(new_action)
-        
-        open_action = QAction("&Open", self)
-        open_action.setShortcut(QKeySequence.StandardKey.Open)
-        file_menu.addAction(open_action)
-        
-        save_action = QAction("&Save", self)
-        save_action.setShortcut(QKeySequence.StandardKey.Save)
-        file_menu.addAction(save_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Edit menu
-        edit_menu = menu_bar.addMenu("&Edit")
-        
-        undo_action = QAction("&Undo", self)
-        undo_action.setShortcut(QKeySequence.StandardKey.Undo)
-        undo_action.triggered.connect(self._undo)
-        edit_menu.addAction(undo_action)
-        
-        redo_action = QAction("&Redo", self)
-        redo_action.setShortcut(QKeySequence.StandardKey.Redo)
-        redo_action.triggered.connect(self._redo)
-        edit_menu.addAction(redo_action)
+        # File and Edit menus: (text, shortcut name, slot); None adds a separator
+        menu_actions = [
+            ("&File", [
+                ("&New", "New", None),
+                ("&Open", "Open", None),
+                ("&Save", "Save", None),
+                None,
+                ("E&xit", "Quit", self.close)
+            ]),
+            ("&Edit", [
+                ("&Undo", "Undo", self._undo),
+                ("&Redo", "Redo", self._redo)
+            ])
+        ]
+        shortcuts = _resolve_shortcuts()
+        for menu_title, actions in menu_actions:
+            menu = menu_bar.addMenu(menu_title)
+            for spec in actions:
+                if spec is None:
+                    menu.addSeparator()
+                    continue
+                text, shortcut, slot = spec
+                action = QAction(text, self)
+                action.setShortcut(shortcuts[shortcut])
+                if slot is not None:
+                    action.triggered.connect(slot)
+                menu.addAction(action)
         
         # View menu
         view_menu = menu_bar.addMenu("&View")
@@ -141,14 +194,9 @@ class MainWindow(QMainWindow):
             view_menu.addAction(action)
             self.dock_visibility_actions[dock_id] = action
         
-        # Tools menu
-        tools_menu = menu_bar.addMenu("&Tools")
-        
-        # Analysis menu
-        analysis_menu = menu_bar.addMenu("&Analysis")
-        
-        # Help menu
-        help_menu = menu_bar.addMenu("&Help")
+        # Placeholder menus
+        for menu_title in ("&Tools", "&Analysis", "&Help"):
+            menu_bar.addMenu(menu_title)
 
     def _create_status_bar(self):
         """Create the status bar with progress indicator."""
@@ -162,54 +210,54 @@ class MainWindow(QMainWindow):
         self.progress_bar.setMaximumWidth(200)
         self.progress_bar.hide()
         self.status_bar.addPermanentWidget(self.progress_bar)
-        
-        self.status_bar.showMessage("Ready")
 
     def _create_docks(self):
-        """Create and set up all dockable panels."""
-        # Create dock widgets
-        self.docks = {
-            'presets': PresetDock("Preset Library"),
-            'properties': PropertyDock("Properties"),
-            'inspector': DataInspectorDock("Data Inspector"),
-            'actions': QuickActionsDock("Quick Actions"),
-            'logs': LogDock("Processing Log"),
-            'console': ConsoleDock("Error Console"),
-            'progress': ProgressDock("Progress Tracker"),
-            'batch_processing': BatchProcessingDock("Batch Processing")
-        }
-        
-        # Set up dock locations and properties
-        self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.docks['presets'])
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.docks['properties'])
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.docks['inspector'])
-        self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.docks['actions'])
-        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.docks['logs'])
-        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.docks['console'])
-        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.docks['progress'])
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.docks['batch_processing'])
-        
-        # Set dock features
-        for dock in self.docks.values():
-            dock.setFeatures(
-                QDockWidget.DockWidgetFeature.DockWidgetMovable |
-                QDockWidget.DockWidgetFeature.DockWidgetFloatable |
-                QDockWidget.DockWidgetFeature.DockWidgetClosable
-            )
+        """Create and set up all dockable panels.
+        
+        Each dock is created lazily: the dock itself exists so that window
+        state can be restored, and it builds its contents the first time it
+        becomes visible.
+        """
+        dock_specs = [
+            ('presets', PresetDock, "Preset Library", Qt.DockWidgetArea.LeftDockWidgetArea),
+            ('properties', PropertyDock, "Properties", Qt.DockWidgetArea.RightDockWidgetArea),
+            ('inspector', DataInspectorDock, "Data Inspector", Qt.DockWidgetArea.RightDockWidgetArea),
+            ('actions', QuickActionsDock, "Quick Actions", Qt.DockWidgetArea.LeftDockWidgetArea),
+            ('logs', LogDock, "Processing Log", Qt.DockWidgetArea.BottomDockWidgetArea),
+            ('console', ConsoleDock, "Error Console", Qt.DockWidgetArea.BottomDockWidgetArea),
+            ('progress', ProgressDock, "Progress Tracker", Qt.DockWidgetArea.BottomDockWidgetArea),
+            ('batch_processing', BatchProcessingDock, "Batch Processing", Qt.DockWidgetArea.RightDockWidgetArea)
+        ]
+        
+        self.docks = {}
+        
+        for dock_id, dock_class, title, area in dock_specs:
+            dock = dock_class(title, self, lazy=True)
+            dock.setObjectName(dock_id)
+            self.addDockWidget(area, dock)
+            self.docks[dock_id] = dock
             
         # Connect dock visibility toggles
+        direct = Qt.ConnectionType.DirectConnection
         for dock_id, action in self.dock_visibility_actions.items():
             dock = self.docks[dock_id]
-            action.triggered.connect(lambda checked, d=dock: d.setVisible(checked))
-            dock.visibilityChanged.connect(lambda visible, a=action: a.setChecked(visible))
+            action.toggled.connect(dock.setVisible, type=direct)
+            dock.visibilityChanged.connect(self._sync_dock_action, type=direct)
+
+    def _sync_dock_action(self, visible: bool):
+        """Mirror a dock's visibility on its View menu action without re-toggling the dock."""
+        action = self.dock_visibility_actions[self.sender().objectName()]
+        with QSignalBlocker(action):
+            action.setChecked(visible)
 
     def _on_tab_changed(self, index: int):
         """Handle tab change events."""
         tab_name = self.tab_widget.tabText(index)
         self.status_bar.showMessage(f"Current tab: {tab_name}")
         
-        # Update state
-        self.state_manager.update_state('ui', {'current_tab': tab_name})
+        # Update state, unless this change is itself a state restore
+        if not self._applying_state:
+            self.state_manager.update_state('ui', {'current_tab': tab_name})
         
         # Update dock widgets based on current tab
         self._update_docks_for_tab(tab_name)
@@ -242,6 +290,7 @@ class MainWindow(QMainWindow):
 
     def _apply_state(self, state: dict):
         """Apply a state to the UI."""
+        self._applying_state = True
         try:
             # Apply UI state
             if 'ui' in state:
@@ -260,13 +309,15 @@ class MainWindow(QMainWindow):
             
         except Exception as e:
             self._handle_error(e)
+        finally:
+            self._applying_state = False
 
     def _save_state(self):
         """Save application state."""
         try:
             # Save window geometry and state
-            self.settings.setValue("windowGeometry", self.saveGeometry())
-            self.settings.setValue("windowState", self.saveState())
+            self._settings_set("windowGeometry", self.saveGeometry())
+            self._settings_set("windowState", self.saveState())
             
             # Save dock visibility states
             dock_state = {name: dock.isVisible() for name, dock in self.docks.items()}
@@ -278,13 +329,61 @@ class MainWindow(QMainWindow):
     def _load_window_state(self):
         """Load saved window state."""
         try:
-            if self.settings.value("windowGeometry"):
-                self.restoreGeometry(self.settings.value("windowGeometry"))
-            if self.settings.value("windowState"):
-                self.restoreState(self.settings.value("windowState"))
+            geometry = self._settings_get("windowGeometry")
+            if geometry is not None:
+                self.restoreGeometry(geometry)
+            state = self._settings_get("windowState")
+            if state is not None:
+                self.restoreState(state)
         except Exception as e:
             self._handle_error(e)
 
+    def _start_settings_writer(self):
+        """Run QSettings writes on a dedicated thread.
+        
+        The thread is stopped when the window closes, when the application
+        quits or when the window is destroyed, whichever comes first.
+        """
+        self._settings_thread = QThread(self)
+        self._settings_writer = SettingsWriter(SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+        self._settings_writer.moveToThread(self._settings_thread)
+        self._settings_thread.finished.connect(self._settings_writer.deleteLater)
+        self.settings_write_requested.connect(self._settings_writer.write)
+        self._settings_writer_stopped = False
+        
+        QCoreApplication.instance().aboutToQuit.connect(self._stop_settings_writer)
+        # Bound to the thread and writer only, as the window is gone by then
+        self.destroyed.connect(
+            partial(_stop_writer_thread, self._settings_thread, self._settings_writer)
+        )
+        self._settings_thread.start()
+
+    def _stop_settings_writer(self):
+        """Flush queued setting writes and wait for the writer thread to finish.
+        
+        Settings written afterwards go directly to QSettings.
+        """
+        if self._settings_writer_stopped:
+            return
+        self._settings_writer_stopped = True
+        _stop_writer_thread(self._settings_thread, self._settings_writer)
+
+    def _settings_get(self, key: str):
+        """Read a setting, hitting the QSettings backend only once per key."""
+        if key not in self._settings_cache:
+            self._settings_cache[key] = self.settings.value(key)
+        return self._settings_cache[key]
+
+    def _settings_set(self, key: str, value):
+        """Write a setting only if it differs from the cached value."""
+        if self._settings_get(key) == value:
+            return
+        self._settings_cache[key] = value
+        if self._settings_writer_stopped:
+            self.settings.setValue(key, value)
+        else:
+            self.settings_write_requested.emit(key, value)
+
     def _undo(self):
         """Handle undo action."""
         try:
@@ -309,10 +408,16 @@ class MainWindow(QMainWindow):
             error = BiosignalException(error)
         self.error_handler.handle_error(error)
 
+    def showEvent(self, event):
+        """Build the initially current tab once the window is shown."""
+        super().showEvent(event)
+        self._materialize_tab(self.tab_widget.currentIndex())
+
     def closeEvent(self, event):
         """Handle application close."""
         try:
             self._save_state()
+            self._stop_settings_writer()
             event.accept()
         except Exception as e:
             self._handle_error(e)
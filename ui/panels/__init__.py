@@ -1,3 +1,5 @@
+import importlib
+
 from .base_panel import (
     BaseControlPanel,
     ParameterWidget,
@@ -6,23 +8,39 @@ from .base_panel import (
     BoolParameter,
     SliderParameter
 )
-from .feature_panel import BaseFeaturePanel
-from .time_domain_panel import TimeDomainFeaturePanel
-from .frequency_domain_panel import FrequencyDomainFeaturePanel
-from .nonlinear_feature_panel import NonlinearFeaturePanel
-from .feature_selection_panel import FeatureSelectionPanel
-from .emg_panel import EMGControlPanel
-from .ecg_panel import ECGControlPanel
-from .eog_panel import EOGControlPanel
-from .noise_panel import NoiseArtifactPanel
-from .data_loader_panel import DataLoaderPanel
-from .model_selection_panel import ModelSelectionPanel
-from .training_panel import TrainingPanel
-from .evaluation_panel import EvaluationPanel
-from .batch_processing_panel import BatchProcessingPanel
-from .batch_configuration_panel import BatchConfigurationPanel
-from .batch_monitor_panel import BatchMonitorPanel
-from .result_comparison_panel import ResultComparisonPanel
+
+# Panel modules pull in numpy/scipy/pyqtgraph and friends, so they are only
+# imported the first time one of their classes is accessed (PEP 562).
+_LAZY_PANELS = {
+    'BaseFeaturePanel': 'feature_panel',
+    'TimeDomainFeaturePanel': 'time_domain_panel',
+    'FrequencyDomainFeaturePanel': 'frequency_domain_panel',
+    'NonlinearFeaturePanel': 'nonlinear_feature_panel',
+    'FeatureSelectionPanel': 'feature_selection_panel',
+    'EMGControlPanel': 'emg_panel',
+    'ECGControlPanel': 'ecg_panel',
+    'EOGControlPanel': 'eog_panel',
+    'NoiseArtifactPanel': 'noise_panel',
+    'DataLoaderPanel': 'data_loader_panel',
+    'ModelSelectionPanel': 'model_selection_panel',
+    'TrainingPanel': 'training_panel',
+    'EvaluationPanel': 'evaluation_panel',
+    'BatchProcessingPanel': 'batch_processing_panel',
+    'BatchConfigurationPanel': 'batch_configuration_panel',
+    'BatchMonitorPanel': 'batch_monitor_panel',
+    'ResultComparisonPanel': 'result_comparison_panel'
+}
+
+def __getattr__(name):
+    if name in _LAZY_PANELS:
+        module = importlib.import_module(f".{_LAZY_PANELS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_PANELS))
 
 __all__ = [
     'BaseControlPanel',
@@ -48,4 +66,4 @@ __all__ = [
     'BatchConfigurationPanel',
     'BatchMonitorPanel',
     'ResultComparisonPanel'
-]
\ No newline at end of file
+]
@@ -1,10 +1,11 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QGroupBox,
     QLabel, QSpinBox, QDoubleSpinBox, QComboBox,
-    QCheckBox, QSlider, QPushButton
+    QCheckBox, QSlider, QPushButton, QStackedWidget
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from typing import Dict, Any, Optional
+from PyQt6.QtCore import Qt, QTimer, QSignalBlocker, pyqtSignal
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterator, Optional
 
 class ParameterWidget(QWidget):
     """Base widget for parameter controls."""
@@ -20,6 +21,12 @@ class ParameterWidget(QWidget):
         """Initialize the UI. Must be implemented by subclasses."""
         raise NotImplementedError
         
+    def _create_host_layout(self) -> QVBoxLayout:
+        """Create the margin-free layout that hosts this parameter's controls."""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        return layout
+        
     def get_value(self):
         """Get current parameter value. Must be implemented by subclasses."""
         raise NotImplementedError
@@ -40,8 +47,7 @@ class NumericParameter(ParameterWidget):
         super().__init__(name, parent)
         
     def _init_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = self._create_host_layout()
         
         if self.decimals == 0:
             self.spin = QSpinBox()
@@ -72,11 +78,14 @@ class EnumParameter(ParameterWidget):
         super().__init__(name, parent)
         
     def _init_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = self._create_host_layout()
         
         self.combo = QComboBox()
         self.combo.addItems(self.options)
+        # Option -> index map; like findText, the first duplicate wins
+        self._index = {}
+        for i, option in enumerate(self.options):
+            self._index.setdefault(option, i)
         self.combo.currentTextChanged.connect(
             lambda v: self.value_changed.emit(self.name, v)
         )
@@ -86,7 +95,7 @@ class EnumParameter(ParameterWidget):
         return self.combo.currentText()
         
     def set_value(self, value):
-        index = self.combo.findText(value)
+        index = self._index.get(value, -1)
         if index >= 0:
             self.combo.setCurrentIndex(index)
 
@@ -98,8 +107,7 @@ class BoolParameter(ParameterWidget):
         super().__init__(name, parent)
         
     def _init_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = self._create_host_layout()
         
         self.checkbox = QCheckBox(self.label)
         self.checkbox.toggled.connect(
@@ -114,20 +122,28 @@ class BoolParameter(ParameterWidget):
         self.checkbox.setChecked(value)
 
 class SliderParameter(ParameterWidget):
-    """Widget for slider-based parameter input."""
+    """Widget for slider-based parameter input.
+    
+    The value label follows the slider continuously, while ``value_changed``
+    is throttled to one emission per ``EMIT_INTERVAL_MS``. With
+    ``commit_on_release`` set, drags only emit once the slider is released.
+    """
+    
+    EMIT_INTERVAL_MS = 50
     
     def __init__(self, name: str, min_val: float, max_val: float,
-                 step: float = 0.1, decimals: int = 2, parent=None):
+                 step: float = 0.1, decimals: int = 2,
+                 commit_on_release: bool = False, parent=None):
         self.min_val = min_val
         self.max_val = max_val
         self.step = step
         self.decimals = decimals
         self.scale = 10 ** decimals
+        self.commit_on_release = commit_on_release
         super().__init__(name, parent)
         
     def _init_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = self._create_host_layout()
         
         # Create slider
         self.slider = QSlider(Qt.Orientation.Horizontal)
@@ -144,14 +160,29 @@ class SliderParameter(ParameterWidget):
         layout.addWidget(self.slider)
         layout.addWidget(self.value_label)
         
+        # Throttle downstream notifications
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.EMIT_INTERVAL_MS)
+        self._emit_timer.timeout.connect(self._emit_value)
+        
         # Connect signals
         self.slider.valueChanged.connect(self._on_slider_changed)
+        self.slider.sliderReleased.connect(self._emit_value)
         
     def _on_slider_changed(self, value):
         """Handle slider value changes."""
         actual_value = value / self.scale
         self.value_label.setText(f"{actual_value:.{self.decimals}f}")
-        self.value_changed.emit(self.name, actual_value)
+        if self.commit_on_release and self.slider.isSliderDown():
+            return  # Emitted from sliderReleased
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+            
+    def _emit_value(self):
+        """Emit the current slider value."""
+        self._emit_timer.stop()
+        self.value_changed.emit(self.name, self.get_value())
         
     def get_value(self):
         return self.slider.value() / self.scale
@@ -165,14 +196,67 @@ class BaseControlPanel(QWidget):
     parameters_changed = pyqtSignal(dict)  # All parameters
     parameter_changed = pyqtSignal(str, object)  # Single parameter
     
+    PARAMETERS_CHANGED_INTERVAL_MS = 50  # Coalescing window for parameters_changed
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parameters = {}
+        # Last known value of every parameter, kept in sync by value_changed
+        self._param_cache: Dict[str, Any] = {}
+        
+        # Bursts of parameter changes (e.g. slider drags) emit a single
+        # parameters_changed once the burst settles
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.PARAMETERS_CHANGED_INTERVAL_MS)
+        self._emit_timer.timeout.connect(self._emit_parameters_changed)
+        
+        # Control groups built the first time they are shown
+        self._lazy_builders: Dict[str, Callable[[], QWidget]] = {}
+        self._lazy_widgets: Dict[str, QWidget] = {}
+        # Values set for parameters whose group is not built yet
+        self._unapplied_params: Dict[str, Any] = {}
         
     def _init_ui(self):
         """Initialize the UI. Must be implemented by subclasses."""
         pass
         
+    def _add_lazy_group(self, name: str, builder: Callable[[], QWidget]):
+        """Register a control group that is only built when first shown."""
+        self._lazy_builders[name] = builder
+        
+    def _show_lazy_group(self, stack: QStackedWidget, name: str) -> QWidget:
+        """Show a registered control group in a stack, building it on first use."""
+        widget = self._lazy_widgets.get(name)
+        if widget is None:
+            with self._suspend_updates():
+                widget = self._lazy_builders[name]()
+                self._lazy_widgets[name] = widget
+                stack.addWidget(widget)
+            # Apply values that were set before these controls existed
+            params = {key: self._unapplied_params.pop(key)
+                      for key in list(self._unapplied_params) if key in self.parameters}
+            if params:
+                self.set_parameters(params)
+        stack.setCurrentWidget(widget)
+        return widget
+        
+    @contextmanager
+    def _suspend_updates(self) -> Iterator[None]:
+        """Hold back repaints while several widgets change, then lay out and repaint once."""
+        if not self.updatesEnabled():
+            # Already inside a suspended region
+            yield
+            return
+            
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.updateGeometry()
+            self.update()
+            
     def add_parameter_group(self, title: str) -> QGroupBox:
         """Add a new parameter group."""
         group = QGroupBox(title)
@@ -185,22 +269,43 @@ class BaseControlPanel(QWidget):
         form = group.layout()
         form.addRow(label, widget)
         self.parameters[widget.name] = widget
+        self._param_cache[widget.name] = widget.get_value()
         widget.value_changed.connect(self._on_parameter_changed)
         
     def get_parameters(self) -> Dict[str, Any]:
         """Get all parameter values."""
-        return {name: widget.get_value() 
-                for name, widget in self.parameters.items()}
+        return self._param_cache.copy()
         
     def set_parameters(self, params: Dict[str, Any]):
-        """Set parameter values."""
-        for name, value in params.items():
-            if name in self.parameters:
-                self.parameters[name].set_value(value)
+        """Set parameter values and emit parameters_changed once."""
+        # Widgets still notify their own listeners; only the panel's
+        # per-parameter signals are held back until the update is complete.
+        # The panel repaints once, not per widget
+        with self._suspend_updates(), QSignalBlocker(self):
+            for name, value in params.items():
+                if name in self.parameters:
+                    widget = self.parameters[name]
+                    widget.set_value(value)
+                    # Not every widget emits value_changed on programmatic updates
+                    self._param_cache[name] = widget.get_value()
+                elif self._lazy_builders:
+                    # Applied once the group owning the parameter is built
+                    self._unapplied_params[name] = value
+        self._emit_timer.stop()
+        self._emit_parameters_changed()
                 
     def _on_parameter_changed(self, name: str, value: Any):
         """Handle parameter value changes."""
+        # Programmatic updates can re-emit an unchanged value
+        if name in self._param_cache and self._param_cache[name] == value:
+            return
+        self._param_cache[name] = value
         self.parameter_changed.emit(name, value)
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+            
+    def _emit_parameters_changed(self):
+        """Emit one parameters_changed with the current parameter snapshot."""
         self.parameters_changed.emit(self.get_parameters())
         
     def reset_parameters(self):
@@ -1,47 +1,44 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
     QPushButton, QFileDialog, QLabel, QSpinBox,
-    QComboBox, QCheckBox, QFormLayout, QListWidget,
-    QListWidgetItem
+    QComboBox, QCheckBox, QFormLayout, QListView
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from typing import Dict, Any, List, Optional
-import os
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractListModel, QModelIndex
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from pathlib import PurePath
 
 from .base_panel import BaseControlPanel, ParameterWidget, NumericParameter, EnumParameter
-from ..error_handling import ErrorHandler, ErrorCategory, ErrorSeverity
+from ..error_handling import (
+    ErrorHandler, ErrorCategory, ErrorSeverity, ValidationError, ValidationRule
+)
 
-class BatchConfigurationPanel(BaseControlPanel):
-    """Panel for configuring batch processing settings."""
-    
-    configuration_complete = pyqtSignal()  # Emitted when configuration is complete
+class DatasetFilesModel(QAbstractListModel):
+    """List model showing dataset file names, with the full path as tooltip."""
     
-    def __init__(self, error_handler: ErrorHandler, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.error_handler = error_handler
-        self.setup_ui()
-        
-    def setup_ui(self):
-        """Initialize the UI components."""
-        layout = QVBoxLayout(self)
-        
-        # Dataset configuration
-        dataset_group = QGroupBox("Dataset Configuration")
-        dataset_layout = QVBoxLayout(dataset_group)
-        self.dataset_config = DatasetConfig("dataset")
-        dataset_layout.addWidget(self.dataset_config)
-        layout.addWidget(dataset_group)
-        
-        # Add configuration complete button
-        self.complete_button = QPushButton("Complete Configuration")
-        self.complete_button.clicked.connect(self._on_configuration_complete)
-        layout.addWidget(self.complete_button)
-        
-    def _on_configuration_complete(self):
-        """Handle configuration complete button click."""
-        # Here you would typically validate the configuration
-        # For now, just emit the signal
-        self.configuration_complete.emit()
+        self._paths: Tuple[str, ...] = ()
+        self._names: List[str] = []
+        
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._paths)
+        
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._names[index.row()]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self._paths[index.row()]
+        return None
+        
+    def set_paths(self, paths: Sequence[str]):
+        """Replace all paths with a single model reset."""
+        self.beginResetModel()
+        self._paths = tuple(paths)
+        # File names are computed once here rather than on every repaint
+        self._names = [PurePath(path).name for path in self._paths]
+        self.endResetModel()
 
 class DatasetConfig(ParameterWidget):
     """Widget for configuring dataset paths and options."""
@@ -50,8 +47,7 @@ class DatasetConfig(ParameterWidget):
         super().__init__(name, parent)
         
     def _init_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
+        layout = self._create_host_layout()
         
         # Dataset path selection
         path_layout = QHBoxLayout()
@@ -63,10 +59,14 @@ class DatasetConfig(ParameterWidget):
         layout.addLayout(path_layout)
         
         # Selected files list
-        self.files_list = QListWidget()
+        self.files_model = DatasetFilesModel(self)
+        self.files_list = QListView()
+        self.files_list.setModel(self.files_model)
+        self.files_list.setUniformItemSizes(True)
         layout.addWidget(self.files_list)
         
-        self.paths: List[str] = []
+        # Shared with the list model; get_value() hands out list copies
+        self._paths: Tuple[str, ...] = ()
         
     def _browse_files(self):
         """Open file dialog for selecting dataset files."""
@@ -78,32 +78,36 @@ class DatasetConfig(ParameterWidget):
         )
         
         if files:
-            self.paths = files
-            self.files_list.clear()
-            for file in files:
-                item = QListWidgetItem(os.path.basename(file))
-                item.setToolTip(file)
-                self.files_list.addItem(item)
-            self.path_label.setText(f"{len(files)} files selected")
-            self.value_changed.emit(self.name, self.paths)
+            self._set_paths(files)
+            self.value_changed.emit(self.name, self.get_value())
+            
+    def _set_paths(self, paths: Sequence[str]):
+        """Store the selected paths and refresh the file list."""
+        self._paths = tuple(paths)
+        self.files_model.set_paths(self._paths)
+        self.path_label.setText(f"{len(self._paths)} files selected")
             
     def get_value(self) -> List[str]:
-        return self.paths
+        return list(self._paths)
         
     def set_value(self, value: List[str]):
-        self.paths = value
-        self.files_list.clear()
-        for file in value:
-            item = QListWidgetItem(os.path.basename(file))
-            item.setToolTip(file)
-            self.files_list.addItem(item)
-        self.path_label.setText(f"{len(value)} files selected")
+        self._set_paths(value)
 
 class BatchConfigurationPanel(BaseControlPanel):
     """Panel for configuring batch processing parameters."""
     
     config_changed = pyqtSignal(dict)  # Emitted when configuration changes
     
+    # (parameter name, rule) pairs checked in order by validate_configuration
+    VALIDATION_RULES = (
+        ("dataset_paths", ValidationRule(bool, "No dataset files selected")),
+        ("batch_size", ValidationRule(lambda v: v > 0, "Batch size must be positive")),
+        ("epochs", ValidationRule(lambda v: v > 0, "Number of epochs must be positive")),
+        ("learning_rate", ValidationRule(lambda v: v > 0, "Learning rate must be positive")),
+        ("window_size", ValidationRule(lambda v: v > 0, "Window size must be positive")),
+        ("overlap", ValidationRule(lambda v: 0 <= v <= 100, "Overlap must be between 0 and 100"))
+    )
+    
     def __init__(self, error_handler: ErrorHandler, parent=None):
         self.error_handler = error_handler
         super().__init__(parent)
@@ -185,37 +189,19 @@ class BatchConfigurationPanel(BaseControlPanel):
         
     def validate_configuration(self) -> bool:
         """Validate the current configuration."""
-        try:
-            config = self.get_configuration()
-            
-            # Check dataset paths
-            if not config["dataset_paths"]:
-                raise ValueError("No dataset files selected")
-                
-            # Validate numeric parameters
-            if config["batch_size"] <= 0:
-                raise ValueError("Batch size must be positive")
-            if config["epochs"] <= 0:
-                raise ValueError("Number of epochs must be positive")
-            if config["learning_rate"] <= 0:
-                raise ValueError("Learning rate must be positive")
+        config = self._param_cache
+        for name, rule in self.VALIDATION_RULES:
+            value = config.get(name)
+            if value is None or not rule.condition(value):
+                self.error_handler.handle_error(
+                    ValidationError(rule.message),
+                    rule.severity,
+                    rule.category,
+                    ["Check parameter values", "Ensure dataset is selected"]
+                )
+                return False
                 
-            # Validate window parameters
-            if config["window_size"] <= 0:
-                raise ValueError("Window size must be positive")
-            if not 0 <= config["overlap"] <= 100:
-                raise ValueError("Overlap must be between 0 and 100")
-                
-            return True
-            
-        except Exception as e:
-            self.error_handler.handle_error(
-                e,
-                ErrorSeverity.ERROR,
-                ErrorCategory.VALIDATION,
-                ["Check parameter values", "Ensure dataset is selected"]
-            )
-            return False
+        return True
             
     def reset_configuration(self):
         """Reset configuration to defaults."""
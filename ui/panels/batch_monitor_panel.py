@@ -1,73 +1,439 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-    QProgressBar, QLabel, QTableWidget, QTableWidgetItem,
-    QHeaderView, QPushButton, QScrollArea
+    QProgressBar, QLabel, QTableView, QListView,
+    QHeaderView, QPushButton, QApplication, QStyle,
+    QStyledItemDelegate, QStyleOptionViewItem, QStyleOptionProgressBar
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor
-from typing import Dict, Any, List, Optional
-import time
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractTableModel, QAbstractListModel,
+    QModelIndex, QTimer, QElapsedTimer, QSize, pyqtSlot
+)
+from PyQt6.QtGui import QColor, QPainter
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
+import logging
+import numpy as np
 
 from .base_panel import BaseControlPanel
 from ..error_handling import ErrorHandler, ErrorCategory, ErrorSeverity, ErrorInfo
 
-class TaskProgressWidget(QWidget):
-    """Widget for displaying individual task progress."""
+logger = logging.getLogger(__name__)
+
+class MetricsModel(QAbstractTableModel):
+    """Table model of batch metrics with name, current and average columns."""
     
-    def __init__(self, task_id: str, task_name: str, parent=None):
+    HEADERS = ("Metric", "Current", "Average")
+    
+    def __init__(self, parent=None):
         super().__init__(parent)
+        # One list per column; row i of every list describes the same metric
+        self._names: List[str] = []
+        self._cur: List[Any] = []  # float, or str for text metrics
+        self._avg: List[Any] = []  # float, or str when formatted by the producer
+        # Running totals behind the average column, as arrays so that
+        # update_metrics_array can accumulate a whole batch at once
+        self._sum = np.zeros(0)
+        self._count = np.zeros(0, dtype=np.int64)
+        self._index: Dict[str, int] = {}
+        # Rows changed since the last flush(), as an inclusive range
+        self._dirty_first = -1
+        self._dirty_last = -1
+        
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+        
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        row, column = index.row(), index.column()
+        if column == 0:
+            return self._names[row]
+        value = self._cur[row] if column == 1 else self._avg[row]
+        if value is None:
+            return None
+        # Formatted on demand, so only visible cells pay for it
+        return f"{value:.4f}" if isinstance(value, float) else str(value)
+        
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+        
+    def update_metrics(self, metrics: Dict[str, float]):
+        """Update current and average values, adding rows for new metrics.
+        
+        Changes to existing rows are announced by the next flush().
+        """
+        self._add_missing_rows(metrics)
+        index, cur, sum_, count, avg = self._index, self._cur, self._sum, self._count, self._avg
+        first, last = self._dirty_first, self._dirty_last
+        for name, value in metrics.items():
+            row = index[name]
+            cur[row] = value
+            sum_[row] += value
+            count[row] += 1
+            avg[row] = sum_[row] / count[row]
+            if first < 0 or row < first:
+                first = row
+            if row > last:
+                last = row
+                
+        self._dirty_first, self._dirty_last = first, last
+        
+    @staticmethod
+    def split_metrics(metrics: Dict[str, Any]) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """Split producer metrics into numeric values and display text.
+        
+        Booleans and other non-numeric values become text; None values are dropped.
+        """
+        numeric: Dict[str, float] = {}
+        text: Dict[str, str] = {}
+        for name, value in metrics.items():
+            if value is None:
+                continue
+            if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+                numeric[name] = float(value)
+            else:
+                text[name] = str(value)
+        return numeric, text
+        
+    def update_metrics_array(self, names: List[str], values: np.ndarray):
+        """Update metrics whose values arrive as one array, parallel to names.
+        
+        Sums, counts, averages and display text are all computed with array
+        operations rather than per metric.
+        """
+        if not names:
+            return
+        self._add_missing_rows(names)
+        rows = np.fromiter((self._index[name] for name in names), dtype=np.intp, count=len(names))
+        values = np.asarray(values, dtype=np.float64)
+        
+        np.add.at(self._sum, rows, values)
+        np.add.at(self._count, rows, 1)
+        cur_text = np.char.mod("%.4f", values).tolist()
+        avg_text = np.char.mod("%.4f", self._sum[rows] / self._count[rows]).tolist()
+        for row, cur, avg in zip(rows.tolist(), cur_text, avg_text):
+            self._cur[row] = cur
+            self._avg[row] = avg
+            
+        first, last = int(rows.min()), int(rows.max())
+        if self._dirty_first >= 0:
+            first = min(first, self._dirty_first)
+            last = max(last, self._dirty_last)
+        self._dirty_first, self._dirty_last = first, last
+        
+    def update_text_metrics(self, metrics: Dict[str, str]):
+        """Show non-numeric metrics in the Current column, without an average."""
+        self._add_missing_rows(metrics)
+        first, last = self._dirty_first, self._dirty_last
+        for name, text in metrics.items():
+            row = self._index[name]
+            self._cur[row] = text
+            if first < 0 or row < first:
+                first = row
+            if row > last:
+                last = row
+                
+        self._dirty_first, self._dirty_last = first, last
+        
+    def set_formatted_metrics(self, names: List[str], cur_text: List[str], avg_text: List[str]):
+        """Show metrics already formatted by the producer.
+        
+        The producer keeps its own averages for these metrics; the strings
+        are displayed as given.
+        """
+        self._add_missing_rows(names)
+        first, last = self._dirty_first, self._dirty_last
+        for name, cur, avg in zip(names, cur_text, avg_text):
+            row = self._index[name]
+            self._cur[row] = cur
+            self._avg[row] = avg
+            if first < 0 or row < first:
+                first = row
+            if row > last:
+                last = row
+                
+        self._dirty_first, self._dirty_last = first, last
+        
+    def _add_missing_rows(self, names):
+        """Append empty rows, as one block, for names not yet in the table."""
+        new_names = [name for name in names if name not in self._index]
+        if not new_names:
+            return
+        start = len(self._names)
+        count = len(new_names)
+        self.beginInsertRows(QModelIndex(), start, start + count - 1)
+        for row, name in enumerate(new_names, start):
+            self._index[name] = row
+        self._names.extend(new_names)
+        self._cur.extend([None] * count)
+        self._avg.extend([None] * count)
+        self._sum = np.concatenate((self._sum, np.zeros(count)))
+        self._count = np.concatenate((self._count, np.zeros(count, dtype=np.int64)))
+        self.endInsertRows()
+        
+    def flush(self):
+        """Emit a single dataChanged covering every row updated since the last flush."""
+        if self._dirty_first < 0:
+            return
+        first, last = self._dirty_first, self._dirty_last
+        self._dirty_first = self._dirty_last = -1
+        self.dataChanged.emit(
+            self.index(first, 1), self.index(last, 2),
+            [Qt.ItemDataRole.DisplayRole]
+        )
+            
+    def clear(self):
+        """Remove all metrics."""
+        self._dirty_first = self._dirty_last = -1
+        self.beginResetModel()
+        self._names.clear()
+        self._cur.clear()
+        self._avg.clear()
+        self._sum = np.zeros(0)
+        self._count = np.zeros(0, dtype=np.int64)
+        self._index.clear()
+        self.endResetModel()
+
+@dataclass(slots=True)
+class TaskState:
+    """Progress state of a single monitored task."""
+    task_id: str
+    name: str
+    percent: int = 0
+    status: str = "Pending"
+    started_ms: int = 0  # Start time on the owning TaskModel's clock
+    elapsed_ms: int = 0
+    memory_mb: float = 0.0
+    error: Optional[str] = None
+    
+    def reset(self, task_id: str, name: str, started_ms: int):
+        """Reinitialize a recycled record for a new task."""
         self.task_id = task_id
-        self.task_name = task_name
-        self.start_time = time.time()
-        self._init_ui()
+        self.name = name
+        self.percent = 0
+        self.status = "Pending"
+        self.started_ms = started_ms
+        self.elapsed_ms = 0
+        self.memory_mb = 0.0
+        self.error = None
+
+class TaskModel(QAbstractListModel):
+    """List model holding the progress state of every monitored task."""
+    
+    TaskRole = Qt.ItemDataRole.UserRole  # TaskState of a row
+    _INV_MB = 1.0 / (1024 * 1024)  # Bytes to MB
+    MAX_FREE_TASKS = 256  # Removed task records kept for reuse
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks: List[TaskState] = []
+        self._rows: Dict[str, int] = {}  # task_id -> row
+        self._free: List[TaskState] = []  # Records of removed tasks, reused by add_tasks
+        # Shared monotonic clock; tasks store their start offset on it
+        self._clock = QElapsedTimer()
+        self._clock.start()
         
-    def _init_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        
-        # Task info
-        info_layout = QHBoxLayout()
-        self.name_label = QLabel(self.task_name)
-        self.status_label = QLabel("Pending")
-        info_layout.addWidget(self.name_label)
-        info_layout.addWidget(self.status_label)
-        layout.addLayout(info_layout)
-        
-        # Progress bar
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setRange(0, 100)
-        self.progress_bar.setValue(0)
-        layout.addWidget(self.progress_bar)
-        
-        # Metrics
-        metrics_layout = QHBoxLayout()
-        self.time_label = QLabel("Time: 0:00")
-        self.memory_label = QLabel("Memory: 0 MB")
-        metrics_layout.addWidget(self.time_label)
-        metrics_layout.addWidget(self.memory_label)
-        layout.addLayout(metrics_layout)
-        
-    def update_progress(self, percentage: int, status: str, metrics: Dict[str, Any]):
-        """Update task progress and metrics."""
-        self.progress_bar.setValue(percentage)
-        self.status_label.setText(status)
-        
-        # Update time
-        elapsed = time.time() - self.start_time
-        minutes = int(elapsed // 60)
-        seconds = int(elapsed % 60)
-        self.time_label.setText(f"Time: {minutes}:{seconds:02d}")
-        
-        # Update memory if provided
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tasks)
+        
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self._tasks[index.row()]
+        if role == self.TaskRole:
+            return task
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{task.name} — {task.status}"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return task.error
+        return None
+        
+    def has_task(self, task_id: str) -> bool:
+        return task_id in self._rows
+        
+    def task(self, task_id: str) -> Optional[TaskState]:
+        """Get the state of a task, or None if it is not monitored.
+        
+        The record belongs to the model and is reused once the task is removed.
+        """
+        row = self._rows.get(task_id)
+        return None if row is None else self._tasks[row]
+        
+    def add_task(self, task_id: str, task_name: str) -> bool:
+        """Append a task in the pending state; returns False if it already exists."""
+        return self.add_tasks([(task_id, task_name)]) == 1
+        
+    def add_tasks(self, items: List[Tuple[str, str]]) -> int:
+        """Append (task_id, task_name) tasks as one row block; returns how many were new."""
+        started_ms = self._clock.elapsed()
+        new_tasks: Dict[str, TaskState] = {}
+        for task_id, task_name in items:
+            if task_id not in self._rows and task_id not in new_tasks:
+                new_tasks[task_id] = self._new_task(task_id, task_name, started_ms)
+        if not new_tasks:
+            return 0
+            
+        start = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), start, start + len(new_tasks) - 1)
+        for row, task_id in enumerate(new_tasks, start):
+            self._rows[task_id] = row
+        self._tasks.extend(new_tasks.values())
+        self.endInsertRows()
+        return len(new_tasks)
+        
+    def update_task(self, task_id: str, percentage: int, status: str, metrics: Dict[str, float]):
+        """Update progress and metrics of a task."""
+        row = self._rows.get(task_id)
+        if row is None:
+            return
+        task = self._tasks[row]
+        elapsed_ms = self._clock.elapsed() - task.started_ms
+        memory_mb = task.memory_mb
         if "memory_usage" in metrics:
-            memory_mb = metrics["memory_usage"] / (1024 * 1024)  # Convert to MB
-            self.memory_label.setText(f"Memory: {memory_mb:.1f} MB")
-            
-    def set_error(self, error_info: ErrorInfo):
-        """Display error state."""
-        self.status_label.setText("Error")
-        self.status_label.setStyleSheet("color: red")
-        self.setToolTip(error_info.message)
+            new_memory_mb = metrics["memory_usage"] * self._INV_MB
+            # Memory is shown to 0.1 MB; smaller moves keep the shown value
+            if abs(new_memory_mb - memory_mb) >= 0.05:
+                memory_mb = new_memory_mb
+            
+        # Elapsed time is painted in whole seconds, so sub-second changes alone
+        # do not need a repaint
+        changed = (
+            percentage != task.percent
+            or status != task.status
+            or memory_mb != task.memory_mb
+            or elapsed_ms // 1000 != task.elapsed_ms // 1000
+        )
+        task.percent = percentage
+        task.status = status
+        task.elapsed_ms = elapsed_ms
+        task.memory_mb = memory_mb
+        if changed:
+            self._row_changed(row)
+        
+    def set_error(self, task_id: str, message: str) -> bool:
+        """Put a task in the error state; returns False if it is not monitored."""
+        row = self._rows.get(task_id)
+        if row is None:
+            return False
+        task = self._tasks[row]
+        task.status = "Error"
+        task.error = message
+        self._row_changed(row)
+        return True
+        
+    def remove_task(self, task_id: str) -> bool:
+        """Remove a task; returns False if it is not monitored."""
+        row = self._rows.pop(task_id, None)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        removed = self._tasks.pop(row)
+        if len(self._free) < self.MAX_FREE_TASKS:
+            self._free.append(removed)
+        # Tasks after the removed one move up a row
+        for task in self._tasks[row:]:
+            self._rows[task.task_id] -= 1
+        self.endRemoveRows()
+        return True
+        
+    def remove_tasks(self, task_ids: List[str]) -> int:
+        """Remove several tasks, renumbering the remaining rows once; returns how many were monitored."""
+        rows = sorted({self._rows[task_id] for task_id in task_ids if task_id in self._rows}, reverse=True)
+        if not rows:
+            return 0
+            
+        # Remove runs of adjacent rows from the bottom up, so rows above keep their numbers
+        i = 0
+        while i < len(rows):
+            first = last = rows[i]
+            i += 1
+            while i < len(rows) and rows[i] == first - 1:
+                first = rows[i]
+                i += 1
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for task in self._tasks[first:last + 1]:
+                del self._rows[task.task_id]
+                if len(self._free) < self.MAX_FREE_TASKS:
+                    self._free.append(task)
+            del self._tasks[first:last + 1]
+            self.endRemoveRows()
+            
+        for row, task in enumerate(self._tasks[first:], first):
+            self._rows[task.task_id] = row
+        return len(rows)
+        
+    def clear(self):
+        """Remove all tasks."""
+        self.beginResetModel()
+        self._tasks.clear()
+        self._rows.clear()
+        self.endResetModel()
+        
+    def _new_task(self, task_id: str, task_name: str, started_ms: int) -> TaskState:
+        """Get a pending task record, recycling a removed one when available."""
+        if self._free:
+            task = self._free.pop()
+            task.reset(task_id, task_name, started_ms)
+            return task
+        return TaskState(task_id, task_name, started_ms=started_ms)
+        
+    def _row_changed(self, row: int):
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+class TaskDelegate(QStyledItemDelegate):
+    """Paints a task row as a name/status line, a progress bar and a time/memory line."""
+    
+    ERROR_COLOR = QColor(255, 0, 0)
+    BAR_HEIGHT = 12
+    SPACING = 2
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        task = index.data(TaskModel.TaskRole)
+        style = option.widget.style() if option.widget is not None else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget)
+        
+        rect = option.rect.adjusted(5, 5, -5, -5)
+        line_height = option.fontMetrics.height()
+        top_line = rect.adjusted(0, 0, 0, line_height - rect.height())
+        bottom_line = rect.adjusted(0, rect.height() - line_height, 0, 0)
+        
+        # Progress bar; the lines around it carry all the text, so the bar
+        # skips its own text layout
+        bar = QStyleOptionProgressBar()
+        bar.rect = rect.adjusted(0, line_height + self.SPACING, 0, -line_height - self.SPACING)
+        bar.state = option.state
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = task.percent
+        bar.textVisible = False
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar, painter, option.widget)
+        
+        elapsed_s = task.elapsed_ms // 1000
+        painter.save()
+        painter.drawText(top_line, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, task.name)
+        painter.drawText(
+            bottom_line,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            f"Time: {elapsed_s // 60}:{elapsed_s % 60:02d}    Memory: {task.memory_mb:.1f} MB"
+        )
+        if task.error is not None:
+            painter.setPen(self.ERROR_COLOR)
+        painter.drawText(
+            top_line, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+            f"{task.status} {task.percent}%"
+        )
+        painter.restore()
+        
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        line_height = option.fontMetrics.height()
+        return QSize(option.rect.width(), 2 * line_height + self.BAR_HEIGHT + 2 * self.SPACING + 10)
 
 class BatchMonitorPanel(BaseControlPanel):
     """Panel for monitoring batch processing progress and metrics."""
@@ -75,11 +441,45 @@ class BatchMonitorPanel(BaseControlPanel):
     task_completed = pyqtSignal(str, dict)  # task_id, metrics
     error_occurred = pyqtSignal(str, ErrorInfo)  # task_id, error_info
     
+    UI_FLUSH_INTERVAL_MS = 16  # Producer updates are applied at most once per frame
+    MAX_FLUSH_INTERVAL_MS = 250  # Slowest flush rate when flushes overrun their interval
+    TASK_LAYOUT_BATCH_SIZE = 50  # Task rows laid out per event loop pass
+    
+    # Green, orange and red for usage below 60%, below 80% and above
+    _BAND_COLORS = ("#00ff00", "#ffa500", "#ff0000")
+    # Resource bar stylesheet for each band
+    _BAND_STYLES = tuple(
+        f"""
+            QProgressBar {{
+                border: 1px solid grey;
+                border-radius: 2px;
+                text-align: center;
+            }}
+            
+            QProgressBar::chunk {{
+                background-color: {color};
+            }}
+        """
+        for color in _BAND_COLORS
+    )
+    
     def __init__(self, error_handler: ErrorHandler, parent=None):
         self.error_handler = error_handler
-        self.task_widgets: Dict[str, TaskProgressWidget] = {}
+        # Latest state waiting to be applied to the models by _flush_ui
+        self._pending_progress: Dict[str, Tuple[int, str, Dict[str, float]]] = {}
+        self._pending_resources: Optional[Tuple[float, float]] = None
+        self._applied_resources: Optional[Tuple[float, float]] = None
+        self._progress_bands: Dict[QProgressBar, int] = {}  # Current style band per bar
         super().__init__(parent)
         
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.UI_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_ui)
+        self._flush_interval_ms = self.UI_FLUSH_INTERVAL_MS
+        self._flush_budget_timer = QElapsedTimer()
+        self._coalesced_updates = 0  # Task updates replaced before they were shown
+        
     def _init_ui(self):
         """Initialize the monitor interface."""
         super()._init_ui()
@@ -88,22 +488,26 @@ class BatchMonitorPanel(BaseControlPanel):
         tasks_group = QGroupBox("Active Tasks")
         tasks_layout = QVBoxLayout(tasks_group)
         
-        # Scrollable task area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        
-        self.tasks_container = QWidget()
-        self.tasks_layout = QVBoxLayout(self.tasks_container)
-        scroll.setWidget(self.tasks_container)
-        tasks_layout.addWidget(scroll)
+        # Task list; only visible rows are painted
+        self.task_model = TaskModel(self)
+        self.tasks_view = QListView()
+        self.tasks_view.setModel(self.task_model)
+        self.tasks_view.setItemDelegate(TaskDelegate(self.tasks_view))
+        self.tasks_view.setUniformItemSizes(True)
+        # Lay out large task lists in chunks between events rather than all at once
+        self.tasks_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.tasks_view.setBatchSize(self.TASK_LAYOUT_BATCH_SIZE)
+        self.tasks_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        tasks_layout.addWidget(self.tasks_view)
         
         # Metrics table
         metrics_group = QGroupBox("Batch Metrics")
         metrics_layout = QVBoxLayout(metrics_group)
         
-        self.metrics_table = QTableWidget(0, 3)  # Rows will be added dynamically
-        self.metrics_table.setHorizontalHeaderLabels(["Metric", "Current", "Average"])
+        self.metrics_model = MetricsModel(self)
+        self.metrics_table = QTableView()
+        self.metrics_table.setModel(self.metrics_model)
+        self.metrics_table.verticalHeader().hide()
         self.metrics_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         metrics_layout.addWidget(self.metrics_table)
         
@@ -116,6 +520,7 @@ class BatchMonitorPanel(BaseControlPanel):
         self.cpu_label = QLabel("CPU Usage")
         self.cpu_progress = QProgressBar()
         self.cpu_progress.setRange(0, 100)
+        self.cpu_progress.setTextVisible(False)  # cpu_label shows the percentage
         cpu_layout.addWidget(self.cpu_label)
         cpu_layout.addWidget(self.cpu_progress)
         resource_layout.addLayout(cpu_layout)
@@ -125,6 +530,7 @@ class BatchMonitorPanel(BaseControlPanel):
         self.memory_label = QLabel("Memory Usage")
         self.memory_progress = QProgressBar()
         self.memory_progress.setRange(0, 100)
+        self.memory_progress.setTextVisible(False)  # memory_label shows the percentage
         memory_layout.addWidget(self.memory_label)
         memory_layout.addWidget(self.memory_progress)
         resource_layout.addLayout(memory_layout)
@@ -136,63 +542,143 @@ class BatchMonitorPanel(BaseControlPanel):
         
     def add_task(self, task_id: str, task_name: str):
         """Add a new task to monitor."""
-        if task_id not in self.task_widgets:
-            task_widget = TaskProgressWidget(task_id, task_name)
-            self.task_widgets[task_id] = task_widget
-            self.tasks_layout.addWidget(task_widget)
+        self.task_model.add_task(task_id, task_name)
+        
+    def add_tasks(self, items: List[Tuple[str, str]]):
+        """Add several (task_id, task_name) tasks with a single row insertion."""
+        self.task_model.add_tasks(items)
             
     def update_task_progress(self, task_id: str, percentage: int, 
-                           status: str, metrics: Dict[str, Any]):
-        """Update progress for a specific task."""
-        if task_id in self.task_widgets:
-            self.task_widgets[task_id].update_progress(percentage, status, metrics)
-            self._update_batch_metrics(metrics)
+                           status: str, numeric_metrics: Dict[str, float],
+                           text_metrics: Optional[Dict[str, str]] = None):
+        """Update progress for a specific task.
+        
+        Numeric metrics are averaged in the metrics table; text metrics are
+        only displayed. Only the latest update per task is shown, on the next
+        UI flush. Non-numeric values passed as numeric metrics, such as a
+        status string, are shown as text metrics instead.
+        """
+        if self.task_model.has_task(task_id):
+            numeric_metrics, extra_text = MetricsModel.split_metrics(numeric_metrics)
+            if extra_text:
+                text_metrics = {**extra_text, **(text_metrics or {})}
+            if task_id in self._pending_progress:
+                self._coalesced_updates += 1
+            self._pending_progress[task_id] = (percentage, status, numeric_metrics)
+            self._update_batch_metrics(numeric_metrics, text_metrics)
+            self._schedule_flush()
             
     def set_task_error(self, task_id: str, error_info: ErrorInfo):
         """Set error state for a task."""
-        if task_id in self.task_widgets:
-            self.task_widgets[task_id].set_error(error_info)
+        if self.task_model.set_error(task_id, error_info.message):
+            # A queued progress update must not overwrite the error state
+            self._pending_progress.pop(task_id, None)
             self.error_occurred.emit(task_id, error_info)
             
     def remove_task(self, task_id: str):
         """Remove a completed task."""
-        if task_id in self.task_widgets:
-            self.task_widgets[task_id].deleteLater()
-            del self.task_widgets[task_id]
+        if self.task_model.remove_task(task_id):
+            self._pending_progress.pop(task_id, None)
+            
+    def remove_tasks(self, task_ids: List[str]):
+        """Remove several completed tasks at once."""
+        if self.task_model.remove_tasks(task_ids):
+            for task_id in task_ids:
+                self._pending_progress.pop(task_id, None)
             
-    def _update_batch_metrics(self, metrics: Dict[str, Any]):
+    def _update_batch_metrics(self, numeric_metrics: Dict[str, float],
+                              text_metrics: Optional[Dict[str, str]] = None):
         """Update the metrics table with new values."""
-        current_rows = self.metrics_table.rowCount()
-        
-        for i, (metric, value) in enumerate(metrics.items()):
-            if i >= current_rows:
-                self.metrics_table.insertRow(i)
-                self.metrics_table.setItem(i, 0, QTableWidgetItem(metric))
+        self.metrics_model.update_metrics(numeric_metrics)
+        if text_metrics:
+            self.metrics_model.update_text_metrics(text_metrics)
                 
-            # Update current value
-            current_item = QTableWidgetItem(f"{value:.4f}" if isinstance(value, float) else str(value))
-            self.metrics_table.setItem(i, 1, current_item)
-            
-            # Calculate and update average (if numeric)
-            try:
-                avg_item = self.metrics_table.item(i, 2)
-                if avg_item is None:
-                    avg_item = QTableWidgetItem("0")
-                    self.metrics_table.setItem(i, 2, avg_item)
-                    
-                current_avg = float(avg_item.text())
-                new_avg = (current_avg + float(value)) / 2
-                avg_item.setText(f"{new_avg:.4f}")
-            except (ValueError, TypeError):
-                pass
+    def update_batch_metrics_np(self, names: List[str], values: np.ndarray):
+        """Update the metrics table from a NumPy array of values parallel to names."""
+        self.metrics_model.update_metrics_array(names, values)
+        self._schedule_flush()
+        
+    @pyqtSlot(list, list, list)
+    def update_formatted_metrics(self, names: List[str], cur_text: List[str], avg_text: List[str]):
+        """Show metrics formatted on the producer's thread.
+        
+        Connected to the metrics_ready signal of batch workers, which format
+        their metrics in BaseWorker.report_metrics, so float formatting stays
+        off the GUI thread.
+        """
+        self.metrics_model.set_formatted_metrics(names, cur_text, avg_text)
+        self._schedule_flush()
+        
+    def _schedule_flush(self):
+        """Start the flush timer unless a flush is already due."""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+            
+    def _flush_ui(self):
+        """Apply all pending updates to the models and widgets in one pass."""
+        self._flush_budget_timer.start()
+        pending, self._pending_progress = self._pending_progress, {}
+        for task_id, (percentage, status, metrics) in pending.items():
+            self.task_model.update_task(task_id, percentage, status, metrics)
                 
+        self.metrics_model.flush()
+        
+        resources, self._pending_resources = self._pending_resources, None
+        if resources is not None and resources != self._applied_resources:
+            self._applied_resources = resources
+            self._apply_resource_usage(*resources)
+            
+        self._adapt_flush_interval(self._flush_budget_timer.elapsed())
+        
+    def _adapt_flush_interval(self, took_ms: int):
+        """Back off the flush rate while flushes overrun it, and recover afterwards."""
+        interval = self._flush_interval_ms
+        if took_ms > interval:
+            interval = min(self.MAX_FLUSH_INTERVAL_MS, interval * 2)
+            if interval != self._flush_interval_ms:
+                logger.warning(
+                    "UI flush took %d ms, backing off to %d ms (%d task updates coalesced)",
+                    took_ms, interval, self._coalesced_updates
+                )
+        elif took_ms <= interval // 2:
+            # Step back down only once a flush fits the shorter interval
+            interval = max(self.UI_FLUSH_INTERVAL_MS, interval // 2)
+        self._coalesced_updates = 0
+        if interval != self._flush_interval_ms:
+            self._flush_interval_ms = interval
+            self._flush_timer.setInterval(interval)
+            
     def update_resource_usage(self, cpu_percent: float, memory_percent: float):
-        """Update resource usage indicators."""
-        self.cpu_progress.setValue(int(cpu_percent))
-        self.memory_progress.setValue(int(memory_percent))
+        """Update resource usage indicators on the next UI flush."""
+        self._pending_resources = (cpu_percent, memory_percent)
+        self._schedule_flush()
         
-        self.cpu_label.setText(f"CPU Usage: {cpu_percent:.1f}%")
-        self.memory_label.setText(f"Memory Usage: {memory_percent:.1f}%")
+    def poll_resources(self, proc):
+        """Sample CPU and memory usage of a psutil.Process and show them.
+        
+        Callers should keep one Process instance and call this from a timer;
+        oneshot() makes both readings share a single pass over /proc.
+        """
+        with proc.oneshot():
+            cpu_percent = proc.cpu_percent(interval=0.0)
+            memory_percent = proc.memory_percent()
+        self.update_resource_usage(cpu_percent, memory_percent)
+        
+    def _apply_resource_usage(self, cpu_percent: float, memory_percent: float):
+        """Update resource usage indicators."""
+        # Setting an unchanged value still invalidates the widget, so skip it
+        cpu_value, memory_value = int(cpu_percent), int(memory_percent)
+        if cpu_value != self.cpu_progress.value():
+            self.cpu_progress.setValue(cpu_value)
+        if memory_value != self.memory_progress.value():
+            self.memory_progress.setValue(memory_value)
+            
+        cpu_text = f"CPU Usage: {cpu_percent:.1f}%"
+        if cpu_text != self.cpu_label.text():
+            self.cpu_label.setText(cpu_text)
+        memory_text = f"Memory Usage: {memory_percent:.1f}%"
+        if memory_text != self.memory_label.text():
+            self.memory_label.setText(memory_text)
         
         # Set color based on usage
         self._set_progress_color(self.cpu_progress, cpu_percent)
@@ -200,30 +686,16 @@ class BatchMonitorPanel(BaseControlPanel):
         
     def _set_progress_color(self, progress_bar: QProgressBar, value: float):
         """Set progress bar color based on value."""
-        if value < 60:
-            color = QColor(0, 255, 0)  # Green
-        elif value < 80:
-            color = QColor(255, 165, 0)  # Orange
-        else:
-            color = QColor(255, 0, 0)  # Red
-            
-        style = f"""
-            QProgressBar {{
-                border: 1px solid grey;
-                border-radius: 2px;
-                text-align: center;
-            }}
-            
-            QProgressBar::chunk {{
-                background-color: {color.name()};
-            }}
-        """
-        progress_bar.setStyleSheet(style)
+        band = 0 if value < 60 else 1 if value < 80 else 2
+        # Re-applying a stylesheet forces a reparse, so only do it on band changes
+        if self._progress_bands.get(progress_bar) == band:
+            return
+        self._progress_bands[progress_bar] = band
+        progress_bar.setStyleSheet(self._BAND_STYLES[band])
         
     def clear_all(self):
         """Clear all tasks and reset metrics."""
-        for task_id in list(self.task_widgets.keys()):
-            self.remove_task(task_id)
-            
-        self.metrics_table.setRowCount(0)
+        self._pending_progress.clear()
+        self.task_model.clear()
+        self.metrics_model.clear()
         self.update_resource_usage(0, 0)
\ No newline at end of file
@@ -22,17 +22,33 @@ from PyQt6.QtWidgets import (
     QPushButton, QProgressBar, QLabel, QSplitter,
     QCheckBox, QSpinBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker, QThreadPool
 from typing import Dict, Any, List, Optional, Tuple, Callable
+import itertools
+import json
+import logging
+import os
+import time
+import uuid
 import numpy as np
 
 from .base_panel import BaseControlPanel
 from .batch_configuration_panel import BatchConfigurationPanel
 from .batch_monitor_panel import BatchMonitorPanel
 from .result_comparison_panel import ResultComparisonPanel
-from ..error_handling import ErrorHandler, ErrorCategory, ErrorSeverity, ErrorInfo
+from ..error_handling import (
+    ErrorHandler, ErrorCategory, ErrorSeverity, ErrorInfo, ConfigurationError
+)
 from ..workers.base_worker import BaseWorker
-from ..visualization.batch_comparison_view import BatchComparisonView
+
+logger = logging.getLogger(__name__)
+
+def _safe_disconnect(signal, slot) -> None:
+    """Disconnect slot from signal, ignoring connections that are already gone."""
+    try:
+        signal.disconnect(slot)
+    except (TypeError, RuntimeError):
+        pass
 
 class BatchProcessingPanel(BaseControlPanel):
     """Main panel for batch processing ML workflows.
@@ -48,7 +64,7 @@ class BatchProcessingPanel(BaseControlPanel):
         
     Properties:
         is_running (bool): Whether batch processing is currently active
-        current_batch (Optional[Dict[str, Any]]): Current batch configuration
+        current_batch (Optional[Dict[str, Any]]): Configuration and id of the started batch
         workers (List[BaseWorker]): Active worker threads
     """
     
@@ -57,20 +73,71 @@ class BatchProcessingPanel(BaseControlPanel):
     batch_completed = pyqtSignal()
     batch_error = pyqtSignal(ErrorInfo)
     progress_updated = pyqtSignal(str, int)  # task_name, percentage
+    
+    PROGRESS_UI_INTERVAL_MS = 250  # Minimum time between progress repaints
+    PROGRESS_EMIT_INTERVAL_MS = 100  # Interval for forwarding progress to listeners
+    COMPLETION_FLUSH_INTERVAL_MS = 60  # Window for handling task completions together
+    WORKER_POLL_INTERVAL_MS = 50  # Interval for reading worker progress
+    
+    _batch_counter = itertools.count()  # Shared sequence for batch ids
 
     def __init__(self, error_handler: ErrorHandler, data_manager, parent=None):
         super().__init__(parent)
         self.error_handler = error_handler
         self.data_manager = data_manager
         self.current_batch: Optional[Dict[str, Any]] = None
+        # Latest edited configuration, not yet started as a batch
+        self._pending_config: Optional[Dict[str, Any]] = None
         self.workers: List[BaseWorker] = []
+        # Batch workers run on pooled threads, reused across batches
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(4, os.cpu_count() or 1))
+        # Timestamps for the comparison view, which compares them to wall-clock time
+        self._clock = time.time
         
         # Visualization update settings
         self.auto_update_enabled = True
         self.update_threshold = 5  # Minimum percentage change to trigger update
         self.last_update_progress = 0
-        self.update_buffer = []  # Buffer for data points between updates
+        self._current_progress = 0  # Latest overall progress, without asking the progress bar
         self.buffer_size = 100  # Maximum buffer size before forcing update
+        # Ring buffer for data points between updates, allocated on first use
+        # once the shape of a data point is known
+        self._ring: Optional[np.ndarray] = None
+        self._ring_write = 0  # Index the next data point is written to
+        self._ring_count = 0  # Number of valid data points in the ring
+        
+        # Progress repaint throttling
+        self._last_ui_update_ns = 0
+        self._pending_progress: Optional[Tuple[str, int]] = None
+        
+        # Latest (percentage, metrics) per task, forwarded by _flush_progress
+        self._progress_pending: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self.PROGRESS_EMIT_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+        # Completed (task_id, metrics) waiting for _flush_completions
+        self._completion_queue: List[Tuple[str, Dict[str, Any]]] = []
+        self._completion_timer = QTimer(self)
+        self._completion_timer.setSingleShot(True)
+        self._completion_timer.setInterval(self.COMPLETION_FLUSH_INTERVAL_MS)
+        self._completion_timer.timeout.connect(self._flush_completions)
+        
+        # Workers keep their progress for polling rather than emitting it
+        # across threads on every report
+        self._worker_poll_timer = QTimer(self)
+        self._worker_poll_timer.setInterval(self.WORKER_POLL_INTERVAL_MS)
+        self._worker_poll_timer.timeout.connect(self._poll_workers)
+        
+        # Configuration of the running batch, for caching its results on completion
+        self._uncached_config: Optional[Dict[str, Any]] = None
+        # Results of every task of the running batch, merged in completion order
+        self._run_results: Dict[str, Any] = {}
+        
+        # (config key, result) of the last _validate_batch_config run
+        self._validation_cache: Tuple[Optional[int], Tuple[bool, Optional[str]]] = (None, (False, None))
         
         # Connect to data manager signals
         self.data_manager.signals.batch_started.connect(self._on_batch_started)
@@ -139,7 +206,9 @@ class BatchProcessingPanel(BaseControlPanel):
         self.results_panel.export_requested.connect(self._on_export_requested)
         visualization_splitter.addWidget(self.results_panel)
         
-        # Batch comparison view
+        # Batch comparison view, imported here so that importing this module
+        # does not load the comparison view until a panel is built
+        from ..visualization.batch_comparison_view import BatchComparisonView
         self.comparison_view = BatchComparisonView(update_rate=5)  # 5 Hz update rate
         self.comparison_view.batch_selection_changed.connect(self._on_batch_selected)
         self.comparison_view.update_rate_changed.connect(self._on_update_rate_changed)
@@ -201,23 +270,45 @@ class BatchProcessingPanel(BaseControlPanel):
             ProcessingError: If worker initialization fails
         """
         try:
-            # Validate configuration before starting
-            if not self._validate_batch_config():
-                return
-            
+            # Fetch the configuration once for validation and worker setup
             config = self.config_panel.get_configuration()
-            batch_id = f"batch_{int(time.time())}"
+            
+            # Validate configuration before starting; the error handler reports why it failed
+            is_valid, error_message = self._validate_batch_config(config)
+            if not is_valid:
+                raise ConfigurationError(error_message or "Invalid batch configuration")
+            
+            batch_id = f"batch_{next(self._batch_counter)}_{uuid.uuid4().hex[:8]}"
+            
+            self.current_batch = {'id': batch_id, **config}
             
             # Start batch through data manager
+            cached_results = self.data_manager.get_cached_batch_results(config)
             self.data_manager.start_batch_processing(batch_id, config)
             
-            self.start_button.setEnabled(False)
-            self.pause_button.setEnabled(True)
-            self.stop_button.setEnabled(True)
+            self._run_results = {}
+            self._uncached_config = None if cached_results is not None else config
             
-            # Initialize batch processing
-            self._initialize_batch()
+            with self._suspend_updates():
+                self.start_button.setEnabled(False)
+                self.pause_button.setEnabled(True)
+                self.stop_button.setEnabled(True)
+                
+                if cached_results is not None:
+                    # Same configuration and data as an earlier run: its results
+                    # complete this batch through the same path as a real task
+                    self._complete_from_cache(f"{batch_id}_cached", cached_results)
+                else:
+                    # Initialize batch processing
+                    self._initialize_batch(config)
             
+        except ConfigurationError as e:
+            self.error_handler.handle_error(
+                e,
+                ErrorSeverity.ERROR,
+                ErrorCategory.CONFIGURATION,
+                ["Check batch configuration", "Verify data paths"]
+            )
         except Exception as e:
             self.error_handler.handle_error(
                 e,
@@ -226,6 +317,16 @@ class BatchProcessingPanel(BaseControlPanel):
                 ["Check batch configuration", "Verify data paths"]
             )
 
+    def _complete_from_cache(self, task_id: str, results: Dict[str, Any]) -> None:
+        """Show cached batch results as a single task that completes right away."""
+        numeric_metrics = {
+            name: float(value) for name, value in results.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        }
+        self.monitor_panel.add_task(task_id, "Cached results")
+        self.monitor_panel.update_task_progress(task_id, 100, "Cached", numeric_metrics)
+        self._on_task_completed(task_id, results)
+        
     def _pause_batch(self) -> None:
         """Pause current batch processing.
         
@@ -242,14 +343,23 @@ class BatchProcessingPanel(BaseControlPanel):
         Terminates all active workers and resets the UI state.
         Any incomplete tasks will be abandoned.
         """
+        # Drop runs still waiting for a pooled thread
+        self._pool.clear()
+        self._worker_poll_timer.stop()
         for worker in self.workers:
             worker.stop()
+        # A stopped run has only partial results, which must not be cached
+        self._uncached_config = None
+        self._run_results = {}
         self._reset_ui()
         self.status_label.setText("Stopped")
 
-    def _validate_batch_config(self) -> Tuple[bool, Optional[str]]:
+    def _validate_batch_config(self, config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """Validate batch configuration before starting.
         
+        Args:
+            config: Batch configuration to validate
+            
         Returns:
             Tuple[bool, Optional[str]]: (is_valid, error_message)
             
@@ -258,10 +368,24 @@ class BatchProcessingPanel(BaseControlPanel):
             - Model configuration is complete
             - Processing parameters are within valid ranges
             - Resource requirements can be met
+            
+        The result is cached and reused while the configuration is unchanged.
         """
         try:
-            config = self.config_panel.get_configuration()
+            key = hash(json.dumps(config, sort_keys=True, default=str))
+        except Exception as e:
+            return False, str(e)
             
+        if key == self._validation_cache[0]:
+            return self._validation_cache[1]
+            
+        result = self._check_batch_config(config)
+        self._validation_cache = (key, result)
+        return result
+        
+    def _check_batch_config(self, config: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """Run the batch configuration checks for _validate_batch_config."""
+        try:
             # Validate dataset configuration
             if not config["dataset_paths"]:
                 return False, "No dataset files selected"
@@ -279,28 +403,59 @@ class BatchProcessingPanel(BaseControlPanel):
         except Exception as e:
             return False, str(e)
 
-    def _initialize_batch(self) -> None:
+    MODEL_CONFIG_KEYS = ("batch_size", "epochs", "learning_rate")
+    PROCESSING_CONFIG_KEYS = ("window_size", "overlap")
+    
+    def _validate_model_config(self, config: Dict[str, Any]) -> bool:
+        """Check the model settings in config against the configuration panel rules."""
+        return self._config_rules_pass(config, self.MODEL_CONFIG_KEYS)
+        
+    def _validate_processing_params(self, config: Dict[str, Any]) -> bool:
+        """Check the processing settings in config against the configuration panel rules."""
+        return self._config_rules_pass(config, self.PROCESSING_CONFIG_KEYS)
+        
+    @staticmethod
+    def _config_rules_pass(config: Dict[str, Any], keys: Tuple[str, ...]) -> bool:
+        """Whether every key of config in keys satisfies its BatchConfigurationPanel rule."""
+        rules = dict(BatchConfigurationPanel.VALIDATION_RULES)
+        return all(
+            rules[key].condition(config[key])
+            for key in keys
+            if key in config and key in rules
+        )
+
+    def _initialize_batch(self, config: Dict[str, Any]) -> None:
         """Initialize batch processing workers and start execution.
         
+        Args:
+            config: Batch configuration the workers are set up from
+        
         Sets up worker threads for:
         - Data loading and preprocessing
         - Model training
         - Evaluation and metrics collection
         
-        Each worker is configured based on the current batch configuration
-        and connected to appropriate progress and error handling signals.
+        Each setup helper returns its worker configured from the current
+        batch configuration; _add_worker registers it for progress polling
+        and completion handling.
         """
         try:
-            config = self.config_panel.get_configuration()
-            
             # Initialize workers based on configuration
-            self._setup_data_worker(config)
-            self._setup_training_worker(config)
-            self._setup_evaluation_worker(config)
+            new_workers = [
+                setup(config) for setup in (
+                    self._setup_data_worker,
+                    self._setup_training_worker,
+                    self._setup_evaluation_worker
+                )
+            ]
+            for worker in new_workers:
+                self._add_worker(worker)
             
             # Start processing
-            for worker in self.workers:
-                worker.start()
+            for worker in new_workers:
+                worker.start_in_pool(self._pool)
+            if new_workers:
+                self._worker_poll_timer.start()
                 
         except Exception as e:
             self.error_handler.handle_error(
@@ -310,6 +465,29 @@ class BatchProcessingPanel(BaseControlPanel):
                 ["Check worker initialization", "Verify resource availability"]
             )
 
+    def _add_worker(self, worker: BaseWorker) -> None:
+        """Register a batch worker whose progress is polled by _poll_workers."""
+        worker.enable_progress_polling()
+        worker.completed.connect(self._on_task_completed)
+        # Metrics arrive already formatted by the worker
+        worker.metrics_ready.connect(self.monitor_panel.update_formatted_metrics)
+        self.workers.append(worker)
+        
+    def _poll_workers(self) -> None:
+        """Route the latest progress of each worker to _update_progress."""
+        # Checked before taking progress, so a report made just before a
+        # worker finishes is still picked up
+        running = any(worker.is_active() for worker in self.workers)
+        for worker in self.workers:
+            progress = worker.take_progress()
+            if progress is not None:
+                value, message = progress
+                self._update_progress(message or worker.operation_type, value)
+                
+        # Nothing left to report once every worker has finished
+        if not running:
+            self._worker_poll_timer.stop()
+            
     def _reset_ui(self) -> None:
         """Reset UI to initial state.
         
@@ -319,12 +497,14 @@ class BatchProcessingPanel(BaseControlPanel):
         - Resets status messages
         - Maintains any completed results
         """
-        self.start_button.setEnabled(True)
-        self.pause_button.setEnabled(False)
-        self.stop_button.setEnabled(False)
-        self.progress_bar.setValue(0)
-        self.status_label.setText("Ready")
-
+        with self._suspend_updates():
+            self.start_button.setEnabled(True)
+            self.pause_button.setEnabled(False)
+            self.stop_button.setEnabled(False)
+            self.progress_bar.setValue(0)
+            self._current_progress = 0
+            self.status_label.setText("Ready")
+            
     def _update_progress(self, task_name: str, percentage: int, metrics: Dict[str, Any] = None, data: Optional[np.ndarray] = None) -> None:
         """Update progress bar and status label.
         
@@ -332,27 +512,70 @@ class BatchProcessingPanel(BaseControlPanel):
             task_name: Name or description of the current task
             percentage: Progress percentage (0-100)
             metrics: Optional performance metrics
+            data: Optional new data points for the comparison view
             
         Updates both the overall progress bar and individual task
-        progress in the monitor panel.
+        progress in the monitor panel. Updates arriving within
+        PROGRESS_UI_INTERVAL_MS of the last one are held back and only the
+        latest is applied; completion (100%) is always applied immediately.
+        
+        progress_updated and the data manager receive the latest update per
+        task every PROGRESS_EMIT_INTERVAL_MS, or immediately on completion.
         """
+        # Data points are forwarded as they arrive, dropping them would lose samples
+        if data is not None and self.current_batch:
+            # The comparison view gets float32 data like the ring buffer's;
+            # no copy is made when data already is contiguous float32
+            data = np.ascontiguousarray(data, dtype=np.float32)
+            self.comparison_view.update_batch_data(
+                self.current_batch['id'],
+                data,
+                self._clock()
+            )
+            
+        self._current_progress = percentage
+        self._progress_pending[task_name] = (percentage, metrics or {})
+        if percentage >= 100:
+            self._flush_progress()
+        elif not self._progress_timer.isActive():
+            self._progress_timer.start()
+            
+        now = time.monotonic_ns()
+        if percentage < 100 and now - self._last_ui_update_ns < self.PROGRESS_UI_INTERVAL_MS * 1_000_000:
+            if self._pending_progress is None:
+                QTimer.singleShot(self.PROGRESS_UI_INTERVAL_MS, self._flush_pending_progress)
+            self._pending_progress = (task_name, percentage)
+            return
+            
+        self._pending_progress = None
+        self._last_ui_update_ns = now
+        self._apply_progress(task_name, percentage)
+        
+    def _flush_pending_progress(self) -> None:
+        """Apply the latest progress update held back by _update_progress."""
+        if self._pending_progress is None:
+            return
+        pending, self._pending_progress = self._pending_progress, None
+        self._last_ui_update_ns = time.monotonic_ns()
+        self._apply_progress(*pending)
+        
+    def _apply_progress(self, task_name: str, percentage: int) -> None:
+        """Show a progress update in the progress bar and status label."""
         self.progress_bar.setValue(percentage)
         self.status_label.setText(f"Processing: {task_name}")
-        self.progress_updated.emit(task_name, percentage)
         
-        if self.current_batch:
-            self.data_manager.update_batch_progress(
-                self.current_batch['id'],
-                percentage,
-                metrics or {}
-            )
+    def _flush_progress(self) -> None:
+        """Forward the latest pending progress of each task to listeners and the data manager."""
+        self._progress_timer.stop()
+        pending, self._progress_pending = self._progress_pending, {}
+        for task_name, (percentage, metrics) in pending.items():
+            self.progress_updated.emit(task_name, percentage)
             
-            # Update visualization if data is provided
-            if data is not None:
-                self.comparison_view.update_batch_data(
+            if self.current_batch:
+                self.data_manager.update_batch_progress(
                     self.current_batch['id'],
-                    data,
-                    time.time()
+                    percentage,
+                    metrics
                 )
 
     def _on_config_changed(self, config: Dict[str, Any]) -> None:
@@ -361,10 +584,13 @@ class BatchProcessingPanel(BaseControlPanel):
         Args:
             config: Updated configuration dictionary
             
-        Updates internal state and validates new configuration.
+        Updates internal state and validates new configuration. The
+        active batch in current_batch is left alone until _start_batch.
         """
-        self.current_batch = config
-        is_valid, _ = self._validate_batch_config()
+        if config == self._pending_config:
+            return
+        self._pending_config = dict(config)
+        is_valid, _ = self._validate_batch_config(config)
         self.start_button.setEnabled(is_valid)
 
     def _on_task_completed(self, task_id: str, metrics: Dict[str, Any]) -> None:
@@ -375,22 +601,65 @@ class BatchProcessingPanel(BaseControlPanel):
             metrics: Performance metrics and results
             
         Updates results panel, visualization, and progress tracking.
+        Completions arriving within COMPLETION_FLUSH_INTERVAL_MS of each
+        other are handled together by _flush_completions.
         """
-        self.results_panel.update_results(metrics)
-        self.monitor_panel.remove_task(task_id)
-        
-        if self.current_batch:
-            batch_id = self.current_batch['id']
+        self._completion_queue.append((task_id, metrics))
+        if not self._completion_timer.isActive():
+            self._completion_timer.start()
             
-            # Update visualization with final results
+    def _flush_completions(self) -> None:
+        """Apply all queued task completions with a single repaint."""
+        self._completion_timer.stop()
+        if not self._completion_queue:
+            return
+        completed, self._completion_queue = self._completion_queue, []
+        
+        # Each of these targets replaces its previous results, so merging
+        # in completion order gives the same end state as one call per task
+        merged: Dict[str, Any] = {}
+        final_data: Optional[Dict[str, Any]] = None
+        for _, metrics in completed:
+            merged.update(metrics)
             if 'data' in metrics:
-                self.comparison_view.set_data(
-                    metrics['data'],
-                    metrics.get('time'),
-                    batch_id
-                )
+                final_data = metrics
+                
+        with self._suspend_updates():
+            self.results_panel.update_results(merged)
+            self.monitor_panel.remove_tasks([task_id for task_id, _ in completed])
             
-            self.data_manager.complete_batch_processing(batch_id, metrics)
+            if self.current_batch:
+                batch_id = self.current_batch['id']
+                
+                # Update visualization with final results; cached results
+                # hold plain lists, as they were read back from JSON
+                if final_data is not None:
+                    time_values = final_data.get('time')
+                    self.comparison_view.set_data(
+                        np.asarray(final_data['data']),
+                        None if time_values is None else np.asarray(time_values),
+                        batch_id
+                    )
+                
+                self._run_results.update(merged)
+                if self._batch_finished():
+                    self._finish_batch()
+                    
+    def _batch_finished(self) -> bool:
+        """Whether the last worker has finished and its completions have been flushed."""
+        return not self._completion_queue and not any(worker.is_active() for worker in self.workers)
+        
+    def _finish_batch(self) -> None:
+        """Complete the running batch with the merged results of all of its tasks.
+        
+        The results are cached for later runs with the same configuration
+        unless they were themselves read from the cache.
+        """
+        results, self._run_results = self._run_results, {}
+        if self._uncached_config is not None:
+            self.data_manager.cache_batch_results(self._uncached_config, results)
+            self._uncached_config = None
+        self.data_manager.complete_batch_processing(self.current_batch['id'], results)
 
     def _on_task_error(self, task_id: str, error_info: ErrorInfo) -> None:
         """Handle task errors.
@@ -439,20 +708,36 @@ class BatchProcessingPanel(BaseControlPanel):
         - Disconnects signals
         - Cleans up visualization resources
         - Releases memory buffers
+        
+        Safe to call more than once; later calls do nothing.
         """
+        if getattr(self, "_cleaned_up", False):
+            return
+        self._cleaned_up = True
+        
         # Stop processing
         self._stop_batch()
+        self._progress_timer.stop()
+        self._progress_pending.clear()
+        self._completion_timer.stop()
+        self._completion_queue.clear()
+        self._worker_poll_timer.stop()
         
         # Clean up workers
         for worker in self.workers:
-            worker.cleanup()
+            # One failing worker must not keep the others from being cleaned up
+            try:
+                worker.cleanup()
+            except Exception:
+                logger.exception("Worker cleanup failed")
         self.workers.clear()
         
         # Disconnect data manager signals
-        self.data_manager.signals.batch_started.disconnect(self._on_batch_started)
-        self.data_manager.signals.batch_progress.disconnect(self._on_batch_progress)
-        self.data_manager.signals.batch_completed.disconnect(self._on_batch_completed)
-        self.data_manager.signals.batch_error.disconnect(self._on_batch_error)
+        signals = self.data_manager.signals
+        _safe_disconnect(signals.batch_started, self._on_batch_started)
+        _safe_disconnect(signals.batch_progress, self._on_batch_progress)
+        _safe_disconnect(signals.batch_completed, self._on_batch_completed)
+        _safe_disconnect(signals.batch_error, self._on_batch_error)
         
         # Clean up panels
         self.config_panel.cleanup()
@@ -461,8 +746,12 @@ class BatchProcessingPanel(BaseControlPanel):
         self.comparison_view.cleanup()
         
         # Clear buffers and state
-        self.update_buffer.clear()
+        self._ring = None
+        self._ring_write = 0
+        self._ring_count = 0
+        self._validation_cache = (None, (False, None))
         self.current_batch = None
+        self._pending_config = None
         
         # Call base class cleanup
         super().cleanup()
@@ -479,13 +768,14 @@ class BatchProcessingPanel(BaseControlPanel):
     def _on_batch_completed(self, batch_id: str, results: Dict[str, Any]) -> None:
         """Handle batch completion notification from data manager."""
         self.batch_completed.emit()
-        self.results_panel.update_results(results)
-        self._reset_ui()
+        with self._suspend_updates():
+            self.results_panel.update_results(results)
+            self._reset_ui()
         
     def _on_batch_selected(self, batch_id: str):
         """Handle batch selection in comparison view."""
-        if batch_id in self.data_manager.batch_results:
-            results = self.data_manager.get_batch_results(batch_id)
+        results = self.data_manager.get_batch_results(batch_id)
+        if results is not None:
             self.results_panel.update_results(results)
             
     def _on_update_rate_changed(self, rate: int):
@@ -501,41 +791,99 @@ class BatchProcessingPanel(BaseControlPanel):
         """
         if not self.auto_update_enabled:
             # Buffer data for manual update
-            self.update_buffer.extend(data)
-            if len(self.update_buffer) >= self.buffer_size:
+            self._buffer_samples(data)
+            if self._ring_count >= self.buffer_size:
                 self._force_visualization_update()
             return
             
-        progress_delta = abs(self.progress_bar.value() - self.last_update_progress)
-        
         # Check if update is needed
         should_update = (
-            progress_delta >= self.update_threshold or
-            len(self.update_buffer) >= self.buffer_size
+            self._ring_count >= self.buffer_size or
+            abs(self._current_progress - self.last_update_progress) >= self.update_threshold
         )
         
+        if should_update and not self._ring_count and self.current_batch:
+            # Nothing buffered, so the data can go straight to the view
+            self._send_visualization_data(np.ascontiguousarray(data, dtype=np.float32))
+            return
+            
         # Buffer the data
-        self.update_buffer.extend(data)
+        self._buffer_samples(data)
         
         if should_update:
             self._force_visualization_update()
             
+    def _buffer_samples(self, data: np.ndarray) -> None:
+        """Copy data points into the ring buffer, overwriting the oldest when full."""
+        # No dtype here: an ndarray is used as is and cast to float32 by the
+        # slice assignment below, rather than copied twice
+        data = np.asarray(data)
+        if data.ndim == 0:
+            data = data.reshape(1)
+        # Called for every data update, so the ring is read into a local once
+        ring = self._ring
+        if ring is None or ring.shape[1:] != data.shape[1:]:
+            ring = self._ring = np.empty((self.buffer_size,) + data.shape[1:], dtype=np.float32)
+            self._ring_write = 0
+            self._ring_count = 0
+            
+        capacity = len(ring)
+        n = len(data)
+        if n >= capacity:
+            # Only the newest data points fit
+            ring[:] = data[n - capacity:]
+            self._ring_write = 0
+            self._ring_count = capacity
+            return
+            
+        start = self._ring_write
+        end = start + n
+        if end <= capacity:
+            ring[start:end] = data
+        else:
+            split = capacity - start
+            ring[start:] = data[:split]
+            ring[:end - capacity] = data[split:]
+        self._ring_write = end % capacity
+        self._ring_count = min(capacity, self._ring_count + n)
+        
+    def _buffered_samples(self) -> np.ndarray:
+        """Get the buffered data points, oldest first.
+        
+        Returns a view of the ring unless the data wraps around its end.
+        """
+        write, count = self._ring_write, self._ring_count
+        if write >= count:
+            return self._ring[write - count:write]
+        return np.concatenate((self._ring[write - count:], self._ring[:write]))
+        
     def _force_visualization_update(self) -> None:
         """Force visualization update with current buffer."""
-        if not self.update_buffer:
+        if not self._ring_count:
             return
             
         if self.current_batch:
-            # Update visualization with buffered data
-            self.comparison_view.update_batch_data(
-                self.current_batch['id'],
-                np.array(self.update_buffer),
-                time.time()
-            )
+            # Update visualization with buffered data, sending wrapped data as
+            # two views in order instead of copying it into one array
+            write, count = self._ring_write, self._ring_count
+            if write >= count:
+                self._send_visualization_data(self._ring[write - count:write])
+            else:
+                self._send_visualization_data(self._ring[write - count:])
+                self._send_visualization_data(self._ring[:write])
+                
+            # Clear buffer by resetting the indices; the ring is reused
+            self._ring_write = 0
+            self._ring_count = 0
             
-            # Clear buffer and update progress tracking
-            self.update_buffer = []
-            self.last_update_progress = self.progress_bar.value()
+    def _send_visualization_data(self, data: np.ndarray) -> None:
+        """Pass data points to the comparison view and update progress tracking."""
+        self.comparison_view.update_batch_data(
+            self.current_batch['id'],
+            data,
+            self._clock()
+        )
+        self.last_update_progress = self._current_progress
             
     def _adjust_update_parameters(self, update_rate: int) -> None:
         """Adjust update parameters based on update rate.
@@ -543,19 +891,24 @@ class BatchProcessingPanel(BaseControlPanel):
         Args:
             update_rate: New update rate in Hz
         """
+        # Spin boxes are synced with signals blocked so their change handlers
+        # do not run again for values set here
+        
         # Adjust threshold based on update rate
         self.update_threshold = max(1, int(100 / (update_rate * 2)))
-        self.threshold_spin.setValue(self.update_threshold)
+        with QSignalBlocker(self.threshold_spin):
+            self.threshold_spin.setValue(self.update_threshold)
         
         # Adjust buffer size based on update rate
-        self.buffer_size = max(10, int(update_rate * 10))  # 10 seconds worth of data
-        self.buffer_spin.setValue(self.buffer_size)
+        self._set_buffer_size(max(10, int(update_rate * 10)))  # 10 seconds worth of data
+        with QSignalBlocker(self.buffer_spin):
+            self.buffer_spin.setValue(self.buffer_size)
         
     def _on_auto_update_toggled(self, enabled: bool) -> None:
         """Handle auto-update toggle."""
         self.auto_update_enabled = enabled
         self.threshold_spin.setEnabled(enabled)
-        if enabled and self.update_buffer:
+        if enabled and self._ring_count:
             self._force_visualization_update()
             
     def _on_threshold_changed(self, value: int) -> None:
@@ -564,9 +917,24 @@ class BatchProcessingPanel(BaseControlPanel):
         
     def _on_buffer_size_changed(self, size: int) -> None:
         """Handle buffer size change."""
+        self._set_buffer_size(size)
+        if self._ring_count >= size:
+            self._force_visualization_update()
+            
+    def _set_buffer_size(self, size: int) -> None:
+        """Resize the ring buffer, keeping the newest data points that still fit."""
         self.buffer_size = size
-        if len(self.update_buffer) >= size:
+        if self._ring is None or len(self._ring) == size:
+            return
+        if self._ring_count > size:
+            # Send the buffered data rather than drop what no longer fits
             self._force_visualization_update()
+            
+        samples = self._buffered_samples()[-size:]
+        self._ring = np.empty((size,) + self._ring.shape[1:], dtype=np.float32)
+        self._ring[:len(samples)] = samples
+        self._ring_count = len(samples)
+        self._ring_write = self._ring_count % size
         
     def _on_batch_error(self, batch_id: str, error_message: str) -> None:
         """Handle batch error notification from data manager."""
@@ -2,19 +2,71 @@ from PyQt6.QtWidgets import (
     QVBoxLayout, QLabel, QPushButton, QWidget, QFileDialog,
     QHBoxLayout, QLineEdit, QGroupBox, QFormLayout, QListWidget, QListWidgetItem
 )
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QThreadPool, QTimer
+import logging
+import math
+import os
+import re
+import numpy as np
 from ui.panels.base_panel import BaseControlPanel, NumericParameter, SliderParameter, BoolParameter, EnumParameter
+from ui.workers.data_loader_worker import DataLoaderWorker, AugmentWorker, load_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPLIT_RATIOS = (0.7, 0.2, 0.1)
+
+def default_split_ratios() -> np.ndarray:
+    """
+    Train/test/validation ratios to start from, read from the BIOSIGNAL_SPLIT_RATIO
+    environment variable (e.g. "80/10/10" or "0.8,0.1,0.1") and normalized to sum to 1.
+    Falls back to 70/20/10 when it is unset or invalid.
+    """
+    value = os.environ.get("BIOSIGNAL_SPLIT_RATIO")
+    if value:
+        try:
+            ratios = np.array([float(part) for part in re.split(r"[/,:]", value)])
+            if ratios.shape == (3,) and (ratios >= 0).all() and ratios.sum() > 0:
+                return ratios / ratios.sum()
+        except ValueError:
+            pass
+        logger.warning("Ignoring invalid BIOSIGNAL_SPLIT_RATIO: %r", value)
+    return np.array(DEFAULT_SPLIT_RATIOS)
 
 class DataLoaderPanel(BaseControlPanel):
     data_loaded = pyqtSignal(str) # Emits path of loaded data
     data_split_requested = pyqtSignal(float, float, float) # train, test, val ratios
     data_augmentation_requested = pyqtSignal(dict) # augmentation parameters
     labels_updated = pyqtSignal(list) # list of labels
+    status_message = pyqtSignal(str) # text for the load status line
+    
+    STATUS_UPDATE_INTERVAL_MS = 50 # Coalescing window for the status line
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
         self.loaded_file_path = ""
+        self.loaded_data = None # Array read by the last completed load
+        self._load_worker = None
+        self._augment_worker = None
+        self._last_augmented = None # Array produced by the last completed augmentation
+        self._rng = np.random.default_rng() # Shared by augmentations, which run one at a time
+        self._h5_tree = {} # Object path -> type name of the last loaded HDF5 file
+        self._labels = [] # Mirror of the label list widget's texts
+        
+        # The status line shows the latest message, at most once per interval
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(self.STATUS_UPDATE_INTERVAL_MS)
+        self._status_timer.timeout.connect(self._flush_status)
+        self.status_message.connect(self._queue_status)
+        
+        # Label edits emit labels_updated once per burst, from the event loop
+        self._labels_dirty = False
+        self._labels_timer = QTimer(self)
+        self._labels_timer.setSingleShot(True)
+        self._labels_timer.setInterval(0)
+        self._labels_timer.timeout.connect(self._emit_labels)
 
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
@@ -37,22 +89,26 @@ class DataLoaderPanel(BaseControlPanel):
         self.load_button = QPushButton("Load Data", self)
         self.load_button.clicked.connect(self._load_data)
         data_loading_layout.addWidget(self.load_button)
+
+        self.load_status_label = QLabel(self)
+        data_loading_layout.addWidget(self.load_status_label)
         main_layout.addWidget(data_loading_group)
 
         # 2. Data Splitting Controls
         data_splitting_group = QGroupBox("Data Splitting")
         data_splitting_layout = QFormLayout(data_splitting_group)
+        train_default, test_default, val_default = default_split_ratios()
 
         self.train_ratio_param = SliderParameter("train_ratio", 0.0, 1.0, 0.01, 2)
-        self.train_ratio_param.set_value(0.7)
+        self.train_ratio_param.set_value(train_default)
         data_splitting_layout.addRow("Train Ratio:", self.train_ratio_param)
 
         self.test_ratio_param = SliderParameter("test_ratio", 0.0, 1.0, 0.01, 2)
-        self.test_ratio_param.set_value(0.2)
+        self.test_ratio_param.set_value(test_default)
         data_splitting_layout.addRow("Test Ratio:", self.test_ratio_param)
 
         self.val_ratio_param = SliderParameter("val_ratio", 0.0, 1.0, 0.01, 2)
-        self.val_ratio_param.set_value(0.1)
+        self.val_ratio_param.set_value(val_default)
         data_splitting_layout.addRow("Validation Ratio:", self.val_ratio_param)
 
         self.split_button = QPushButton("Apply Split", self)
@@ -91,39 +147,84 @@ class DataLoaderPanel(BaseControlPanel):
 
     def _browse_file(self):
         file_dialog = QFileDialog(self)
-        file_path, _ = file_dialog.getOpenFileName(self, "Select Data File", "", "All Files (*);;HDF5 Files (*.h5);;CSV Files (*.csv)")
+        file_path, _ = file_dialog.getOpenFileName(self, "Select Data File", "", "HDF5 Files (*.h5 *.hdf5);;CSV Files (*.csv);;All Files (*)")
         if file_path:
             self.file_path_input.setText(file_path)
             self.loaded_file_path = file_path
 
     def _load_data(self):
         if self.loaded_file_path:
-            print(f"Attempting to load data from: {self.loaded_file_path}")
-            self.data_loaded.emit(self.loaded_file_path)
+            logger.debug("Attempting to load data from: %s", self.loaded_file_path)
+            # Read the file off the GUI thread; data_loaded is emitted once it is in memory
+            worker = DataLoaderWorker(self.loaded_file_path)
+            worker.signals.finished.connect(self._on_load_finished, Qt.ConnectionType.QueuedConnection)
+            worker.signals.error.connect(self._on_load_error, Qt.ConnectionType.QueuedConnection)
+            self._load_worker = worker # Keep a reference until it reports back
+            self.load_button.setEnabled(False)
+            self.status_message.emit("Loading...")
+            QThreadPool.globalInstance().start(worker)
+        else:
+            logger.warning("No file selected to load.")
+            self.status_message.emit("No file selected")
+
+    def _on_load_finished(self, file_path: str, num_samples: int):
+        worker = self._load_worker
+        self.loaded_data = worker.data
+        self._h5_tree = worker.tree
+        self._load_worker = None
+        self.load_button.setEnabled(True)
+        if worker.from_memory:
+            self.status_message.emit("Loaded from memory cache")
+        elif worker.used_cache:
+            self.status_message.emit("Cached HDF5 copy used")
         else:
-            print("No file selected to load.")
+            self.status_message.emit("Loaded")
+        self.on_data_loaded_success(file_path, num_samples)
+        self.data_loaded.emit(file_path)
+
+    def _on_load_error(self, message: str):
+        self._load_worker = None
+        self.load_button.setEnabled(True)
+        self.status_message.emit("Load failed")
+        logger.error("Error loading data: %s", message)
+
+    def get_available_signals(self) -> list:
+        """
+        Paths of the datasets in the last loaded HDF5 file, without reopening it.
+        """
+        return [name for name, kind in self._h5_tree.items() if kind == 'Dataset']
+
+    def _queue_status(self, message: str):
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        if self._pending_status is not None:
+            self.load_status_label.setText(self._pending_status)
+            self._pending_status = None
+
+    def clear_load_cache(self):
+        """
+        Drop every array kept in memory by previous loads.
+        """
+        load_cache.clear()
 
     def _apply_split(self):
-        train_ratio = self.train_ratio_param.get_value()
-        test_ratio = self.test_ratio_param.get_value()
-        val_ratio = self.val_ratio_param.get_value()
-        total_ratio = train_ratio + test_ratio + val_ratio
-        if abs(total_ratio - 1.0) > 1e-6:
-            print(f"Warning: Split ratios do not sum to 1.0 (current sum: {total_ratio:.2f}). Adjusting...")
-            # Simple normalization if they don't sum to 1
-            if total_ratio > 0:
-                train_ratio /= total_ratio
-                test_ratio /= total_ratio
-                val_ratio /= total_ratio
-                self.train_ratio_param.set_value(train_ratio)
-                self.test_ratio_param.set_value(test_ratio)
-                self.val_ratio_param.set_value(val_ratio)
-                print(f"Adjusted ratios: Train={train_ratio:.2f}, Test={test_ratio:.2f}, Val={val_ratio:.2f}")
-            else:
-                print("Error: All split ratios are zero.")
-                return
-
-        print(f"Applying data split: Train={train_ratio:.2f}, Test={test_ratio:.2f}, Val={val_ratio:.2f}")
+        ratio_params = (self.train_ratio_param, self.test_ratio_param, self.val_ratio_param)
+        ratios = np.maximum([param.get_value() for param in ratio_params], 0.0)
+        total_ratio = ratios.sum()
+        if not math.isclose(total_ratio, 1.0, abs_tol=1e-6):
+            logger.info("Split ratios sum to %.2f; normalizing", total_ratio)
+        # Always renormalize; all-zero ratios become an equal split
+        ratios = ratios / total_ratio if total_ratio > 0 else np.full(3, 1 / 3)
+        # Move all three sliders with a single repaint
+        with self._suspend_updates():
+            for param, ratio in zip(ratio_params, ratios):
+                param.set_value(ratio)
+
+        train_ratio, test_ratio, val_ratio = ratios.tolist()
+        logger.info("Applying data split: Train=%.2f, Test=%.2f, Val=%.2f", train_ratio, test_ratio, val_ratio)
         self.data_split_requested.emit(train_ratio, test_ratio, val_ratio)
 
     def _apply_augmentation(self):
@@ -132,32 +233,65 @@ class DataLoaderPanel(BaseControlPanel):
             "time_shift": self.shift_aug_checkbox.get_value(),
             # Add more augmentation parameters here
         }
-        print(f"Applying data augmentation with params: {augmentation_params}")
-        self.data_augmentation_requested.emit(augmentation_params)
+        logger.info("Applying data augmentation with params: %s", augmentation_params)
+        if self.loaded_data is None:
+            self.data_augmentation_requested.emit(augmentation_params)
+            return
+        # Augment off the GUI thread; the request is emitted once the result is ready
+        worker = AugmentWorker(self.loaded_data, augmentation_params, self._rng)
+        worker.signals.finished.connect(self._on_augment_finished, Qt.ConnectionType.QueuedConnection)
+        worker.signals.error.connect(self._on_augment_error, Qt.ConnectionType.QueuedConnection)
+        self._augment_worker = worker
+        self.augment_button.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_augment_finished(self, num_augmented_samples: int):
+        worker = self._augment_worker
+        self._augment_worker = None
+        self._last_augmented = worker.augmented
+        self.augment_button.setEnabled(True)
+        self.data_augmentation_requested.emit({**worker.params, "num_augmented_samples": num_augmented_samples})
+
+    def _on_augment_error(self, message: str):
+        self._augment_worker = None
+        self.augment_button.setEnabled(True)
+        logger.error("Error augmenting data: %s", message)
+        self.status_message.emit("Augmentation failed")
 
     def _add_label(self):
         # In a real application, this would open a dialog to add/edit labels
-        new_label_text = f"Label {self.label_list_widget.count() + 1}"
-        item = QListWidgetItem(new_label_text)
-        self.label_list_widget.addItem(item)
-        current_labels = [self.label_list_widget.item(i).text() for i in range(self.label_list_widget.count())]
-        self.labels_updated.emit(current_labels)
-        print(f"Added label: {new_label_text}")
+        new_label_text = f"Label {len(self._labels) + 1}"
+        self._labels.append(new_label_text)
+        self.label_list_widget.addItem(QListWidgetItem(new_label_text))
+        self._labels_dirty = True
+        if not self._labels_timer.isActive():
+            self._labels_timer.start()
+        logger.debug("Added label: %s", new_label_text)
+
+    def _emit_labels(self):
+        if self._labels_dirty:
+            self._labels_dirty = False
+            self.labels_updated.emit(self._labels.copy())
 
     # These methods would be called by external components (e.g., worker threads)
     def on_data_loaded_success(self, file_path: str, num_samples: int):
-        print(f"Successfully loaded data from {file_path}. Samples: {num_samples}")
+        logger.info("Successfully loaded data from %s. Samples: %d", file_path, num_samples)
         # Update UI to reflect loaded data, e.g., enable other controls
         self.file_path_input.setText(file_path)
 
     def on_data_split_success(self, train_count: int, test_count: int, val_count: int):
-        print(f"Data split successful: Train={train_count}, Test={test_count}, Val={val_count}")
+        logger.info("Data split successful: Train=%d, Test=%d, Val=%d", train_count, test_count, val_count)
 
     def on_data_augmented_success(self, num_augmented_samples: int):
-        print(f"Data augmentation successful. Total augmented samples: {num_augmented_samples}")
+        logger.info("Data augmentation successful. Total augmented samples: %d", num_augmented_samples)
 
     def on_labels_loaded(self, labels: list):
-        self.label_list_widget.clear()
-        for label in labels:
-            self.label_list_widget.addItem(QListWidgetItem(label))
-        print(f"Labels loaded: {labels}")
\ No newline at end of file
+        self._labels = [str(label) for label in labels]
+        # Clear and refill the list with a single repaint
+        self.label_list_widget.setUpdatesEnabled(False)
+        try:
+            self.label_list_widget.clear()
+            self.label_list_widget.addItems(self._labels)
+        finally:
+            self.label_list_widget.setUpdatesEnabled(True)
+        logger.debug("Labels loaded: %s", labels)
\ No newline at end of file
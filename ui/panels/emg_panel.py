@@ -11,8 +11,20 @@ from .base_panel import (
 class EMGControlPanel(BaseControlPanel):
     """Control panel for EMG signal generation."""
     
+    PATTERNS = ("Isometric", "Dynamic", "Repetitive", "Complex")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Complex sequence state; its widgets are only built with the Complex pattern
+        self.movements = []
+        self.durations = []
+        self.intensities = []
+        
+        # Pattern controls are built the first time their pattern is selected
+        self._add_lazy_group("Isometric", self._build_isometric_controls)
+        self._add_lazy_group("Dynamic", self._build_dynamic_controls)
+        self._add_lazy_group("Repetitive", self._build_repetitive_controls)
+        self._add_lazy_group("Complex", self._build_complex_controls)
         self._setup_pattern_controls()
         
     def _init_ui(self):
@@ -21,22 +33,24 @@ class EMGControlPanel(BaseControlPanel):
         
         # Create pattern selection
         pattern_group = self.add_parameter_group("Pattern Selection")
-        self.pattern_selector = EnumParameter(
-            "pattern_type",
-            ["Isometric", "Dynamic", "Repetitive", "Complex"]
-        )
+        self.pattern_selector = EnumParameter("pattern_type", self.PATTERNS)
         self.add_parameter(pattern_group, "Type:", self.pattern_selector)
         
         # Create stacked widget for pattern-specific controls
         self.pattern_stack = QStackedWidget()
         self.layout.addWidget(self.pattern_stack)
         
-        # Connect pattern selector
-        self.pattern_selector.value_changed.connect(self._on_pattern_changed)
+        # Connect pattern selector; value_changed carries (name, value)
+        self.pattern_selector.value_changed.connect(
+            lambda _, pattern: self._on_pattern_changed(pattern)
+        )
         
     def _setup_pattern_controls(self):
-        """Set up controls for each pattern type."""
-        # Isometric controls
+        """Set up controls for the initial pattern; the others are built on first selection."""
+        self._on_pattern_changed(self.PATTERNS[0])
+        
+    def _build_isometric_controls(self) -> QWidget:
+        """Build the isometric pattern controls."""
         self.isometric_widget = QWidget()
         isometric_layout = QVBoxLayout(self.isometric_widget)
         
@@ -54,9 +68,10 @@ class EMGControlPanel(BaseControlPanel):
         self.add_parameter(iso_params, "Fatigue Rate:", self.fatigue)
         
         isometric_layout.addWidget(iso_params)
-        self.pattern_stack.addWidget(self.isometric_widget)
+        return self.isometric_widget
         
-        # Dynamic controls
+    def _build_dynamic_controls(self) -> QWidget:
+        """Build the dynamic pattern controls."""
         self.dynamic_widget = QWidget()
         dynamic_layout = QVBoxLayout(self.dynamic_widget)
         
@@ -77,9 +92,10 @@ class EMGControlPanel(BaseControlPanel):
         self.add_parameter(dyn_params, "Duration (s):", self.ramp_duration)
         
         dynamic_layout.addWidget(dyn_params)
-        self.pattern_stack.addWidget(self.dynamic_widget)
+        return self.dynamic_widget
         
-        # Repetitive controls
+    def _build_repetitive_controls(self) -> QWidget:
+        """Build the repetitive pattern controls."""
         self.repetitive_widget = QWidget()
         repetitive_layout = QVBoxLayout(self.repetitive_widget)
         
@@ -97,20 +113,18 @@ class EMGControlPanel(BaseControlPanel):
         self.add_parameter(rep_params, "Burst Intensity:", self.burst_intensity)
         
         repetitive_layout.addWidget(rep_params)
-        self.pattern_stack.addWidget(self.repetitive_widget)
+        return self.repetitive_widget
         
-        # Complex pattern controls
+    def _build_complex_controls(self) -> QWidget:
+        """Build the complex pattern controls."""
         self.complex_widget = QWidget()
         complex_layout = QVBoxLayout(self.complex_widget)
         
         # Movement sequence group
         sequence_group = self.add_parameter_group("Movement Sequence")
+        sequence_group.setObjectName("movement_sequence")
         sequence_group.setLayout(QVBoxLayout())
-        
-        # Add sequence controls
-        self.movements = []
-        self.durations = []
-        self.intensities = []
+        self._sequence_group = sequence_group
         
         # Add buttons for sequence management
         button_layout = QHBoxLayout()
@@ -130,12 +144,11 @@ class EMGControlPanel(BaseControlPanel):
         sequence_group.layout().addWidget(self.overlap)
         
         complex_layout.addWidget(sequence_group)
-        self.pattern_stack.addWidget(self.complex_widget)
+        return self.complex_widget
         
     def _on_pattern_changed(self, pattern: str):
         """Handle pattern type changes."""
-        index = ["Isometric", "Dynamic", "Repetitive", "Complex"].index(pattern)
-        self.pattern_stack.setCurrentIndex(index)
+        self._show_lazy_group(self.pattern_stack, pattern)
         
     def _add_movement(self):
         """Add a new movement to the complex sequence."""
@@ -159,10 +172,6 @@ class EMGControlPanel(BaseControlPanel):
         self.intensities.append(intensity)
         
         # Add to UI
-        sequence_group = self.pattern_stack.currentWidget().findChild(
-            QGroupBox, "Movement Sequence"
-        )
-        
         movement_group = QGroupBox(f"Movement {len(self.movements)}")
         movement_layout = QVBoxLayout(movement_group)
         
@@ -170,17 +179,13 @@ class EMGControlPanel(BaseControlPanel):
         self.add_parameter(movement_group, "Duration (s):", duration)
         self.add_parameter(movement_group, "Intensity:", intensity)
         
-        sequence_group.layout().insertWidget(
+        self._sequence_group.layout().insertWidget(
             len(self.movements) - 1,
             movement_group
         )
         
     def _clear_sequence(self):
         """Clear the complex movement sequence."""
-        sequence_group = self.pattern_stack.currentWidget().findChild(
-            QGroupBox, "Movement Sequence"
-        )
-        
         # Remove movement groups
         for movement in self.movements:
             movement.parent().deleteLater()
@@ -1,8 +1,8 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget,
-    QPushButton, QButtonGroup, QGroupBox
+    QPushButton, QButtonGroup, QGroupBox, QLabel
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from .base_panel import (
     BaseControlPanel, NumericParameter, EnumParameter,
     BoolParameter, SliderParameter
@@ -19,9 +19,22 @@ class EOGControlPanel(BaseControlPanel):
         'blink': 'Eye blink movement',
         'combined': 'Complex movement sequence'
     }
+    MOVEMENT_KEYS = tuple(MOVEMENTS)
+    
+    MOVEMENT_CHANGE_INTERVAL_MS = 50  # Coalescing window for movement switches
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Combined sequence state; its widgets are only built with the combined movement
+        self.movements = []
+        self.durations = []
+        
+        # Movement controls are built the first time their movement is selected
+        self._add_lazy_group('saccade', self._build_saccade_controls)
+        self._add_lazy_group('smooth_pursuit', self._build_pursuit_controls)
+        self._add_lazy_group('fixation', self._build_fixation_controls)
+        self._add_lazy_group('blink', self._build_blink_controls)
+        self._add_lazy_group('combined', self._build_combined_controls)
         self._setup_movement_controls()
         
     def _init_ui(self):
@@ -34,7 +47,7 @@ class EOGControlPanel(BaseControlPanel):
         # Movement type selection
         self.movement_type = EnumParameter(
             "movement_type",
-            list(self.MOVEMENTS.keys())
+            self.MOVEMENT_KEYS
         )
         self.add_parameter(basic_group, "Type:", self.movement_type)
         
@@ -43,16 +56,27 @@ class EOGControlPanel(BaseControlPanel):
         self.movement_desc.setWordWrap(True)
         basic_group.layout().addWidget(self.movement_desc)
         
-        # Connect movement change
-        self.movement_type.value_changed.connect(self._on_movement_changed)
+        # Connect movement change; value_changed carries (name, value).
+        # Rapid switches (e.g. scrolling the combo) apply only the last movement
+        self._pending_movement = None
+        self._movement_timer = QTimer(self)
+        self._movement_timer.setSingleShot(True)
+        self._movement_timer.setInterval(self.MOVEMENT_CHANGE_INTERVAL_MS)
+        self._movement_timer.timeout.connect(self._apply_pending_movement)
+        self.movement_type.value_changed.connect(
+            lambda _, movement: self._queue_movement_change(movement)
+        )
         
         # Create stacked widget for movement-specific controls
         self.movement_stack = QStackedWidget()
         self.layout.addWidget(self.movement_stack)
         
     def _setup_movement_controls(self):
-        """Set up controls for each movement type."""
-        # Saccade controls
+        """Set up controls for the initial movement; the others are built on first selection."""
+        self._show_lazy_group(self.movement_stack, 'saccade')
+        
+    def _build_saccade_controls(self) -> QWidget:
+        """Build the saccade controls."""
         self.saccade_widget = QWidget()
         saccade_layout = QVBoxLayout(self.saccade_widget)
         
@@ -73,9 +97,10 @@ class EOGControlPanel(BaseControlPanel):
         self.add_parameter(saccade_group, "Frequency (Hz):", self.frequency)
         
         saccade_layout.addWidget(saccade_group)
-        self.movement_stack.addWidget(self.saccade_widget)
+        return self.saccade_widget
         
-        # Smooth pursuit controls
+    def _build_pursuit_controls(self) -> QWidget:
+        """Build the smooth pursuit controls."""
         self.pursuit_widget = QWidget()
         pursuit_layout = QVBoxLayout(self.pursuit_widget)
         
@@ -96,9 +121,10 @@ class EOGControlPanel(BaseControlPanel):
         self.add_parameter(pursuit_group, "Pattern:", self.pattern)
         
         pursuit_layout.addWidget(pursuit_group)
-        self.movement_stack.addWidget(self.pursuit_widget)
+        return self.pursuit_widget
         
-        # Fixation controls
+    def _build_fixation_controls(self) -> QWidget:
+        """Build the fixation controls."""
         self.fixation_widget = QWidget()
         fixation_layout = QVBoxLayout(self.fixation_widget)
         
@@ -116,9 +142,10 @@ class EOGControlPanel(BaseControlPanel):
         self.add_parameter(fixation_group, "Microsaccade Freq (Hz):", self.micro_freq)
         
         fixation_layout.addWidget(fixation_group)
-        self.movement_stack.addWidget(self.fixation_widget)
+        return self.fixation_widget
         
-        # Blink controls
+    def _build_blink_controls(self) -> QWidget:
+        """Build the blink controls."""
         self.blink_widget = QWidget()
         blink_layout = QVBoxLayout(self.blink_widget)
         
@@ -136,19 +163,16 @@ class EOGControlPanel(BaseControlPanel):
         self.add_parameter(blink_group, "Duration (s):", self.blink_duration)
         
         blink_layout.addWidget(blink_group)
-        self.movement_stack.addWidget(self.blink_widget)
+        return self.blink_widget
         
-        # Combined movement controls
+    def _build_combined_controls(self) -> QWidget:
+        """Build the combined movement controls."""
         self.combined_widget = QWidget()
         combined_layout = QVBoxLayout(self.combined_widget)
         
         sequence_group = self.add_parameter_group("Movement Sequence")
         sequence_group.setLayout(QVBoxLayout())
         
-        # Add sequence controls
-        self.movements = []
-        self.durations = []
-        
         # Add buttons for sequence management
         button_layout = QHBoxLayout()
         
@@ -163,16 +187,27 @@ class EOGControlPanel(BaseControlPanel):
         sequence_group.layout().addLayout(button_layout)
         
         combined_layout.addWidget(sequence_group)
-        self.movement_stack.addWidget(self.combined_widget)
+        return self.combined_widget
         
+    def _queue_movement_change(self, movement: str):
+        """Record a movement switch and apply it once the burst settles."""
+        self._pending_movement = movement
+        if not self._movement_timer.isActive():
+            self._movement_timer.start()
+            
+    def _apply_pending_movement(self):
+        """Apply the last queued movement switch."""
+        movement, self._pending_movement = self._pending_movement, None
+        if movement is not None:
+            self._on_movement_changed(movement)
+            
     def _on_movement_changed(self, movement: str):
         """Handle movement type changes."""
         # Update description
         self.movement_desc.setText(self.MOVEMENTS[movement])
         
         # Update stack widget
-        index = list(self.MOVEMENTS.keys()).index(movement)
-        self.movement_stack.setCurrentIndex(index)
+        self._show_lazy_group(self.movement_stack, movement)
         
     def _add_movement(self):
         """Add a new movement to the sequence."""
@@ -114,14 +114,22 @@ class EvaluationPanel(BaseControlPanel):
             print(f"ROC Curve Data: {results['roc_curve']}")
             self.roc_curve_placeholder.setText(f"ROC Curve: {results['roc_curve']}")
 
-        # Update Cross-Validation Table
-        self.cv_table.setRowCount(0) # Clear existing rows
-        if 'cross_validation_folds' in results:
-            for row, fold_data in enumerate(results['cross_validation_folds']):
-                self.cv_table.insertRow(row)
+        # Update Cross-Validation Table; rows are sized once and filled with
+        # updates and header resizing off, so the table lays out a single time
+        folds = results.get('cross_validation_folds', [])
+        header = self.cv_table.horizontalHeader()
+        self.cv_table.setUpdatesEnabled(False)
+        self.cv_table.setSortingEnabled(False)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        try:
+            self.cv_table.setRowCount(len(folds))
+            for row, fold_data in enumerate(folds):
                 self.cv_table.setItem(row, 0, QTableWidgetItem(str(fold_data.get('fold', 'N/A'))))
                 self.cv_table.setItem(row, 1, QTableWidgetItem(f"{fold_data.get('accuracy', 'N/A'):.4f}"))
                 self.cv_table.setItem(row, 2, QTableWidgetItem(f"{fold_data.get('f1_score', 'N/A'):.4f}"))
+        finally:
+            header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+            self.cv_table.setUpdatesEnabled(True)
         
         print("Evaluation results updated.")
 
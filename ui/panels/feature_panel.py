@@ -2,12 +2,15 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
     QPushButton, QCheckBox, QProgressBar
 )
-from PyQt6.QtCore import pyqtSignal
-from typing import Dict, Any, List
+from PyQt6.QtCore import QThread, pyqtSignal, pyqtSlot
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
+import hashlib
 import numpy as np
 import pandas as pd
 
 from .base_panel import BaseControlPanel, NumericParameter, EnumParameter
+from ui.workers.feature_worker import FeatureWorker
 
 class BaseFeaturePanel(BaseControlPanel):
     """Base class for all feature extraction panels."""
@@ -17,11 +20,18 @@ class BaseFeaturePanel(BaseControlPanel):
     computation_progress = pyqtSignal(int)  # progress percentage
     computation_finished = pyqtSignal(pd.DataFrame)  # all features
     
+    CACHE_CAPACITY = 64  # Most computed results kept in cached_results
+    EXPORT_CHUNK_ROWS = 10000  # Rows formatted per chunk when exporting to CSV
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.features = {}  # Dictionary to store feature computation functions
         self.selected_features = set()  # Set of currently selected features
-        self.cached_results = {}  # Cache for computed features
+        # Computed features, least recently used first, keyed by _cache_key
+        self.cached_results = OrderedDict()
+        self.signal_data = None  # Signal the features are computed from
+        self._signal_hash = None  # Content hash of signal_data
+        self._pending_keys = {}  # Cache key of each feature the worker computes
         
     def _init_ui(self):
         """Initialize the base UI components."""
@@ -98,20 +108,129 @@ class BaseFeaturePanel(BaseControlPanel):
         else:
             self.selected_features.discard(name)
             
+    def _init_worker(self):
+        """Initialize the feature computation worker thread."""
+        self.worker_thread = QThread()
+        self.worker = None # Will be initialized when computation starts
+        
+        # Connect base progress bar
+        self.computation_progress.connect(self.progress_bar.setValue)
+        
     def compute_selected_features(self):
-        """Compute all selected features."""
+        """Compute all selected features using a worker thread."""
+        if self.signal_data is None:
+            print("No signal data available for feature computation.")
+            return
+            
         if not self.selected_features:
+            print("No features selected for computation.")
             return
             
+        # Reuse results computed for the same signal and parameter values
+        self._pending_keys = {}
+        for feature_name in self.selected_features:
+            key = self._cache_key(feature_name)
+            if key in self.cached_results:
+                self.cached_results.move_to_end(key)
+                self.feature_computed.emit(feature_name, self.cached_results[key])
+            else:
+                self._pending_keys[feature_name] = key
+                
+        if not self._pending_keys:
+            self.computation_finished.emit(self._selected_results())
+            return
+            
+        # Clean up previous worker if it exists
+        if self.worker:
+            self.worker_thread.started.disconnect(self.worker.compute)
+            self.worker_thread.quit()
+            self.worker_thread.wait()
+            self.worker.deleteLater()
+
+        self.worker = FeatureWorker(self.signal_data)
+        self.worker.moveToThread(self.worker_thread)
+        
+        # Worker signals cross threads, so they are queued to the panel's slots
+        self.worker.progress.connect(self.computation_progress)
+        self.worker.feature_computed.connect(self._on_feature_computed)
+        self.worker.error.connect(self._on_worker_error)
+        self.worker.finished.connect(self._on_computation_finished)
+        
+        # Add features without a cached result to the worker
+        for feature_name in self._pending_keys:
+            feature_config = self.features[feature_name]
+            params = self.get_feature_parameters(feature_name)
+            self.worker.add_feature(feature_name, feature_config['function'], params)
+            
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.compute_btn.setEnabled(False)
         
-        # TODO: Implement actual computation in worker thread
-        # For now, just simulate progress
-        self.progress_bar.setValue(100)
+        # Start computation in the worker thread
+        self.worker_thread.started.connect(self.worker.compute)
+        self.worker_thread.start()
+        
+    @pyqtSlot(str, np.ndarray)
+    def _on_feature_computed(self, feature_name: str, result: np.ndarray):
+        """Slot to handle individual feature computation results."""
+        self.cached_results[self._pending_keys[feature_name]] = result
+        while len(self.cached_results) > self.CACHE_CAPACITY:
+            self.cached_results.popitem(last=False)
+        self.feature_computed.emit(feature_name, result)
+        
+    @pyqtSlot(pd.DataFrame)
+    def _on_computation_finished(self, df: pd.DataFrame):
+        """Slot to handle all feature computation finished."""
         self.compute_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        # Emit the final DataFrame, including the features reused from the cache
+        self.computation_finished.emit(self._selected_results())
+        
+    @pyqtSlot(str, str)
+    def _on_worker_error(self, feature_name: str, error_message: str):
+        """Slot to handle errors from the worker."""
+        print(f"Error in worker for {feature_name}: {error_message}")
+        
+    def set_signal_data(self, data: np.ndarray):
+        """Set the signal data to compute features from."""
+        self.signal_data = data
+        # Cached results stay valid for their own signal, found by its hash
+        self._signal_hash = None if data is None else hashlib.blake2b(
+            np.ascontiguousarray(data).tobytes(), digest_size=16
+        ).digest()
+        
+    def _cache_key(self, feature_name: str) -> Tuple:
+        """Cache key of a feature for the current parameter values and signal."""
+        params = self.get_feature_parameters(feature_name)
+        return (feature_name, frozenset(params.items()), self._signal_hash)
+        
+    def _selected_results(self) -> pd.DataFrame:
+        """Cached results of the selected features, padded with NaN to a common length."""
+        results = {}
+        for feature_name in self.selected_features:
+            key = self._cache_key(feature_name)
+            if key in self.cached_results:
+                results[feature_name] = self.cached_results[key]
+        return self._results_frame(results)
+        
+    @staticmethod
+    def _results_frame(results: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """One float column per feature, padded with NaN to the longest result."""
+        n_rows = max((np.size(result) for result in results.values()), default=0)
+        values = np.full((n_rows, len(results)), np.nan)
+        for column, result in enumerate(results.values()):
+            result = np.ravel(result)
+            values[:len(result), column] = result
+        return pd.DataFrame(values, columns=list(results))
+        
+    def closeEvent(self, event):
+        """Ensure worker thread is terminated when panel is closed."""
+        if self.worker_thread.isRunning():
+            self.worker_thread.quit()
+            self.worker_thread.wait()
+        super().closeEvent(event)
         
     def clear_cache(self):
         """Clear the cached feature computation results."""
@@ -134,15 +253,17 @@ class BaseFeaturePanel(BaseControlPanel):
 
     def export_features(self):
         """Export computed features to a CSV file."""
-        if not self.cached_results:
+        # Only results for the current signal and parameters are exported,
+        # not those kept in the cache from earlier ones
+        df = self._selected_results()
+        if df.empty:
             print("No features computed to export.")
             return
 
         try:
-            df = pd.DataFrame(self.cached_results)
             # TODO: Implement a QFileDialog to let the user choose the save path
             file_path = "exported_features.csv" # Placeholder
-            df.to_csv(file_path, index=False)
+            df.to_csv(file_path, index=False, chunksize=self.EXPORT_CHUNK_ROWS)
             print(f"Features exported to {file_path}")
         except Exception as e:
             print(f"Error exporting features: {e}")
@@ -16,6 +16,8 @@ from ..visualization.base_view import BaseVisualizationView
 class MetricsTable(QTableWidget):
     """Table widget for displaying comparison metrics."""
     
+    BEST_COLOR = QColor(200, 255, 200)  # Light green
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self._init_ui()
@@ -32,22 +34,28 @@ class MetricsTable(QTableWidget):
         self.setRowCount(len(metrics))
         
         for i, (metric, values) in enumerate(metrics.items()):
-            # Metric name
-            self.setItem(i, 0, QTableWidgetItem(metric))
-            
             # Best value
             best = max(values) if metric in ['accuracy', 'f1_score'] else min(values)
-            best_item = QTableWidgetItem(f"{best:.4f}")
-            best_item.setBackground(QColor(200, 255, 200))  # Light green
-            self.setItem(i, 1, best_item)
             
-            # Average
-            avg = np.mean(values)
-            self.setItem(i, 2, QTableWidgetItem(f"{avg:.4f}"))
+            name_item, best_item, avg_item, std_item = self._row_items(i)
+            name_item.setText(metric)
+            best_item.setText(f"{best:.4f}")
+            avg_item.setText(f"{np.mean(values):.4f}")
+            std_item.setText(f"{np.std(values):.4f}")
             
-            # Standard deviation
-            std = np.std(values)
-            self.setItem(i, 3, QTableWidgetItem(f"{std:.4f}"))
+    def _row_items(self, row: int) -> List[QTableWidgetItem]:
+        """Get the items of a row, creating them the first time the row is used.
+        
+        Existing items are updated in place on later calls instead of being
+        replaced, which avoids reallocating every cell on each update.
+        """
+        items = [self.item(row, column) for column in range(self.columnCount())]
+        if items[0] is None:
+            items = [QTableWidgetItem() for _ in range(self.columnCount())]
+            items[1].setBackground(self.BEST_COLOR)
+            for column, item in enumerate(items):
+                self.setItem(row, column, item)
+        return items
 
 class ResultPlotView(BaseVisualizationView):
     """Custom plot view for result visualization."""
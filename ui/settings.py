@@ -0,0 +1,18 @@
+from PyQt6.QtCore import QSettings
+from typing import Optional
+
+SETTINGS_ORGANIZATION = 'BiosignalFramework'
+SETTINGS_APPLICATION = 'App'
+
+_settings: Optional[QSettings] = None
+
+def get_settings() -> QSettings:
+    """Get the application's shared QSettings instance.
+    
+    QSettings is reentrant but not thread-safe, so this instance is meant
+    for the GUI thread; background writers should create their own.
+    """
+    global _settings
+    if _settings is None:
+        _settings = QSettings(SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+    return _settings
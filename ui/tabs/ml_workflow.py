@@ -6,8 +6,10 @@ from ui.panels.evaluation_panel import EvaluationPanel
 from models.model_manager import ModelManager
 from ui.workers.training_worker import TrainingWorker
 from ui.workers.evaluation_worker import EvaluationWorker
+from ui.workers.data_loader_worker import DataSplitWorker, HDF5_SUFFIXES
 from PyQt6.QtCore import QThreadPool, pyqtSignal
 from typing import Any
+import os
 from ui.error_handling import ErrorHandler, ErrorSeverity, ErrorCategory
 from ui.feedback_manager import FeedbackManager
 import numpy as np
@@ -118,6 +120,14 @@ class MLWorkflowTab(QWidget):
 
     def _handle_data_split_requested(self, train_ratio: float, test_ratio: float, val_ratio: float):
         self.feedback_manager.show_status_message(f"Data split requested: Train={train_ratio}, Test={test_ratio}, Val={val_ratio}")
+        file_path = self.data_loader_panel.loaded_file_path
+        if file_path and os.path.splitext(file_path)[1].lower() in HDF5_SUFFIXES:
+            # Stream HDF5 files into split datasets on disk instead of slicing in memory
+            worker = DataSplitWorker(file_path, (train_ratio, test_ratio, val_ratio))
+            worker.signals.finished.connect(self._handle_data_split_finished)
+            worker.signals.error.connect(self._handle_data_split_error)
+            self.thread_pool.start(worker)
+            return
         # DataManager would handle the actual splitting
         if self.current_data is not None and self.current_labels is not None:
             total_samples = len(self.current_data)
@@ -134,6 +144,17 @@ class MLWorkflowTab(QWidget):
                 ErrorCategory.DATA_LOADING
             )
 
+    def _handle_data_split_finished(self, train_count: int, test_count: int, val_count: int):
+        self.data_loader_panel.on_data_split_success(train_count, test_count, val_count)
+        self.feedback_manager.show_status_message("Data split written successfully.")
+
+    def _handle_data_split_error(self, message: str):
+        self.error_handler.handle_error(
+            Exception(f"Data split failed: {message}"),
+            ErrorSeverity.ERROR,
+            ErrorCategory.DATA_LOADING
+        )
+
     def _handle_data_augmentation_requested(self, aug_params: dict):
         self.feedback_manager.show_status_message(f"Data augmentation requested with params: {aug_params}")
         # DataManager would handle the actual augmentation
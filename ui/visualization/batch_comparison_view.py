@@ -121,8 +121,13 @@ class BatchComparisonView(BaseVisualizationView):
             self.batch_buffers[batch_id] = deque(maxlen=self.buffer_size)
             self.last_update_time[batch_id] = time.time()
             
-        # Add new data to buffer
-        self.batch_buffers[batch_id].extend(new_data)
+        # Add new data to buffer. Only the newest maxlen points are kept, so
+        # older ones are not converted at all, and tolist() converts the rest
+        # in C instead of creating a NumPy scalar per point
+        buffer = self.batch_buffers[batch_id]
+        if len(new_data) > buffer.maxlen:
+            new_data = new_data[-buffer.maxlen:]
+        buffer.extend(new_data.tolist() if isinstance(new_data, np.ndarray) else new_data)
         
         # Update timestamp
         self.last_update_time[batch_id] = timestamp or time.time()
@@ -7,12 +7,14 @@ from .base_worker import (
 from .signal_worker import SignalWorker
 from .processing_worker import ProcessingWorker
 from .feature_worker import FeatureWorker
+from .settings_writer import SettingsWriter
 
 __all__ = [
     'BaseWorker',
     'SignalWorker',
     'ProcessingWorker',
     'FeatureWorker',
+    'SettingsWriter',
     'OperationError',
     'ConfigurationError',
     'ValidationError'
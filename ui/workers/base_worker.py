@@ -1,5 +1,5 @@
-from PyQt6.QtCore import QThread, pyqtSignal
-from typing import Dict, Any, Optional
+from PyQt6.QtCore import QThread, QThreadPool, QMutex, QMutexLocker, pyqtSignal
+from typing import Dict, Any, Optional, Tuple
 import traceback
 import uuid
 from datetime import datetime
@@ -14,6 +14,7 @@ class BaseWorker(QThread):
     error = pyqtSignal(str, str)  # operation_id, error_message
     completed = pyqtSignal(str, dict)  # operation_id, results
     cancelled = pyqtSignal(str)  # operation_id
+    metrics_ready = pyqtSignal(list, list, list)  # names, current text, average text
     
     def __init__(self, operation_type: str = "generic"):
         super().__init__()
@@ -23,6 +24,16 @@ class BaseWorker(QThread):
         self._results = {}
         self._error = None
         
+        # Progress kept for polling instead of emitted, see enable_progress_polling
+        self._poll_progress = False
+        self._progress_mutex = QMutex()
+        self._polled_progress: Optional[Tuple[int, str]] = None
+        self._pooled_running = False
+        
+        # Running totals behind the averages sent by report_metrics
+        self._metric_sums: Dict[str, float] = {}
+        self._metric_counts: Dict[str, int] = {}
+        
     def _generate_operation_id(self) -> str:
         """Generate unique operation ID."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -39,12 +50,32 @@ class BaseWorker(QThread):
         try:
             self.started.emit(self.operation_id)
             self._results = self._execute()
+            # Listeners of completed and error see the operation as no longer
+            # active, also when it runs on a pooled thread
+            self._pooled_running = False
             if not self.is_cancelled:
                 self.completed.emit(self.operation_id, self._results)
         except Exception as e:
+            self._pooled_running = False
             self._error = str(e)
             self.error.emit(self.operation_id, f"{str(e)}\n{traceback.format_exc()}")
             
+    def start_in_pool(self, pool: QThreadPool):
+        """Run the operation on a thread from pool instead of starting this thread."""
+        self._pooled_running = True
+        
+        def run():
+            try:
+                self.run()
+            finally:
+                self._pooled_running = False
+                
+        pool.start(run)
+        
+    def is_active(self) -> bool:
+        """Check if the operation is running, on this thread or a pooled one."""
+        return self._pooled_running or self.isRunning()
+        
     def _execute(self) -> Dict[str, Any]:
         """Execute worker operation. Must be implemented by subclasses."""
         raise NotImplementedError("Subclasses must implement _execute method")
@@ -54,10 +85,48 @@ class BaseWorker(QThread):
         self.is_cancelled = True
         self.cancelled.emit(self.operation_id)
         
+    def enable_progress_polling(self):
+        """Keep reported progress for take_progress() instead of emitting it.
+        
+        Must be called before the worker is started.
+        """
+        self._poll_progress = True
+        
     def report_progress(self, value: int, message: str = None):
         """Report operation progress."""
+        if self._poll_progress:
+            with QMutexLocker(self._progress_mutex):
+                # Keep the highest progress until the next poll
+                if self._polled_progress is None or value >= self._polled_progress[0]:
+                    self._polled_progress = (value, message or "")
+            return
         self.progress.emit(self.operation_id, value, message or "")
         
+    def take_progress(self) -> Optional[Tuple[int, str]]:
+        """Get and clear the (value, message) progress reported since the last call."""
+        with QMutexLocker(self._progress_mutex):
+            progress, self._polled_progress = self._polled_progress, None
+        return progress
+        
+    def report_metrics(self, metrics: Dict[str, float]):
+        """Report numeric metrics as display text, with running averages.
+        
+        Formatting happens on the worker's thread; metrics_ready carries the
+        strings as they are to be shown.
+        """
+        names = list(metrics)
+        cur_text = []
+        avg_text = []
+        for name in names:
+            value = float(metrics[name])
+            total = self._metric_sums.get(name, 0.0) + value
+            count = self._metric_counts.get(name, 0) + 1
+            self._metric_sums[name] = total
+            self._metric_counts[name] = count
+            cur_text.append(f"{value:.4f}")
+            avg_text.append(f"{total / count:.4f}")
+        self.metrics_ready.emit(names, cur_text, avg_text)
+        
     def report_status(self, message: str):
         """Report operation status."""
         self.status.emit(self.operation_id, message)
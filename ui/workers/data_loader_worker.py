@@ -0,0 +1,335 @@
+from PyQt6.QtCore import QObject, pyqtSignal, QRunnable, QMutex, QMutexLocker
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+import logging
+import os
+import numpy as np
+import pandas as pd
+import h5py
+
+logger = logging.getLogger(__name__)
+
+HDF5_SUFFIXES = ('.h5', '.hdf5')
+LOAD_CACHE_MAX_ENTRIES = 4
+LOAD_CACHE_MAX_BYTES = 2 * 1024 ** 3
+SPLIT_CHUNK_SIZE = 8192 # Rows per chunk for split copies and transcoded CSV caches
+# Chunk cache for reading; h5py's 1 MB default re-reads chunks of wide recordings
+HDF5_READ_OPTIONS = {'rdcc_nbytes': 256 * 1024 ** 2, 'rdcc_nslots': 100003, 'rdcc_w0': 0.75}
+SPLIT_NAMES = ('train', 'test', 'val')
+NOISE_STD_FRACTION = 0.05 # Noise sigma relative to each channel's standard deviation
+MAX_SHIFT_FRACTION = 0.1 # Largest time shift as a fraction of the signal length
+
+def _read_hdf5(file_path: str, tree: Optional[Dict[str, str]] = None) -> np.ndarray:
+    """
+    Read the 'data' dataset of an HDF5 file, or its first dataset if there is none,
+    in a single contiguous read.
+
+    If `tree` is given, it is filled with the type name ('Group' or 'Dataset')
+    of every object in the file, keyed on its path, while the file is open.
+    """
+    with h5py.File(file_path, 'r', **HDF5_READ_OPTIONS) as f:
+        if tree is not None:
+            f.visititems(lambda name, obj: tree.__setitem__(name, type(obj).__name__))
+        try:
+            dataset = f['data']
+        except KeyError:
+            dataset = next(item for item in f.values() if isinstance(item, h5py.Dataset))
+        return dataset[()]
+
+def _row_chunks(shape: Tuple[int, ...]) -> Optional[Tuple[int, ...]]:
+    """
+    Chunk shape holding up to SPLIT_CHUNK_SIZE whole rows, or None for an empty dataset.
+    """
+    if not shape or not shape[0]:
+        return None
+    return (min(SPLIT_CHUNK_SIZE, shape[0]),) + tuple(shape[1:])
+
+def _write_hdf5_cache(cache_path: str, data: np.ndarray):
+    """
+    Write data as the 'data' dataset of an HDF5 file, replacing it atomically.
+    """
+    tmp_path = f"{cache_path}.tmp"
+    with h5py.File(tmp_path, 'w') as f:
+        f.create_dataset('data', data=data, chunks=_row_chunks(data.shape))
+    os.replace(tmp_path, cache_path)
+
+def load_signal_file(file_path: str, tree: Optional[Dict[str, str]] = None) -> Tuple[np.ndarray, bool]:
+    """
+    Read the signal array of an HDF5 or CSV data file.
+
+    HDF5 files are read directly, filling `tree` (if given) with their object
+    layout. CSV files are parsed once, one row per sample, and transcoded to
+    an HDF5 copy next to them (<file>.h5) that is read instead while it is
+    newer than the CSV file.
+
+    Returns:
+        The signal array, and whether a cached HDF5 copy was used
+    """
+    if Path(file_path).suffix.lower() in HDF5_SUFFIXES:
+        return _read_hdf5(file_path, tree), False
+
+    cache_path = f"{file_path}.h5"
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+        return _read_hdf5(cache_path), True
+
+    data = pd.read_csv(file_path).to_numpy()
+    try:
+        _write_hdf5_cache(cache_path, data)
+    except Exception as e:
+        # Non-numeric columns or a read-only directory; the CSV is still loaded
+        logger.warning("Could not cache %s as HDF5: %s", file_path, e)
+    return data, False
+
+def _copy_rows(src: h5py.Dataset, dst: h5py.Dataset, indices: np.ndarray, chunk_size: int):
+    """
+    Copy src[indices] into dst one chunk of rows at a time.
+
+    h5py needs increasing indices, so each chunk is read sorted and put
+    back in permutation order before it is written.
+    """
+    for start in range(0, len(indices), chunk_size):
+        chunk = indices[start:start + chunk_size]
+        order = np.argsort(chunk)
+        rows = src[chunk[order]]
+        dst[start:start + len(chunk)] = rows[np.argsort(order)]
+
+def split_hdf5_file(file_path: str, output_path: str, ratios: Sequence[float],
+                    seed: Optional[int] = None, chunk_size: int = SPLIT_CHUNK_SIZE) -> Tuple[int, int, int]:
+    """
+    Randomly split the samples of an HDF5 data file into train, test and
+    validation groups of a new HDF5 file, without loading the data into memory.
+
+    The 'data' dataset (or the first dataset) is copied to <split>/data, and a
+    'labels' dataset of the same length to <split>/labels. At most one chunk
+    of rows is held in memory at a time. Validation gets whatever samples
+    remain after the train and test counts are rounded down.
+
+    Returns:
+        Number of train, test and validation samples
+    """
+    with h5py.File(file_path, 'r', **HDF5_READ_OPTIONS) as src_file:
+        if 'data' in src_file:
+            src = src_file['data']
+        else:
+            src = next(item for item in src_file.values() if isinstance(item, h5py.Dataset))
+        n_samples = src.shape[0]
+        labels = src_file.get('labels')
+        if not isinstance(labels, h5py.Dataset) or labels.shape[:1] != (n_samples,):
+            labels = None
+
+        train_count = int(n_samples * ratios[0])
+        test_count = int(n_samples * ratios[1])
+        counts = (train_count, test_count, n_samples - train_count - test_count)
+        perm = np.random.default_rng(seed).permutation(n_samples)
+
+        tmp_path = f"{output_path}.tmp"
+        with h5py.File(tmp_path, 'w') as dst_file:
+            start = 0
+            for name, count in zip(SPLIT_NAMES, counts):
+                indices = perm[start:start + count]
+                start += count
+                group = dst_file.create_group(name)
+                for key, dataset in (('data', src), ('labels', labels)):
+                    if dataset is None:
+                        continue
+                    dst = group.create_dataset(
+                        key, shape=(count,) + dataset.shape[1:], dtype=dataset.dtype,
+                        chunks=(min(chunk_size, count),) + dataset.shape[1:] if count else None
+                    )
+                    _copy_rows(dataset, dst, indices, chunk_size)
+        os.replace(tmp_path, output_path)
+    return counts
+
+def augment_signal(data: np.ndarray, add_noise: bool, time_shift: bool,
+                   rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Return a float32 copy of a (samples, channels) signal with the requested augmentations.
+
+    Noise is Gaussian with a per-channel sigma of NOISE_STD_FRACTION times the
+    channel's standard deviation; the time shift rolls every channel along the
+    sample axis by up to MAX_SHIFT_FRACTION of its length in either direction.
+
+    The shift is applied while copying into the float32 output and the noise
+    is added in place, so only one extra array (the noise) is allocated.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    data = np.asarray(data)
+    out = np.empty(data.shape, dtype=np.float32)
+    shift = 0
+    if time_shift and len(data):
+        max_shift = int(len(data) * MAX_SHIFT_FRACTION)
+        shift = int(rng.integers(-max_shift, max_shift + 1)) % len(data)
+    if shift:
+        # Same result as np.roll(data, shift, axis=0), cast as it is copied
+        out[shift:] = data[:-shift]
+        out[:shift] = data[-shift:]
+    else:
+        out[...] = data
+    if add_noise and out.size:
+        noise = rng.standard_normal(out.shape, dtype=np.float32)
+        noise *= out.std(axis=0) * NOISE_STD_FRACTION
+        out += noise
+    return out
+
+class LoadCache:
+    """
+    Least-recently-used cache of loaded signal arrays, keyed on (path, mtime).
+
+    Entries are evicted once there are more than `max_entries` of them or their
+    arrays hold more than `max_bytes` together. Cached arrays are made read-only
+    since every later load of the same file shares them.
+    """
+    def __init__(self, max_entries: int = LOAD_CACHE_MAX_ENTRIES, max_bytes: int = LOAD_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, float], Tuple[np.ndarray, bool, Dict[str, str]]]" = OrderedDict()
+        self._nbytes = 0
+        self._mutex = QMutex()
+
+    def get(self, key: Tuple[str, float]) -> Optional[Tuple[np.ndarray, bool, Dict[str, str]]]:
+        with QMutexLocker(self._mutex):
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Tuple[str, float], data: np.ndarray, used_cache: bool, tree: Dict[str, str]):
+        if data.nbytes > self.max_bytes:
+            return
+        data.flags.writeable = False
+        with QMutexLocker(self._mutex):
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[0].nbytes
+            self._entries[key] = (data, used_cache, tree)
+            self._nbytes += data.nbytes
+            while len(self._entries) > self.max_entries or self._nbytes > self.max_bytes:
+                _, (evicted, _, _) = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+    def clear(self):
+        with QMutexLocker(self._mutex):
+            self._entries.clear()
+            self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+load_cache = LoadCache()
+
+class DataLoaderWorkerSignals(QObject):
+    """
+    Defines the signals available from a running data loader worker thread.
+    """
+    progress = pyqtSignal(int) # percentage
+    finished = pyqtSignal(str, int) # file_path, num_samples
+    error = pyqtSignal(str)
+
+class DataLoaderWorker(QRunnable):
+    """
+    Worker for reading a data file in a separate thread.
+
+    The loaded array is kept in `data` once `finished` is emitted.
+    `used_cache` tells whether it came from a cached HDF5 copy of a CSV file,
+    and `from_memory` whether it was served by `load_cache` without reading
+    the file at all. `tree` maps every object path of an HDF5 file to its
+    type name.
+    """
+    def __init__(self, file_path: str, cache: LoadCache = load_cache):
+        super().__init__()
+        self.signals = DataLoaderWorkerSignals()
+        self.file_path = file_path
+        self.cache = cache
+        self.data = None
+        self.used_cache = False
+        self.from_memory = False
+        self.tree: Dict[str, str] = {}
+
+    def run(self):
+        """
+        Read the data file and report the number of samples.
+        """
+        try:
+            self.signals.progress.emit(0)
+            key = (os.path.abspath(self.file_path), os.path.getmtime(self.file_path))
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.data, self.used_cache, self.tree = entry
+                self.from_memory = True
+            else:
+                self.data, self.used_cache = load_signal_file(self.file_path, self.tree)
+                self.cache.put(key, self.data, self.used_cache, self.tree)
+            self.signals.progress.emit(100)
+            self.signals.finished.emit(self.file_path, len(self.data))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            logger.exception("DataLoaderWorker error")
+
+class DataSplitWorkerSignals(QObject):
+    """
+    Defines the signals available from a running data split worker thread.
+    """
+    finished = pyqtSignal(int, int, int) # train_count, test_count, val_count
+    error = pyqtSignal(str)
+
+class DataSplitWorker(QRunnable):
+    """
+    Worker for splitting an HDF5 data file into train, test and validation
+    sets in a separate thread. The split is written to `output_path`.
+    """
+    def __init__(self, file_path: str, ratios: Sequence[float], seed: Optional[int] = None):
+        super().__init__()
+        self.signals = DataSplitWorkerSignals()
+        self.file_path = file_path
+        self.ratios = tuple(ratios)
+        self.seed = seed
+        self.output_path = f"{os.path.splitext(file_path)[0]}_split.h5"
+
+    def run(self):
+        """
+        Write the split file and report the size of each set.
+        """
+        try:
+            counts = split_hdf5_file(self.file_path, self.output_path, self.ratios, self.seed)
+            self.signals.finished.emit(*counts)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            logger.exception("DataSplitWorker error")
+
+class AugmentWorkerSignals(QObject):
+    """
+    Defines the signals available from a running augmentation worker thread.
+    """
+    finished = pyqtSignal(int) # num_augmented_samples
+    error = pyqtSignal(str)
+
+class AugmentWorker(QRunnable):
+    """
+    Worker for augmenting a loaded signal array in a separate thread.
+    The result is kept in `augmented` once `finished` is emitted.
+    """
+    def __init__(self, data: np.ndarray, params: dict, rng: Optional[np.random.Generator] = None):
+        super().__init__()
+        self.signals = AugmentWorkerSignals()
+        self.data = data
+        self.params = params
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.augmented = None
+
+    def run(self):
+        """
+        Apply the augmentations and report the number of augmented samples.
+        """
+        try:
+            self.augmented = augment_signal(
+                self.data,
+                add_noise=bool(self.params.get("add_noise")),
+                time_shift=bool(self.params.get("time_shift")),
+                rng=self.rng
+            )
+            self.signals.finished.emit(len(self.augmented))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            logger.exception("AugmentWorker error")
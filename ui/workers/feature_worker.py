@@ -27,14 +27,16 @@ class FeatureWorker(QObject):
         }
         
     def compute(self):
-        """Compute all registered features."""
+        """Compute all registered features.
+        
+        Runs in the worker thread; every signal is delivered to the panel through
+        a queued connection, so `finished` is always emitted to release it.
+        """
         total_features = len(self.features_to_compute)
-        if total_features == 0:
-            return
-            
         for i, (name, config) in enumerate(self.features_to_compute.items()):
             try:
-                result = config['function'](self.signal_data, **config['parameters'])
+                # Scalar features are sent as 1-element arrays to match the signal type
+                result = np.atleast_1d(config['function'](self.signal_data, **config['parameters']))
                 self.results[name] = result
                 self.feature_computed.emit(name, result)
             except Exception as e:
@@ -46,10 +48,9 @@ class FeatureWorker(QObject):
             progress = int(((i + 1) / total_features) * 100)
             self.progress.emit(progress)
             
-        # Emit final results
-        if self.results:
-            df = pd.DataFrame(self.results)
-            self.finished.emit(df)
+        # Emit final results; features of different lengths are padded with NaN
+        df = pd.DataFrame({name: pd.Series(result) for name, result in self.results.items()})
+        self.finished.emit(df)
             
     def clear(self):
         """Clear all registered features and results."""
@@ -0,0 +1,32 @@
+from PyQt6.QtCore import QObject, QSettings, pyqtSlot
+from typing import Any, Optional
+
+class SettingsWriter(QObject):
+    """Persists QSettings values from a dedicated thread.
+    
+    Move the writer to a QThread and connect queued signals to ``write`` and
+    ``flush`` so backend writes (registry, plist, ini) never block the GUI.
+    """
+    
+    def __init__(self, organization: str, application: str):
+        super().__init__()
+        self.organization = organization
+        self.application = application
+        self._settings: Optional[QSettings] = None
+        
+    def _get_settings(self) -> QSettings:
+        """Create the QSettings instance on first use, i.e. on the writer thread."""
+        if self._settings is None:
+            self._settings = QSettings(self.organization, self.application)
+        return self._settings
+        
+    @pyqtSlot(str, object)
+    def write(self, key: str, value: Any):
+        """Write a single setting."""
+        self._get_settings().setValue(key, value)
+        
+    @pyqtSlot()
+    def flush(self):
+        """Sync all queued writes to the backend and stop the writer thread."""
+        self._get_settings().sync()
+        self.thread().quit()